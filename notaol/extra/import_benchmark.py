@@ -0,0 +1,92 @@
+'''Measure import times with ``python -X importtime``.
+
+Each module is imported in a new interpreter several times. The median
+cumulative time of the module and the slowest modules it imported are
+printed. Use ``--json`` to save the results for comparison between
+versions.
+
+Usage: python -m notaol.extra.import_benchmark [--json] [MODULE ...]
+'''
+import argparse
+import collections
+import json
+import statistics
+import subprocess
+import sys
+
+
+DEFAULT_MODULES = (
+    'notaol.p3.client',
+    'notaol.p3.data',
+    'notaol.fdo.serialize',
+    'notaol.fdo.atomdef',
+    'notaol.fdo.token',
+)
+
+
+def measure(module_name):
+    '''Return a dict of module name to cumulative microseconds.'''
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import {}'.format(module_name)],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        self_time, cumulative_time, name = line[12:].split('|')
+        times[name.strip()] = int(cumulative_time)
+
+    return times
+
+
+def benchmark(module_name, runs=7):
+    '''Return the median cumulative time of each imported module.'''
+    samples = collections.defaultdict(list)
+
+    # The first run writes bytecode caches and is not counted.
+    measure(module_name)
+
+    for dummy in range(runs):
+        for name, value in measure(module_name).items():
+            samples[name].append(value)
+
+    return dict((name, statistics.median(values))
+                for name, values in samples.items())
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    arg_parser.add_argument('--runs', type=int, default=7)
+    arg_parser.add_argument('--top', type=int, default=5)
+    arg_parser.add_argument('--json', action='store_true')
+    args = arg_parser.parse_args()
+
+    results = {}
+
+    for module_name in args.modules:
+        times = benchmark(module_name, args.runs)
+        results[module_name] = times.get(module_name)
+
+        if args.json:
+            continue
+
+        print('{}: {:.1f} ms'.format(module_name, times[module_name] / 1000))
+
+        slowest = sorted(
+            (name for name in times
+             if name.startswith('notaol.') and name != module_name),
+            key=times.get, reverse=True)
+
+        for name in slowest[:args.top]:
+            print('    {}: {:.1f} ms'.format(name, times[name] / 1000))
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
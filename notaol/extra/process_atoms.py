@@ -1,17 +1,22 @@
 '''Process penggy source code for atoms.'''
+import argparse
 import glob
 import re
 
+from notaol.fdo.table import write_atom_table
 
-def main():
-    print('import enum')
-    print()
-    print()
-    print('class Atom(enum.Enum):')
+
+def read_atoms():
+    '''Yield tuples of filename, protocol name, protocol ID, atom name and
+    atom ID.
+
+    The atom name and ID are None for protocol definitions.
+    '''
     for filename in sorted(glob.glob('include/fdo/atoms/*.h')):
         with open(filename) as in_file:
 
             pid = None
+            protocol_name = None
 
             for line in in_file:
                 words = line.split()
@@ -24,28 +29,20 @@ def main():
 
                 if words[1].endswith('PID'):
                     pid = words[2]
-                    name = words[1].replace('_PID', '')
-                    print('    {} = {}'.format(name, pid))
+                    protocol_name = words[1].replace('_PID', '')
+                    yield (filename, protocol_name, pid, None, None)
                     continue
 
                 name = words[1].lower()
                 value = words[2]
-                print('    {} = ({}, {})'.format(name, pid, value))
-
-            print()
+                yield (filename, protocol_name, pid, name, value)
 
-    print('----')
-
-    print('class AtomDataType(enum.Enum):')
 
+def read_data_types():
+    '''Yield tuples of atom name and data type name.'''
     for filename in sorted(glob.glob('src/fdo/atoms/*.c')):
         with open(filename) as in_file:
-
-            pid = None
-
             for line in in_file:
-                words = line.split()
-
                 match = re.search(r'(\w{2,}) *, *(\w+)}', line)
 
                 if not match:
@@ -53,7 +50,66 @@ def main():
 
                 name = match.group(1).lower()
                 value = match.group(2).replace('},', '')
-                print('    {} = DataType.{}'.format(name, value))
+                yield (name, value)
+
+
+def print_source():
+    print('import enum')
+    print()
+    print()
+    print('class Atom(enum.Enum):')
+
+    current_filename = None
+
+    for filename, name, pid, atom_name, value in read_atoms():
+        if filename != current_filename:
+            if current_filename is not None:
+                print()
+
+            current_filename = filename
+
+        if atom_name is None:
+            print('    {} = {}'.format(name, pid))
+        else:
+            print('    {} = ({}, {})'.format(atom_name, pid, value))
+
+    print()
+
+    print('----')
+
+    print('class AtomDataType(enum.Enum):')
+
+    for name, value in read_data_types():
+        print('    {} = DataType.{}'.format(name, value))
+
+
+def write_binary(table_filename):
+    data_types = dict(read_data_types())
+    rows = []
+
+    for filename, name, pid, atom_name, value in read_atoms():
+        if atom_name is None:
+            continue
+
+        rows.append((int(pid, 0), int(value, 0), atom_name,
+                     data_types.get(atom_name, 'na')))
+
+    with open(table_filename, 'wb') as out_file:
+        write_atom_table(out_file, rows)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument(
+        '--binary', metavar='FILENAME',
+        help='write an atom table for notaol.fdo.table.AtomTable')
+    args = arg_parser.parse_args()
+
+    if args.binary:
+        write_binary(args.binary)
+    else:
+        print_source()
+
 
 if __name__ == '__main__':
     main()
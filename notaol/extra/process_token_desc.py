@@ -0,0 +1,25 @@
+'''Generate the compact token description table from tokenmeta.py.
+
+Usage: python -m notaol.extra.process_token_desc > notaol/fdo/tokendesc.py
+'''
+from notaol.fdo.tokenmeta import TOKEN_METADATA
+
+
+def main():
+    # Later rows replace earlier ones like dict() does.
+    descriptions = dict(
+        (meta.token, meta.description) for meta in TOKEN_METADATA)
+
+    print('# This file was automatically generated by process_token_desc.py.')
+    print('# Do not edit!')
+    print()
+    print('TOKEN_DESCRIPTIONS = {')
+
+    for token, description in descriptions.items():
+        print('    {!r}: {!r},'.format(token, description))
+
+    print('}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 '''Process the token HTML and TXT files.'''
+import argparse
 import re
 import string
 
@@ -7,6 +8,8 @@ import collections
 import pprint
 import textwrap
 
+from notaol.fdo.table import write_token_table
+
 
 HTML_DB_FILENAMES = tuple(
     ['token_!.html', 'token_0-9.html'] +
@@ -26,6 +29,22 @@ def new_token_metadata(token, description=None, category=None, flags=None,
 
 
 def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument(
+        '--binary', metavar='FILENAME',
+        help='write a token table for notaol.fdo.table.TokenTable')
+    args = arg_parser.parse_args()
+
+    rows = read_rows()
+
+    if args.binary:
+        with open(args.binary, 'wb') as out_file:
+            write_token_table(out_file, rows)
+    else:
+        print_source(rows)
+
+
+def print_source(rows):
     print(textwrap.dedent('''\
     # This file was automatically generated by process_tokens.py.
     # Do not edit!
@@ -38,6 +57,15 @@ def main():
     )
     '''))
 
+    print('TOKEN_METADATA = [')
+
+    for row in rows:
+        print('TokenMetadata{},'.format(pprint.pformat(tuple(row))))
+
+    print(']')
+
+
+def read_rows():
     rows = [
         new_token_metadata('AA', 'Normal chat message'),
         new_token_metadata('AB', 'Chat message with name'),
@@ -92,12 +120,7 @@ def main():
         for row in read_token_html(filename):
             rows.append(row)
 
-    print('TOKEN_METADATA = [')
-
-    for row in rows:
-        print('TokenMetadata{},'.format(pprint.pformat(tuple(row))))
-
-    print(']')
+    return rows
 
 
 def read_1998_txt():
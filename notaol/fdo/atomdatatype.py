@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from fdo.datatype import DataType
+from notaol.fdo.datatype import DataType
 
 
 class AtomDataType:
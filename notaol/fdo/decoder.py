@@ -0,0 +1,79 @@
+'''Incremental atom stream decoding.'''
+from notaol.fdo import serialize
+
+
+MAX_ATOM_SIZE = 8 + 3 + 255
+'''Upper bound of an encoded atom including extended prefixes.'''
+
+
+class AtomDecoder(object):
+    '''Decodes an atom stream that arrives in several chunks.
+
+    Atoms are decoded in place from each chunk given to :meth:`feed`.
+    Their arguments are memoryview slices of the chunk, so chunks should
+    not be modified afterwards. Only an atom split across chunks is
+    copied, and it is held until the next chunk completes it.
+
+    Args:
+        last_protocol_id (int): The protocol ID that compressed atoms at the
+            start of the stream refer to.
+
+    Attributes:
+        last_protocol_id (int): Protocol ID of the last decoded atom.
+        offset (int): Number of bytes decoded so far.
+    '''
+    __slots__ = ('last_protocol_id', 'offset', '_pending')
+
+    def __init__(self, last_protocol_id=0):
+        self.last_protocol_id = last_protocol_id
+        self.offset = 0
+        self._pending = b''
+
+    @property
+    def pending(self):
+        '''Number of bytes held from an incomplete atom.'''
+        return len(self._pending)
+
+    def feed(self, data):
+        '''Decode the atoms completed by a chunk.
+
+        The generator must be exhausted before the next call.
+
+        Yields:
+            tuple: Atoms in the format of :func:`serialize.unserialize`.
+        '''
+        view = memoryview(data)
+        index = 0
+
+        if self._pending:
+            pending_length = len(self._pending)
+            joined = memoryview(self._pending + view[:MAX_ATOM_SIZE])
+            result = serialize.decode_atom(joined, 0, self.last_protocol_id)
+
+            if result is None:
+                self._pending = bytes(joined)
+                return
+
+            atom, end = result
+            index = end - pending_length
+            self._pending = b''
+            self.offset += end
+            self.last_protocol_id = atom[0]
+
+            yield atom
+
+        length = len(view)
+
+        while index < length:
+            result = serialize.decode_atom(view, index, self.last_protocol_id)
+
+            if result is None:
+                self._pending = bytes(view[index:])
+                return
+
+            atom, end = result
+            self.offset += end - index
+            index = end
+            self.last_protocol_id = atom[0]
+
+            yield atom
@@ -0,0 +1,61 @@
+import unittest
+
+from notaol.fdo.atomdef import Atom
+from notaol.fdo.decoder import AtomDecoder
+from notaol.fdo.serialize import encode_atoms, unserialize
+
+
+def new_stream_data():
+    buffer = bytearray()
+    encode_atoms(buffer, [
+        (Atom.uni_start_stream,),
+        (Atom.de_data, 'a' * 200),
+        (Atom.man_set_context_relative, 300),
+        (Atom.man_set_context_relative, 1),
+        (Atom.adp_eid, 2),
+        (Atom.adp_route_tkn,),
+        (Atom.uni_end_stream,),
+    ], compress=True)
+    return bytes(buffer)
+
+
+class TestAtomDecoder(unittest.TestCase):
+    def test_feed_whole(self):
+        data = new_stream_data()
+        decoder = AtomDecoder()
+        atoms = list(decoder.feed(data))
+
+        self.assertEqual(list(unserialize(0, data)), atoms)
+        self.assertIsInstance(atoms[1][4], memoryview)
+        self.assertEqual(0, decoder.pending)
+        self.assertEqual(len(data), decoder.offset)
+
+    def test_feed_chunks(self):
+        data = new_stream_data()
+        expected = list(unserialize(0, data))
+
+        for chunk_size in (1, 2, 3, 7, 100):
+            decoder = AtomDecoder()
+            atoms = []
+
+            for index in range(0, len(data), chunk_size):
+                atoms.extend(decoder.feed(data[index:index + chunk_size]))
+
+            self.assertEqual(expected, atoms)
+            self.assertEqual(0, decoder.pending)
+            self.assertEqual(len(data), decoder.offset)
+            self.assertEqual(Atom.uni_end_stream.value[0],
+                             decoder.last_protocol_id)
+
+    def test_pending(self):
+        decoder = AtomDecoder()
+
+        self.assertEqual([], list(decoder.feed(b'\x03\x01\x04as')))
+        self.assertEqual(5, decoder.pending)
+
+        atoms = list(decoder.feed(b'df\x00\x02'))
+
+        self.assertEqual(1, len(atoms))
+        self.assertEqual(b'asdf', atoms[0][4])
+        self.assertEqual(2, decoder.pending)
+        self.assertEqual(7, decoder.offset)
@@ -0,0 +1,221 @@
+'''Large atom reassembly and splitting.
+
+An argument longer than 255 bytes does not fit a length byte, so it is
+sent as a ``uni_start_large_atom`` atom, any number of
+``uni_large_atom_segment`` atoms holding the data, and a
+``uni_end_large_atom`` atom holding the last piece.
+
+The argument of the start atom is taken to be the protocol ID and atom ID
+of the large atom followed by the total argument size as a big-endian
+integer. The encoder writes the size as 4 bytes.
+'''
+import logging
+import time
+
+from notaol.fdo import serialize
+from notaol.fdo.atomdef import Atom
+
+
+_logger = logging.getLogger(__name__)
+
+SEGMENT_SIZE = 255
+'''Largest argument of a segment atom.'''
+
+_START_ATOM = Atom.uni_start_large_atom.value
+_SEGMENT_ATOM = Atom.uni_large_atom_segment.value
+_END_ATOM = Atom.uni_end_large_atom.value
+
+
+class LargeAtomError(ValueError):
+    '''A large atom transfer is malformed or over the size limit.'''
+
+
+class LargeAtomAssembler(object):
+    '''Joins the segments of large atoms into single atoms.
+
+    When the start atom arrives, a buffer of the declared size is allocated
+    and the segments are copied into it. The end atom completes a transfer.
+    The assembler then produces one atom, whose argument is a memoryview of
+    the buffer.
+
+    A transfer that gets no atoms for `timeout` seconds is abandoned. This
+    is checked when the next atom arrives, or when :meth:`expire` is
+    called.
+
+    Args:
+        max_size (int): Largest declared size accepted.
+        timeout (float): Seconds before an unfinished transfer is dropped.
+        clock: Function returning the current time in seconds.
+
+    Attributes:
+        completed (int): Large atoms assembled.
+        abandoned (int): Transfers dropped for timing out, being
+            replaced by a new start atom or ending short of their size.
+    '''
+    def __init__(self, max_size=16 * 1024 * 1024, timeout=60.0,
+                 clock=time.monotonic):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.completed = 0
+        self.abandoned = 0
+        self._clock = clock
+        self._atom_def = None
+        self._buffer = None
+        self._position = 0
+        self._last_time = None
+
+    @property
+    def in_progress(self):
+        '''Whether a transfer is waiting for more segments.'''
+        return self._buffer is not None
+
+    def expire(self):
+        '''Drop the transfer if it timed out.'''
+        if self._buffer is not None and \
+                self._clock() - self._last_time >= self.timeout:
+            _logger.warning('Large atom %s timed out after %d of %d bytes.',
+                            self._atom_def, self._position,
+                            len(self._buffer))
+            self._abandon()
+
+    def _abandon(self):
+        self.abandoned += 1
+        self._reset()
+
+    def _reset(self):
+        self._atom_def = None
+        self._buffer = None
+        self._position = 0
+        self._last_time = None
+
+    def _start(self, arg):
+        if len(arg) < 3:
+            raise LargeAtomError('Large atom start argument too short')
+
+        size = int.from_bytes(arg[2:], 'big')
+
+        if size > self.max_size:
+            raise LargeAtomError('Large atom size {} over limit {}'.format(
+                size, self.max_size))
+
+        if self._buffer is not None:
+            _logger.warning('Large atom %s replaced before it ended.',
+                            self._atom_def)
+            self._abandon()
+
+        self._atom_def = (arg[0], arg[1])
+        self._buffer = bytearray(size)
+        self._last_time = self._clock()
+
+    def _append(self, arg):
+        if self._buffer is None:
+            raise LargeAtomError('Large atom segment without start')
+
+        end = self._position + len(arg)
+
+        if end > len(self._buffer):
+            self._reset()
+            raise LargeAtomError('Large atom segments exceed declared size')
+
+        self._buffer[self._position:end] = arg
+        self._position = end
+        self._last_time = self._clock()
+
+    def _finish(self):
+        if self._position != len(self._buffer):
+            message = 'Large atom ended after {} of {} bytes'.format(
+                self._position, len(self._buffer))
+            self._abandon()
+            raise LargeAtomError(message)
+
+        atom_protocol_id, atom_id = self._atom_def
+        data = memoryview(self._buffer)
+        atom_info = serialize.get_decode_table().get(
+            serialize.atom_key(atom_protocol_id, atom_id),
+            serialize.UNKNOWN_ATOM_INFO)
+        self.completed += 1
+        self._reset()
+
+        return (atom_protocol_id, atom_id, atom_info.atom, len(data),
+                atom_info.decode(data))
+
+    def feed(self, atom):
+        '''Process a decoded atom.
+
+        Args:
+            atom (tuple): An atom in the format of
+                :func:`serialize.unserialize`.
+
+        Returns:
+            tuple: The atom itself, the assembled large atom when `atom`
+            ends one, or None if `atom` was a part of a large atom.
+
+        Raises:
+            LargeAtomError: The transfer is malformed or too large.
+        '''
+        self.expire()
+
+        atom_def = atom[:2]
+        arg = atom[4]
+
+        # Compressed atoms give short arguments as an int or None.
+        if arg is None:
+            arg = b''
+        elif isinstance(arg, int):
+            arg = bytes([arg])
+
+        if atom_def == _START_ATOM:
+            self._start(arg)
+        elif atom_def == _SEGMENT_ATOM:
+            self._append(arg)
+        elif atom_def == _END_ATOM:
+            if arg:
+                self._append(arg)
+            elif self._buffer is None:
+                raise LargeAtomError('Large atom end without start')
+
+            return self._finish()
+        else:
+            return atom
+
+    def process(self, atoms):
+        '''Yield the atoms with large atoms assembled.'''
+        for atom in atoms:
+            atom = self.feed(atom)
+
+            if atom is not None:
+                yield atom
+
+
+def encode_large_atom(buffer, atom_def, data, segment_size=SEGMENT_SIZE):
+    '''Append an argument split into large atom segments to a bytearray.
+
+    Args:
+        buffer (bytearray): Output buffer.
+        atom_def (Atom): The atom that receives `data` as its argument.
+        data (bytes): The argument. May be any bytes-like object.
+        segment_size (int): Largest argument of each segment, up to 255.
+    '''
+    atom_protocol_id, atom_id = atom_def
+    view = memoryview(data)
+    start_header = serialize.get_encoder(Atom.uni_start_large_atom)[0]
+    segment_header = serialize.get_encoder(Atom.uni_large_atom_segment)[0]
+    end_header = serialize.get_encoder(Atom.uni_end_large_atom)[0]
+
+    buffer += start_header
+    buffer.append(6)
+    buffer.append(atom_protocol_id)
+    buffer.append(atom_id)
+    buffer += len(view).to_bytes(4, 'big')
+
+    index = 0
+
+    while len(view) - index > segment_size:
+        buffer += segment_header
+        buffer.append(segment_size)
+        buffer += view[index:index + segment_size]
+        index += segment_size
+
+    buffer += end_header
+    buffer.append(len(view) - index)
+    buffer += view[index:]
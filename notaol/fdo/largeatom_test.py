@@ -0,0 +1,76 @@
+import unittest
+
+from notaol.fdo.atomdef import Atom
+from notaol.fdo.largeatom import LargeAtomAssembler, LargeAtomError, \
+    encode_large_atom
+from notaol.fdo.serialize import encode_atom, unserialize
+
+
+class TestLargeAtom(unittest.TestCase):
+    def test_round_trip(self):
+        data = bytes(range(256)) * 4
+        buffer = bytearray()
+        encode_atom(buffer, Atom.uni_start_stream)
+        encode_large_atom(buffer, Atom.de_data, data, segment_size=100)
+        encode_atom(buffer, Atom.uni_end_stream)
+
+        atoms = list(unserialize(0, bytes(buffer)))
+        self.assertEqual(14, len(atoms))
+
+        assembler = LargeAtomAssembler()
+        atoms = list(assembler.process(atoms))
+
+        self.assertEqual(3, len(atoms))
+        self.assertEqual((3, 1, Atom.de_data, len(data)), atoms[1][:4])
+        self.assertEqual(data, atoms[1][4])
+        self.assertEqual(Atom.uni_end_stream, atoms[2][2])
+        self.assertEqual(1, assembler.completed)
+        self.assertFalse(assembler.in_progress)
+
+    def test_limits(self):
+        assembler = LargeAtomAssembler(max_size=10)
+
+        with self.assertRaises(LargeAtomError):
+            assembler.feed((0, 4, Atom.uni_start_large_atom, 6,
+                            b'\x03\x01\x00\x00\x00\x0b'))
+
+        with self.assertRaises(LargeAtomError):
+            assembler.feed((0, 5, Atom.uni_large_atom_segment, 1, b'a'))
+
+        assembler.feed((0, 4, Atom.uni_start_large_atom, 6,
+                        b'\x03\x01\x00\x00\x00\x02'))
+
+        with self.assertRaises(LargeAtomError):
+            assembler.feed((0, 5, Atom.uni_large_atom_segment, 3, b'abc'))
+
+        self.assertFalse(assembler.in_progress)
+
+    def test_short_end(self):
+        assembler = LargeAtomAssembler()
+
+        assembler.feed((0, 4, Atom.uni_start_large_atom, 6,
+                        b'\x03\x01\x00\x00\x00\x04'))
+        assembler.feed((0, 5, Atom.uni_large_atom_segment, 2, b'ab'))
+
+        with self.assertRaises(LargeAtomError):
+            assembler.feed((0, 6, Atom.uni_end_large_atom, 1, b'c'))
+
+        self.assertFalse(assembler.in_progress)
+        self.assertEqual(0, assembler.completed)
+        self.assertEqual(1, assembler.abandoned)
+
+    def test_timeout(self):
+        now = [0]
+        assembler = LargeAtomAssembler(timeout=5, clock=lambda: now[0])
+
+        assembler.feed((0, 4, Atom.uni_start_large_atom, 6,
+                        b'\x03\x01\x00\x00\x00\x02'))
+        now[0] = 4
+        self.assertIsNone(
+            assembler.feed((0, 5, Atom.uni_large_atom_segment, 1, b'a')))
+
+        now[0] = 9
+        assembler.expire()
+
+        self.assertFalse(assembler.in_progress)
+        self.assertEqual(1, assembler.abandoned)
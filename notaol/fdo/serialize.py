@@ -9,23 +9,29 @@ Changes:
     - Added support for FDO save register flags
     - code refactoring for better readability
 """
-import io
 import enum
+import re
 import struct
 import logging
-import fdo.stream
-import traceback
+import collections
 
-from gid_tools.gid_int import gid_to_int
+from notaol.gid_tools.gid_int import gid_to_int
 #from gid_tools.int_gid import int_to_gid
-from fdo.atomdatatype import AtomDataType
-from fdo.datatype import DataType
-from fdo.atomdef import Atom
+from notaol.fdo.datatype import DataType
 
 
 _logger = logging.getLogger(__name__)
 
 
+def _atom_tables():
+    # Building the Atom enum takes most of the import time of the package,
+    # so the atom tables are imported on first use.
+    from notaol.fdo.atomdatatype import AtomDataType
+    from notaol.fdo.atomdef import Atom
+
+    return Atom, AtomDataType
+
+
 class AtomTypeComp(enum.IntEnum):
     no_comp = 0
     length_comp = 1
@@ -311,6 +317,148 @@ class DodType(enum.IntEnum):
         return value in DodType.__members__.keys() or value in DodType.__members__.values()
 
 
+AtomInfo = collections.namedtuple(
+    'AtomInfoType', ['atom', 'data_type', 'decode'])
+
+
+def _decode_arg(arg):
+    return arg
+
+
+class StreamNode(object):
+    '''Atoms of a stream argument, decoded on first access.
+
+    Stream arguments hold atoms without a stream ID. The node keeps the
+    encoded bytes and compares equal to them.
+
+    Attributes:
+        data (bytes): The encoded atoms. May be any bytes-like object.
+        errors (list): :class:`DecodeError` records of data that was skipped
+            while decoding the atoms.
+    '''
+    __slots__ = ('data', 'errors', '_atoms')
+
+    def __init__(self, data):
+        self.data = data
+        self.errors = []
+        self._atoms = None
+
+    @property
+    def atoms(self):
+        '''A list of ``(Atom, arg)`` tuples like :attr:`AtomStream.atoms`.'''
+        if self._atoms is None:
+            result = unserialize_partial(0, self.data)
+
+            if result.errors:
+                _logger.debug('Nested stream decode errors: %s',
+                              result.errors)
+
+            self.errors = result.errors
+            self._atoms = [(name, arg) for atom_protocol_id, atom_id, name,
+                           arg_length, arg in result.atoms]
+
+        return self._atoms
+
+    def walk(self):
+        '''Iterate the atoms of this stream and its nested streams.
+
+        See :func:`walk_atoms`.
+        '''
+        return walk_atoms(self.atoms)
+
+    def __bytes__(self):
+        return bytes(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __eq__(self, other):
+        if isinstance(other, StreamNode):
+            other = other.data
+
+        try:
+            return self.data == other
+        except TypeError:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(bytes(self.data))
+
+    def __repr__(self):
+        return 'StreamNode({!r})'.format(bytes(self.data))
+
+
+def walk_atoms(atoms):
+    '''Iterate atoms depth first, entering stream arguments.
+
+    Nested streams are decoded when the walk reaches them. An explicit
+    stack is used instead of recursion.
+
+    Args:
+        atoms: ``(Atom, arg)`` tuples.
+
+    Yields:
+        tuple: Nesting depth, :class:`Atom` and argument.
+    '''
+    stack = [iter(atoms)]
+
+    while stack:
+        for name, arg in stack[-1]:
+            yield (len(stack) - 1, name, arg)
+
+            if isinstance(arg, StreamNode):
+                stack.append(iter(arg.atoms))
+                break
+        else:
+            stack.pop()
+
+
+def _decode_stream_arg(arg):
+    # Compressed atoms without an argument give None or an int.
+    if isinstance(arg, (int, type(None))) or not arg:
+        return arg
+
+    return StreamNode(arg)
+
+
+ARG_DECODERS = {
+    DataType.stream: _decode_stream_arg,
+}
+
+UNKNOWN_ATOM_INFO = AtomInfo('(unknown atom)', None, _decode_arg)
+
+UNKNOWN_ATOMS = collections.Counter()
+'''Number of times each unknown (protocol ID, atom ID) was decoded.'''
+
+_decode_table = None
+
+
+def atom_key(atom_protocol_id, atom_id):
+    '''Return the decode table key of an atom.'''
+    return atom_protocol_id << 8 | atom_id
+
+
+def get_decode_table():
+    '''Return a dict of :func:`atom_key` to :class:`AtomInfo`.
+
+    The table is built on first use.
+    '''
+    global _decode_table
+
+    if _decode_table is None:
+        Atom, AtomDataType = _atom_tables()
+        table = {}
+
+        for atom_def in Atom:
+            data_type = getattr(AtomDataType, atom_def.name)
+            decode = ARG_DECODERS.get(data_type, _decode_arg)
+            table[atom_key(*atom_def.value)] = AtomInfo(
+                atom_def, data_type, decode)
+
+        _decode_table = table
+
+    return _decode_table
+
 
 def get_atom_type(num):
     # TODO: figure out what this means
@@ -322,437 +470,679 @@ def get_atom_value(num):
     return num & 0x1f
 
 
+def decode_atom(data, index, last_protocol_id):
+    '''Decode the atom starting at `index`.
+
+    `data` may be any bytes-like object. Arguments are slices of it.
+
+    Returns:
+        tuple: The atom as yielded by :func:`unserialize` and the index
+        after it, or None if `data` ends before the atom does.
+    '''
+    length = len(data)
+    atom_protocol_add = 0
+    atom_add = 0
+
+    while index < length and \
+            get_atom_type(data[index]) == AtomTypeComp.extended:
+        atom_protocol_add += (data[index] & 0x18) << 2
+        atom_add += (data[index] & 0x06) << 4
+        index += 1
+
+    if index >= length:
+        return None
+
+    value = data[index]
+
+    match get_atom_type(value):
+        case AtomTypeComp.no_comp:
+            if index + 3 > length:
+                return None
+
+            atom_protocol_id = get_atom_value(value)
+            atom_id = data[index + 1]
+            arg_length = data[index + 2]
+            index += 3
+            arg = data[index:index + arg_length]
+            index += arg_length
+
+        case AtomTypeComp.length_comp:
+            if index + 2 > length:
+                return None
+
+            atom_protocol_id = get_atom_value(value)
+            atom_id = get_atom_value(data[index + 1])
+            arg_length = get_atom_type(data[index + 1])
+            index += 2
+            arg = data[index:index + arg_length]
+            index += arg_length
+
+        case AtomTypeComp.data_comp:
+            if index + 2 > length:
+                return None
+
+            atom_protocol_id = get_atom_value(value)
+            atom_id = get_atom_value(data[index + 1])
+            arg_length = 1
+            arg = get_atom_type(data[index + 1])
+            index += 2
+
+        case AtomTypeComp.atom_noarg_comp:
+            atom_protocol_id = last_protocol_id
+            atom_id = get_atom_value(value)
+            index += 1
+            arg_length = 0
+            arg = None
+
+        case AtomTypeComp.atom_comp:
+            if index + 2 > length:
+                return None
+
+            atom_protocol_id = last_protocol_id
+            atom_id = get_atom_value(value)
+            arg_length = data[index + 1]
+            index += 2
+            arg = data[index:index + arg_length]
+            index += arg_length
+
+        case AtomTypeComp.zero_comp:
+            atom_protocol_id = last_protocol_id
+            atom_id = get_atom_value(value)
+            index += 1
+            arg_length = 1
+            arg = 0
+
+        case AtomTypeComp.one_comp:
+            atom_protocol_id = last_protocol_id
+            atom_id = get_atom_value(value)
+            index += 1
+            arg_length = 1
+            arg = 1
+
+    if index > length:
+        return None
+
+    atom_protocol_id += atom_protocol_add
+    atom_id += atom_add
+
+    atom_info = (_decode_table or get_decode_table()).get(
+        atom_key(atom_protocol_id, atom_id))
+
+    if atom_info is None:
+        atom_info = UNKNOWN_ATOM_INFO
+        UNKNOWN_ATOMS[(atom_protocol_id, atom_id)] += 1
+        _logger.debug('Unknown atom %d %d', atom_protocol_id, atom_id)
+
+    return ((atom_protocol_id, atom_id, atom_info.atom, arg_length,
+             atom_info.decode(arg)), index)
+
+
 def unserialize(last_protocol_id, data):
+    '''Decode the atoms of a complete atom stream.
+
+    Yields:
+        tuple: Protocol ID, atom ID, :class:`Atom`, argument length and
+        argument.
+
+    Raises:
+        IndexError: The last atom is truncated.
+    '''
     index = 0
 
     while index < len(data):
-        atom_protocol_add = 0
-        atom_add = 0
-        while (get_atom_type(data[index]) == AtomTypeComp.extended):
-            atom_protocol_add += (data[index] & 0x18) << 2
-            atom_add += (data[index] & 0x06) << 4
-            index += 1
+        result = decode_atom(data, index, last_protocol_id)
 
-        atom_type = get_atom_type(data[index])
-
-        match atom_type:
-            case AtomTypeComp.no_comp:
-                atom_protocol_id = get_atom_value(data[index])
-                index += 1
-                if index < len(data)+1:
-                    atom_id = data[index]
-                    index += 1
-                if index <= len(data)+1:
-                    # TODO: Getting index out of range errors here every now and then.
-                    arg_length = data[index]
-                    index += 1
-
-                arg = data[index:index + arg_length]
-                index += arg_length
-
-            case AtomTypeComp.length_comp:
-                atom_protocol_id = get_atom_value(data[index])
-                index += 1
-                atom_id = get_atom_value(data[index])
-                arg_length = get_atom_type(data[index])
-                index += 1
-                arg = data[index:index + arg_length]
-                index += arg_length
-
-            case AtomTypeComp.data_comp:
-                atom_protocol_id = get_atom_value(data[index])
-                index += 1
-                atom_id = get_atom_value(data[index])
-                arg_length = 1
-                arg = get_atom_type(data[index])
-                index += 1
-
-            case AtomTypeComp.atom_noarg_comp:
-                atom_protocol_id = last_protocol_id
-                atom_id = get_atom_value(data[index])
-                index += 1
-                arg_length = 0
-                arg = None
-
-            case AtomTypeComp.atom_comp:
-                atom_protocol_id = last_protocol_id
-                atom_id = get_atom_value(data[index])
-                index += 1
-                arg_length = data[index]
-                index += 1
-                arg = data[index:index + arg_length]
-                index += arg_length
-
-            case AtomTypeComp.zero_comp:
-                atom_protocol_id = last_protocol_id
-                atom_id = get_atom_value(data[index])
-                index += 1
-                arg_length = 1
-                arg = 0
-
-            case AtomTypeComp.one_comp:
-                atom_protocol_id = last_protocol_id
-                atom_id = get_atom_value(data[index])
-                index += 1
-                arg_length = 1
-                arg = 1
-
-        atom_protocol_id += atom_protocol_add
-        atom_id += atom_add
-        last_protocol_id = atom_protocol_id
+        if result is None:
+            raise IndexError('Atom at offset {} is truncated'.format(index))
 
-        try:
-            atom_def = Atom((atom_protocol_id, atom_id))
-            data_type = getattr(AtomDataType, atom_def.name)
-        except ValueError:
-            atom_def = '(unknown atom)'
-            data_type = None
-            print(atom_protocol_id, atom_id, atom_def, arg_length, arg)
+        atom, index = result
+        last_protocol_id = atom[0]
 
-        if data_type == DataType.stream:
-            atom_stream = fdo.stream.AtomStream()
-            atom_stream.parse(arg)
+        yield atom
 
-        yield (atom_protocol_id, atom_id, atom_def, arg_length, arg)
 
+DecodeError = collections.namedtuple(
+    'DecodeErrorType', ['offset', 'reason'])
+'''Position and description of data that could not be decoded.'''
 
-def serialize(file, atom_def, *args):
-    arg_len: int = 0
-    data: bytes = b''
-    atom_type_id, atom_sub_id = atom_def
+DecodeResult = collections.namedtuple(
+    'DecodeResultType', ['atoms', 'errors'])
+'''Atoms decoded by :func:`unserialize_partial` and a list of
+:class:`DecodeError`.'''
 
-    try:
-        if atom_type_id > 32 or atom_sub_id > 32:
-            # Extended byte
-            # byte_num = 0xe0
-            # byte_num |= (atom_type_id & 0x60) >> 2
-            # byte_num |= (atom_sub_id & 0x60) >> 4
-            file.write(bytes([atom_type_id, atom_sub_id]))
+# uni_start_stream without compression and with length_comp.
+_STREAM_START_PATTERN = re.compile(b'[\x00\x20]\x01')
+
+
+def find_stream_start(data, start=0):
+    '''Return the offset of the next ``uni_start_stream`` atom or -1.'''
+    # The pattern searches any bytes-like object without copying it.
+    match = _STREAM_START_PATTERN.search(data, start)
+
+    return match.start() if match else -1
+
+
+def unserialize_partial(last_protocol_id, data, resync=True):
+    '''Decode the atoms of a stream without raising on bad data.
+
+    Where an atom runs past the end of the data, an error is recorded and
+    decoding continues from the next ``uni_start_stream`` atom if `resync`
+    is True.
+
+    Returns:
+        DecodeResult: The atoms in the format of :func:`unserialize` and the
+        errors.
+    '''
+    atoms = []
+    errors = []
+    index = 0
+    length = len(data)
+
+    while index < length:
+        result = decode_atom(data, index, last_protocol_id)
+
+        if result is None:
+            errors.append(DecodeError(index, 'truncated atom'))
+
+            if not resync:
+                break
+
+            index = find_stream_start(data, index + 1)
+
+            if index < 0:
+                break
+
+            continue
+
+        atom, index = result
+        last_protocol_id = atom[0]
+        atoms.append(atom)
+
+    return DecodeResult(atoms, errors)
+
+
+_BYTE = struct.Struct('!B')
+_WORD = struct.Struct('!H')
+_DWORD = struct.Struct('!I')
+_BOOL = struct.Struct('!?')
+
+
+def _write_arg(buffer, data):
+    buffer.append(len(data))
+    buffer += data
+
+
+def _atom_bytes(name):
+    # Atoms passed as arguments are given by name.
+    return bytes(_atom_tables()[0][name])
+
+
+def _encode_dword(buffer, args):
+    for arg in args:
+        # error trap arg for None
+        if arg is None:
+            arg = 0
+
+        if isinstance(arg, str):
+            if DodType.is_valid(arg):
+                arg = DodType[arg]
+            else:
+                arg = gid_to_int(arg) or 0
+
+        if arg <= 255:
+            _write_arg(buffer, _BYTE.pack(arg))
         else:
-            # file.write(bytes([byte_num]))
-            file.write(bytes([atom_type_id & 0x1f, atom_sub_id & 0x1f]))
+            _write_arg(buffer, _DWORD.pack(arg))
+
+
+def _encode_vdword(buffer, args):
+    # the first argument should be A,B,C, or D string representing the save
+    # register to use, or 1,2,3,4 integer value representing the save
+    # register to use. The second argument is an optional integer value.
+    for arg in args:
+        if arg in saveRegType:
+            data = _BYTE.pack(saveRegType[arg])
+
+            if len(args) > 1:
+                data += _DWORD.pack(args[1])
+
+            _write_arg(buffer, data)
+            return
+
+        buffer.append(0)
+
+
+def _encode_var(buffer, args):
+    # var datatype has only one argument.
+    data = b''
+
+    for arg in args:
+        if arg in saveRegType:
+            data = _BYTE.pack(saveRegType[arg])
+
+        _write_arg(buffer, data)
 
+
+def _encode_str(buffer, args):
+    for arg in args:
+        if isinstance(arg, str):
+            data = arg.encode('latin-1', 'replace')
+        elif isinstance(arg, int):
+            data = str(arg).encode('latin-1', 'replace')
+        else:
+            data = arg
+
+        _write_arg(buffer, data)
+
+
+def _encode_word(buffer, args):
+    # arguments can be atom names or integer values
+    for arg in args:
+        if isinstance(arg, int):
+            _write_arg(buffer, _WORD.pack(arg))
+        else:
+            _write_arg(buffer, _atom_bytes(arg))
+
+
+def _encode_bool(buffer, args):
+    for arg in args:
+        if isinstance(arg, str) and YesNoBoolean.is_valid(arg):
+            arg = YesNoBoolean[arg]
+
+        _write_arg(buffer, _BOOL.pack(arg))
+
+
+def _encode_orient(buffer, args):
+    data = b''
+
+    for arg in args:
+        if isinstance(arg, str):
+            orient_bits = 0
+
+            # add up the plane, horizontal and vertical justification bits
+            for i, char in enumerate(arg):
+                if i == 1:
+                    char = 'h' + char
+                elif i == 2:
+                    char = 'v' + char
+
+                orient_bits += Orientation[char]
+
+            data += _BYTE.pack(orient_bits)
+        else:
+            data = _BYTE.pack(arg)
+
+        _write_arg(buffer, data)
+
+
+def _encode_crit(buffer, args):
+    # only 1 byte from 0-255
+    for arg in args:
+        _write_arg(buffer, _BYTE.pack(arg))
+
+
+def _encode_token(buffer, args):
+    data = b''
+
+    for arg in args:
+        if isinstance(arg, (bytes, bytearray, memoryview)):
+            data = arg
+        elif isinstance(arg, int):
+            data = _DWORD.pack(arg)
+        elif isinstance(arg, str):
+            data = arg.encode('latin-1', 'replace')
+
+        _write_arg(buffer, data)
+
+
+def _encode_alert(buffer, args):
+    # async_alert puts the total length byte after the FDO class-protocol.
+    # [class-protocol][len][alert type][text]
+    data = b''
+
+    for arg in args:
+        if isinstance(arg, str):
+            data += arg.encode('latin-1', 'replace')
+        elif isinstance(arg, int):
+            data += _BYTE.pack(arg)
+            continue
+        else:
+            data += arg
+
+        _write_arg(buffer, data)
+
+
+def _encode_atom_arg(buffer, args):
+    for arg in args:
+        _write_arg(buffer, _atom_bytes(arg))
+
+
+def _encode_stream(buffer, args):
+    # The stream datatype is a collection of FDO atoms eg.:
+    #   uni_start_stream
+    #       async_online
+    #   uni_end_stream
+    # Every argument is a tuple of an atom and its arguments.
+    # A decoded StreamNode is written back as is.
+    stream_buffer = bytearray()
+
+    for item in args:
+        if isinstance(item, StreamNode):
+            stream_buffer += item.data
+            continue
+
+        encode_atom(stream_buffer, item[0], *item[1:])
+
+    _write_arg(buffer, stream_buffer)
+
+
+def _encode_gid(buffer, args):
+    data = b''
+
+    for arg in args:
+        if isinstance(arg, int):
+            # check how many digits are in the integer
+            if len(str(arg)) in range(1, 4):
+                data = _BYTE.pack(arg)
+            elif len(str(arg)) in range(5, 8):
+                # strip the first byte for 2 part GIDs (32-12345) or the
+                # client shows a leading 0 (0-32-12345).
+                data = _DWORD.pack(arg)[1:]
+
+        elif isinstance(arg, str):
+            # convert string GID to long integer
+            num = gid_to_int(arg) or 0
+            data = _DWORD.pack(num)
+
+            if len(str(num)) in range(5, 8):
+                data = data[1:]
+
+        else:
+            _logger.warning('Unknown argument type for GID: %s', arg)
+            data = b''
+
+        _write_arg(buffer, data)
+
+
+def _encode_raw(buffer, args):
+    # raw data is either a sequence of bytes/characters or each argument is
+    # a byte value.
+    arg = args[0]
+    data = bytearray()
+
+    if isinstance(arg, (bytes, bytearray, memoryview, str)):
+        for byte in arg:
+            if isinstance(byte, str):
+                data += byte.encode('latin-1', 'replace')
+            else:
+                data.append(byte)
+    else:
         for arg in args:
-            data_type = getattr(AtomDataType, atom_def.name)
+            data.append(arg)
 
-            match data_type:
-                case DataType.dword:
-                    # dword is 4 bytes long
-                    # error trap arg for None
-                    if arg is None: arg = 0
-                    if isinstance(arg, str):
-                        if DodType.is_valid(arg):
-                            arg = DodType[arg]
-                        else:
-                            arg = gid_to_int(arg) or 0
-
-                    if arg <= 255:
-                        data = struct.pack('!B', arg)
-                    else:
-                        data = struct.pack('!I', arg)
-
-                    arg_len = len(data)
-
-                case DataType.vdword:
-                    # the first argument should be A,B,C, or D string representing the save register to use, or
-                    # 1,2,3,4 integer value representing the save register to use
-                    if arg in saveRegType.keys():
-                        data = struct.pack('!B', saveRegType[arg])
-                        if len(args) > 1:
-                            # second argument is an integer value - but there may not be a second argument
-                            data += struct.pack('!I', args[1])
-                        # data += struct.pack('!B', args[1])
-
-                        arg_len = len(data)
-                        assert len(data) == arg_len
-                        file.write(bytes([arg_len]))
-
-                        if arg_len:
-                            file.write(data)
-                        break
-
-                case DataType.var:
-                    # var datatype has only one argument.
-                    if arg in saveRegType.keys():
-                        data = struct.pack('!B', saveRegType[arg])
-                        arg_len = len(data)
-
-                case DataType.str:
-                    # If not bytes, convert it to bytes
-                    if isinstance(arg, str):
-                        data = arg.encode('latin-1', 'replace')
-                    elif isinstance(arg, int):
-                        data = str(arg).encode('latin-1', 'replace')
-                        # data = struct.pack('!B', arg)
-                    else:
-                        data = arg
-                    arg_len = len(data)
-
-                case DataType.word:
-                    # word is 2 bytes long
-                    # arguments can be streams or integer values
-                    # check if argument is an integer value
-                    if isinstance(arg, int):
-                        data = struct.pack('!H', arg)
-                        arg_len = len(data)
-                    elif Atom[arg]:
-                        arg_list = Atom[arg]
-                        data = struct.pack(f'!{len(arg_list)}B', *arg_list)
-                        arg_len = len(data)
-
-                case DataType.bool:
-                    if isinstance(arg, str) and YesNoBoolean.is_valid(arg):
-                        data = struct.pack('!?', YesNoBoolean[arg])
-                    else:
-                        data = struct.pack('!?', arg)
-                    arg_len = len(data)
-
-                case DataType.orient:
-                    orient_bits = 0
-                    # check if arg is a string object
-                    if isinstance(arg, str):
-                        # loop over the string object 1 char at a time, add the values up
-                        for i, char in enumerate(arg, start=0):
-                            # horizontal justification bits
-                            if i == 1: char = 'h' + char
-                            # virtical justification bits
-                            if i == 2: char = 'v' + char
-                            if Orientation[char]:
-                                orient_bits += Orientation[char]
-                        data += struct.pack('!B', orient_bits)
-
-                    else:
-                        data = struct.pack('!B', arg)
-                    arg_len = len(data)
-
-                case DataType.crit:
-                    # i had set crit to be 2 bytes awhile back in my testing and it "seemed" to work,
-                    # however it is only supossed to be 1 bytes from 0-255 and that's it.
-                    # this should fix some act_do_action issues
-                    arg_len = 1
-                    data = struct.pack('!B', arg)
-
-                case DataType.token:
-                    # 2 arguments always, first should be a token, the second can be an empty value
-                    if isinstance(arg, (bytes, bytearray)):
-                        data = arg
-                        arg_len = len(data)
-                    elif isinstance(arg, int):
-                        data = struct.pack('!I', arg)
-                        arg_len = len(data)
-                    elif isinstance(arg, str):
-                        data = arg.encode('latin-1', 'replace')
-                        arg_len = len(data)
-
-                case DataType.alert:
-                    # async_alert puts the total length byte after the FDO
-                    # class-protocol.
-                    # [class-protocol][len][alert type][text]
-
-                    # If not bytes, convert it to bytes
-                    if isinstance(arg, str):
-                        data += arg.encode('latin-1', 'replace')
-                    elif isinstance(arg, int):
-                        data += struct.pack('!B', arg)
-                        continue
-                    else:
-                        data += arg
-                    arg_len = len(data)
-
-                case DataType.multi:
-                    # Datatype.multi takes atoms as arguments; so we need to evaluate the atom passed
-                    # This works perfect when viewing the data sent to the client with the Atomdebugger.
-                    # However, if you misspell an atom it will error out (no shit!)
-                    if Atom[arg]:
-                        arg_list = Atom[arg]
-                        data = struct.pack(f'!{len(arg_list)}B', *arg_list)
-                        arg_len = len(data)
-
-                case DataType.atom:
-                    # Datatype.atom takes atoms as arguments; so we need to evaluate the atom passed
-                    # This works perfect when viewing the data sent to the client with the Atomdebugger.
-                    # However, if you misspell an atom it will error out (no shit!)
-                    if Atom[arg]:
-                        arg_list = Atom[arg]
-                        data = struct.pack(f'!{len(arg_list)}B', *arg_list)
-                        arg_len = len(data)
-
-                case DataType.stream:
-                    # The stream datatype is a collection of FDO atoms eg.:
-                    #   uni_start_stream
-                    #       async_online
-                    #   uni_end_stream
-                    # each atom can take arguments, the streams are usually the arguments
-                    # of act_replace_select_action, act_replace_action, and the like.
-                    # Start a bytes buffer to write to
-                    buffer = io.BytesIO()
-                    # serialize the stream data, write it to our buffer
-                    for item in args:
-                        atomdef = item[0]
-                        argss = item[1:]
-                        serialize(buffer, atomdef, *argss)
-                    # get the bytes from the buffer, and the length of the bytes
-                    data = buffer.getvalue()
-                    arg_len = len(data)
-
-                case DataType.gid:
-                    # Check if arg is an integer or string
-                    if isinstance(arg, int):
-                        #data = struct.pack('!I', arg)
-                        # check how many digits are in the integer
-                        if len(str(arg)) in range(1, 4):
-                            # 1 to 3 digits long
-                            data = struct.pack('!B', arg)
-                        if len(str(arg)) in range(5, 8):
-                            # 5 to 7 digits long
-                            data = struct.pack('!I', arg)
-                            # strip the first byte from data
-                            # this is required for 2 part GIDs (32-12345) or
-                            # the GID will have a leading 0 when the client software
-                            # parses the sent FDO stream. (0-32-12345)
-                            data = data[1:]
-                        arg_len = len(data)
-
-                    elif isinstance(arg, str):
-                        # convert string GID to long integer
-                        num = gid_to_int(arg) or 0
-                        data = struct.pack('!I', num)
-                        if len(str(num)) in range(5, 8):
-                            data = data[1:]
-                        arg_len = len(data)
-
-                    else:
-                        # Unknown argument type, so do nothing.
-                        _logger.warning(f"Unknown argument type for GID: {arg}")
-                        arg_len = 0
-                        data = b''
-
-                case DataType.raw:
-                    # not sure how to handle raw data type?
-                    # I believe raw data is comma seperated bytes?
-                    # Will probably have to check args for integer value (bytes) or strings and process accordingly
-                    # if isinstance(arg, (bytes, bytearray, str)):
-                    #     data = arg
-                    #     arg_len = len(data)
-                    #     break
-                    if isinstance(arg, (bytes, bytearray, str)):
-                        for byte in arg:
-                            if isinstance(byte, str):
-                                data += byte.encode('latin-1', 'replace')
-                                continue
-                            data += struct.pack('!B', byte)
-                    else:
-                        for argg in args:
-                            data += struct.pack('!B', argg)
-
-                    arg_len = len(data)
-
-                case DataType.byte:
-                    if not arg: continue
-                    if isinstance(arg, str) and Position.is_valid(arg):
-                        # check if arg is a string or a bytes object
-                        data = struct.pack('!B', Position[arg])
-                    elif isinstance(arg, str) and FontID.is_valid(arg):
-                        # if this a font?
-                        data = struct.pack('!B', FontID[arg])
-                    else:
-                        data = struct.pack('!B', arg)
-                    arg_len = len(data)
-
-                case DataType.bytelist:
-                    # build the argument bytes
-                    if isinstance(arg, str) and arg in FrameType:
-                        # this is a frame type
-                        data = struct.pack('!B', FrameType[arg])
-
-                    else:
-                        for dat in args:
-                            if isinstance(dat, str):
-                                dat = dat.encode('latin-1', 'replace')
-                                data += struct.pack('!B', len(dat))
-                                data += dat
-                                continue
-                            if dat > 255:
-                                data += struct.pack('!H', dat)
-                            else:
-                                data += struct.pack('!B', dat)
-
-                    arg_len = len(data)
-
-                case DataType.objst:
-                    # there should only ever be 2 arguments passed here,
-                    # if more it will crash, but I don't care right now
-                    if args[0] in ObjType.keys():
-                        obj_type = struct.pack('!B', int(ObjType[args[0]]))
-                    else:
-                        obj_type = struct.pack('!B', int(args[0]))
-
-                    if len(args) > 1:
-                        data = args[1].encode('latin-1', 'replace')
-                    data = obj_type + data
-
-                    arg_len = len(data)
-                    assert len(data) == arg_len
-                    file.write(bytes([arg_len]))
-
-                    if arg_len:
-                        file.write(data)
-                    break
-
-                case DataType.vstring:
-                    # vstring is used for FDO streams like var_string_set <A, "String">
-                    # first argument will be either a single letter of: A,B,C,D or a number of: 0,1,2,3
-                    if arg in saveRegType.keys():
-                        data = struct.pack('!B', saveRegType[arg])
-                        # second argument is a string of unknown length
-                        data += args[1].encode('latin-1', 'replace')
-
-                        arg_len = len(data)
-                        assert len(data) == arg_len
-                        file.write(bytes([arg_len]))
-
-                        if arg_len:
-                            file.write(data)
-                        break
-
-                case _:
-                    raise Exception('unhandled data type {}'.format(data_type))
-
-
-            assert len(data) == arg_len
-            file.write(bytes([arg_len]))
-
-            if arg_len:
-                file.write(data)
-            # we need to break out of the loop with a bytelist/raw/stream otherwise it mangles the FDO bytes
-            if (data_type == DataType.bytelist
-                or data_type == DataType.raw
-                or data_type == DataType.stream
-                # or data_type == DataType.alert
-                ):
-                break
+    _write_arg(buffer, data)
+
+
+def _encode_byte(buffer, args):
+    for arg in args:
+        if not arg:
+            continue
+
+        if isinstance(arg, str) and Position.is_valid(arg):
+            arg = Position[arg]
+        elif isinstance(arg, str) and FontID.is_valid(arg):
+            arg = FontID[arg]
+
+        _write_arg(buffer, _BYTE.pack(arg))
+
+
+def _encode_bytelist(buffer, args):
+    arg = args[0]
+
+    if isinstance(arg, str) and arg in FrameType.__members__:
+        _write_arg(buffer, _BYTE.pack(FrameType[arg]))
+        return
+
+    data = bytearray()
+
+    for dat in args:
+        if isinstance(dat, str):
+            dat = dat.encode('latin-1', 'replace')
+            data.append(len(dat))
+            data += dat
+        elif dat > 255:
+            data += _WORD.pack(dat)
+        else:
+            data.append(dat)
+
+    _write_arg(buffer, data)
+
+
+def _encode_objst(buffer, args):
+    # an object type and an optional title
+    if args[0] in ObjType:
+        data = _BYTE.pack(ObjType[args[0]])
+    else:
+        data = _BYTE.pack(int(args[0]))
+
+    if len(args) > 1:
+        data += args[1].encode('latin-1', 'replace')
+
+    _write_arg(buffer, data)
+
+
+def _encode_vstring(buffer, args):
+    # vstring is used for FDO streams like var_string_set <A, "String">
+    # first argument will be either a single letter of: A,B,C,D or a
+    # number of: 0,1,2,3; the second is a string of unknown length.
+    for arg in args:
+        if arg in saveRegType:
+            data = _BYTE.pack(saveRegType[arg])
+            data += args[1].encode('latin-1', 'replace')
+            _write_arg(buffer, data)
+            return
+
+        buffer.append(0)
+
+
+ENCODERS = {
+    DataType.dword: _encode_dword,
+    DataType.vdword: _encode_vdword,
+    DataType.var: _encode_var,
+    DataType.str: _encode_str,
+    DataType.word: _encode_word,
+    DataType.bool: _encode_bool,
+    DataType.orient: _encode_orient,
+    DataType.crit: _encode_crit,
+    DataType.token: _encode_token,
+    DataType.alert: _encode_alert,
+    DataType.multi: _encode_atom_arg,
+    DataType.atom: _encode_atom_arg,
+    DataType.stream: _encode_stream,
+    DataType.gid: _encode_gid,
+    DataType.raw: _encode_raw,
+    DataType.byte: _encode_byte,
+    DataType.bytelist: _encode_bytelist,
+    DataType.objst: _encode_objst,
+    DataType.vstring: _encode_vstring,
+}
+'''Functions that append the arguments of an atom to a bytearray.
+
+Each is called with the buffer and the tuple of arguments, which is never
+empty.
+'''
+
+_encoder_cache = {}
+
+
+def extended_prefix(protocol_high, atom_high):
+    '''Return the extended bytes that add multiples of 32 to the IDs.'''
+    prefix = bytearray()
+
+    while protocol_high or atom_high:
+        protocol_add = min(protocol_high, 3)
+        atom_add = min(atom_high, 3)
+        prefix.append(AtomTypeComp.extended << 5 |
+                      protocol_add << 3 | atom_add << 1)
+        protocol_high -= protocol_add
+        atom_high -= atom_add
+
+    return bytes(prefix)
+
+
+def get_encoder(atom_def):
+    '''Return the header bytes and encoder function of an atom.
+
+    The result is cached per atom.
+    '''
+    try:
+        return _encoder_cache[atom_def]
+    except KeyError:
+        pass
+
+    atom_type_id, atom_sub_id = atom_def
+    header = extended_prefix(atom_type_id >> 5, 0) + \
+        bytes([atom_type_id & 0x1f, atom_sub_id])
+
+    data_type = getattr(_atom_tables()[1], atom_def.name)
+    encoder = ENCODERS.get(data_type)
+
+    if not encoder:
+        raise Exception('unhandled data type {}'.format(data_type))
+
+    _encoder_cache[atom_def] = result = (header, encoder)
+
+    return result
+
+
+def encode_atom(buffer, atom_def, *args):
+    '''Append a serialized atom to a bytearray.'''
+    header, encoder = get_encoder(atom_def)
+    buffer += header
+
+    if args:
+        encoder(buffer, args)
+    else:
+        # atoms without arguments need a zero length byte
+        buffer.append(0)
+
+
+def _compressed_atom(protocol_id, atom_id, arg, last_protocol_id):
+    protocol_low = protocol_id & 0x1f
+    atom_low = atom_id & 0x1f
+    atom_prefix = extended_prefix(protocol_id >> 5, atom_id >> 5)
+    arg_length = len(arg)
+
+    candidates = [
+        extended_prefix(protocol_id >> 5, 0) +
+        bytes([AtomTypeComp.no_comp << 5 | protocol_low, atom_id,
+               arg_length]) + arg
+    ]
+
+    if arg_length == 1 and arg[0] < 8:
+        candidates.append(atom_prefix + bytes(
+            [AtomTypeComp.data_comp << 5 | protocol_low,
+             arg[0] << 5 | atom_low]))
+
+    if arg_length < 8:
+        candidates.append(atom_prefix + bytes(
+            [AtomTypeComp.length_comp << 5 | protocol_low,
+             arg_length << 5 | atom_low]) + arg)
+
+    if protocol_id == last_protocol_id:
+        # The previous protocol ID is reused as is, so only the atom ID
+        # gets an extended prefix.
+        atom_prefix = extended_prefix(0, atom_id >> 5)
+
+        if not arg_length:
+            candidates.append(atom_prefix + bytes(
+                [AtomTypeComp.atom_noarg_comp << 5 | atom_low]))
+        elif arg == b'\x00':
+            candidates.append(atom_prefix + bytes(
+                [AtomTypeComp.zero_comp << 5 | atom_low]))
+        elif arg == b'\x01':
+            candidates.append(atom_prefix + bytes(
+                [AtomTypeComp.one_comp << 5 | atom_low]))
+
+        candidates.append(atom_prefix + bytes(
+            [AtomTypeComp.atom_comp << 5 | atom_low, arg_length]) + arg)
+
+    return min(candidates, key=len)
+
+
+def encode_atom_compressed(buffer, atom_def, args, last_protocol_id=None):
+    '''Append an atom to a bytearray using its smallest encoding.
+
+    Atoms that repeat `last_protocol_id` leave out the protocol ID, and
+    arguments of up to 7 bytes are packed into the type bits. Atoms whose
+    arguments are not one length-prefixed value keep the uncompressed
+    layout. The first atom of a stream always states its protocol.
+
+    The atoms of streams given as arguments keep the uncompressed layout.
+    The stream encoder is shared with :func:`encode_atom`, and decoded
+    nested streams are written back as they were received.
+
+    Returns:
+        int: The protocol ID to pass as `last_protocol_id` for the next atom.
+    '''
+    protocol_id, atom_id = atom_def
+    header, encoder = get_encoder(atom_def)
+    start = len(buffer)
+
+    if args:
+        encoder(buffer, args)
+    else:
+        buffer.append(0)
+
+    if len(buffer) == start or start + 1 + buffer[start] != len(buffer):
+        buffer[start:start] = header
+        return protocol_id
+
+    arg = bytes(buffer[start + 1:])
+    del buffer[start:]
+    buffer += _compressed_atom(protocol_id, atom_id, arg, last_protocol_id)
+
+    return protocol_id
+
+
+def encode_atoms(buffer, atoms, compress=False):
+    '''Append a sequence of atom tuples to a bytearray.
+
+    Each item is a tuple of an Atom followed by its arguments.
+    '''
+    if compress:
+        last_protocol_id = None
+
+        for item in atoms:
+            last_protocol_id = encode_atom_compressed(
+                buffer, item[0], item[1:], last_protocol_id)
+    else:
+        for item in atoms:
+            encode_atom(buffer, item[0], *item[1:])
+
+
+def serialize(file, atom_def, *args):
+    '''Serialize an atom.
+
+    Args:
+        file: A bytearray to append to or a file object to write to.
+        atom_def (Atom): The atom.
+        args: The arguments of the atom.
+
+    Errors are logged. Whatever was encoded before the error is kept.
+    '''
+    if isinstance(file, bytearray):
+        buffer = file
+    else:
+        buffer = bytearray()
+
+    try:
+        encode_atom(buffer, atom_def, *args)
+    except Exception:
+        _logger.exception('Error serializing stream data.')
 
-        data_type = getattr(AtomDataType, atom_def.name)
-        # any data type that is NOT of this list needs to have a zero byte value following it for the FDO to function
-        if not args and (
-            data_type != DataType.objst
-            or data_type != DataType.gid
-            or data_type != DataType.raw
-            or data_type != DataType.str
-            or data_type != DataType.dword
-            or data_type != DataType.bytelist
-            or data_type != DataType.var
-            or data_type != DataType.orient
-            or data_type != DataType.vdword
-            or data_type != DataType.multi
-            or data_type != DataType.atom
-            or data_type != DataType.byte
-            or data_type != DataType.alert
-        ):
-           file.write(b'\x00')
-
-    except Exception as e:
-        _logger.error(f"Error serializing stream data: {traceback.format_exc()}")
+    if buffer is not file:
+        file.write(buffer)
 
 
 def unserialize_stream_id(data):
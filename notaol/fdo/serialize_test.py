@@ -3,8 +3,11 @@ import io
 import unittest
 
 from notaol.fdo.atomdef import Atom, AtomProtocol
+from notaol.fdo.datatype import DataType
 from notaol.fdo.serialize import unserialize, serialize, unserialize_stream_id, \
-    serialize_stream_id
+    serialize_stream_id, get_decode_table, atom_key, UNKNOWN_ATOMS, \
+    encode_atom, get_encoder, encode_atoms, extended_prefix, StreamNode, \
+    walk_atoms, unserialize_partial, DecodeError, find_stream_start
 
 
 class TestSerialize(unittest.TestCase):
@@ -58,3 +61,150 @@ class TestSerialize(unittest.TestCase):
         print(good)
         print(result)
         self.assertEqual(good, result)
+
+    def test_decode_table(self):
+        atom_info = get_decode_table()[atom_key(3, 1)]
+
+        self.assertEqual(Atom.de_data, atom_info.atom)
+        self.assertEqual(DataType.str, atom_info.data_type)
+        self.assertEqual(b'abc', atom_info.decode(b'abc'))
+
+    def test_unserialize_unknown(self):
+        UNKNOWN_ATOMS.clear()
+        atoms = tuple(unserialize(0, b'\x1f\xfe\x01a\x00\x02\x00'))
+
+        self.assertEqual(2, len(atoms))
+        self.assertEqual((31, 254, '(unknown atom)', 1, b'a'), atoms[0])
+        self.assertEqual(Atom.uni_end_stream, atoms[1][2])
+        self.assertEqual(1, UNKNOWN_ATOMS[(31, 254)])
+
+    def test_encode_atom(self):
+        buffer = bytearray(b'\xff')
+        encode_atom(buffer, Atom.uni_start_stream)
+        encode_atom(buffer, Atom.de_data, 'asdf')
+        encode_atom(buffer, Atom.man_set_context_relative, 300)
+        encode_atom(buffer, Atom.act_replace_action,
+                    (Atom.uni_start_stream,), (Atom.uni_end_stream,))
+
+        self.assertEqual(
+            b'\xff' b'\x00\x01\x00' b'\x03\x01\x04asdf'
+            b'\x01\x0a\x04\x00\x00\x01\x2c'
+            b'\x02\x03\x06\x00\x01\x00\x00\x02\x00',
+            buffer)
+        self.assertIs(get_encoder(Atom.de_data), get_encoder(Atom.de_data))
+
+    def test_serialize_error(self):
+        buffer = bytearray()
+        serialize(buffer, Atom.man_set_context_relative, 0, -1)
+
+        self.assertEqual(b'\x01\x0a\x01\x00', buffer)
+
+    def test_extended_prefix(self):
+        self.assertEqual(b'', extended_prefix(0, 0))
+        self.assertEqual(b'\xe8', extended_prefix(1, 0))
+        self.assertEqual(b'\xe2', extended_prefix(0, 1))
+        self.assertEqual(b'\xfe\xe2', extended_prefix(3, 4))
+
+    def test_encode_compressed(self):
+        atoms = [
+            (Atom.uni_start_stream,),
+            (Atom.de_data, 'asdf'),
+            (Atom.de_data, 'a' * 40),
+            (Atom.man_set_context_relative, 300),
+            (Atom.man_set_context_relative, 0),
+            (Atom.man_set_context_relative, 1),
+            (Atom.man_set_context_relative, 5),
+            (Atom.act_replace_action,
+             (Atom.uni_start_stream,), (Atom.uni_end_stream,)),
+            (Atom.adp_eid, 1),
+            (Atom.adp_route_tkn,),
+            (Atom.adp_abort_tkn, 200),
+            (Atom.map_ygp_get_url, 0),
+            (Atom.map_ygp_form_up,),
+            (Atom.uni_end_stream,),
+        ]
+        plain = bytearray()
+        compressed = bytearray()
+        encode_atoms(plain, atoms)
+        encode_atoms(compressed, atoms, compress=True)
+
+        self.assertLess(len(compressed), len(plain))
+        self.assertEqual(b'\x20\x01', compressed[:2])
+
+        def normalize(atom):
+            atom_protocol_id, atom_id, name, arg_length, arg = atom
+
+            if arg is None:
+                arg = b''
+            elif isinstance(arg, int):
+                arg = bytes([arg])
+
+            return (atom_protocol_id, atom_id, name, arg_length, bytes(arg))
+
+        expected = [normalize(atom) for atom in unserialize(0, plain)]
+        result = [normalize(atom) for atom in unserialize(0, compressed)]
+
+        self.assertEqual(len(atoms), len(result))
+        self.assertEqual(expected, result)
+
+    def test_stream_node(self):
+        buffer = bytearray()
+        encode_atoms(buffer, [
+            (Atom.uni_start_stream,),
+            (Atom.act_replace_action,
+             (Atom.uni_start_stream,),
+             (Atom.act_append_action, (Atom.de_data, 'a')),
+             (Atom.uni_end_stream,)),
+            (Atom.uni_end_stream,),
+        ])
+
+        atoms = [(name, arg) for atom_protocol_id, atom_id, name,
+                 arg_length, arg in unserialize(0, bytes(buffer))]
+        node = atoms[1][1]
+
+        self.assertIsInstance(node, StreamNode)
+        self.assertIsNone(node._atoms)
+        self.assertEqual(b'\x00\x01\x00\x02\x20\x04\x03\x01\x01a'
+                         b'\x00\x02\x00', node)
+
+        self.assertEqual(
+            [(0, Atom.uni_start_stream), (0, Atom.act_replace_action),
+             (1, Atom.uni_start_stream), (1, Atom.act_append_action),
+             (2, Atom.de_data), (1, Atom.uni_end_stream),
+             (0, Atom.uni_end_stream)],
+            [(depth, name) for depth, name, arg in walk_atoms(atoms)])
+        self.assertIs(node.atoms, node.atoms)
+
+        result = bytearray()
+        encode_atoms(result, [(name, arg) for name, arg in atoms])
+        self.assertEqual(buffer, result)
+
+    def test_unserialize_partial(self):
+        good = b'\x00\x01\x00\x03\x01\x04asdf\x00\x02\x00'
+        result = unserialize_partial(0, good)
+
+        self.assertEqual(3, len(result.atoms))
+        self.assertEqual([], result.errors)
+
+        # A de_data atom claiming 200 bytes cuts off the first stream.
+        data = b'\x00\x01\x00\x03\x01\xc8as' + good
+        result = unserialize_partial(0, data)
+
+        self.assertEqual([DecodeError(3, 'truncated atom')], result.errors)
+        self.assertEqual(
+            [Atom.uni_start_stream, Atom.uni_start_stream, Atom.de_data,
+             Atom.uni_end_stream],
+            [atom[2] for atom in result.atoms])
+        self.assertEqual(b'asdf', result.atoms[2][4])
+
+        result = unserialize_partial(0, data, resync=False)
+        self.assertEqual(1, len(result.atoms))
+        self.assertEqual(1, len(result.errors))
+
+        self.assertEqual(8, find_stream_start(data, 1))
+        self.assertEqual(8, find_stream_start(memoryview(data), 1))
+        self.assertEqual(-1, find_stream_start(b'\x03\x01\x00'))
+
+        node = StreamNode(data)
+        self.assertEqual(4, len(node.atoms))
+        self.assertEqual([DecodeError(3, 'truncated atom')], node.errors)
@@ -1,5 +1,10 @@
+import array
+import logging
+
 from notaol.fdo import serialize
-import io
+
+
+_logger = logging.getLogger(__name__)
 
 
 class AtomStream(object):
@@ -9,25 +14,70 @@ class AtomStream(object):
         stream_id (int): Stream ID.
         atom_protocol_id (int): Last protocol ID for this stream.
         atoms (list): A list of tuples. The first item in the tuple is
-            a Atom. The remainder of the tuple is the argument.
+            a Atom. The remainder of the tuple is the argument. Decoded from
+            the parsed data on first access.
+        errors (list): :class:`serialize.DecodeError` records of data that
+            was skipped while decoding the atoms.
     '''
+    __slots__ = ('stream_id', 'atom_protocol_id', 'errors', '_atoms', '_data')
+
     def __init__(self):
         self.stream_id = None
         self.atom_protocol_id = 0
-        self.atoms = None
+        self.errors = []
+        self._atoms = None
+        self._data = None
+
+    @property
+    def atoms(self):
+        if self._data is not None:
+            result = serialize.unserialize_partial(self.atom_protocol_id,
+                                                   self._data)
+            atoms = []
+
+            for item in result.atoms:
+                self.atom_protocol_id, atom_id, name, arg_length, arg = item
+
+                atoms.append((name, arg))
+
+            if result.errors:
+                _logger.debug('Atom stream decode errors: %s', result.errors)
+
+            self.errors = result.errors
+            self._atoms = atoms
+            self._data = None
+
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        self._atoms = atoms
+        self._data = None
+
+    def walk(self):
+        '''Iterate the atoms including those of nested streams.
+
+        See :func:`serialize.walk_atoms`.
+        '''
+        return serialize.walk_atoms(self.atoms)
 
     def parse(self, data):
+        '''Parse the stream ID. The atoms are decoded on first access.'''
         self.stream_id, stream_id_bytes = serialize.unserialize_stream_id(data)
-        self.atoms = []
+        self.errors = []
+        self._atoms = None
+        self._data = data[len(stream_id_bytes):]
 
-        for item in serialize.unserialize(self.atom_protocol_id, data[len(stream_id_bytes):]):
-            self.atom_protocol_id, atom_id, name, arg_length, arg = item
+    def to_bytes(self, compress=False):
+        '''Serialize the stream.
 
-            self.atoms.append((name, arg))
+        If `compress` is True, each atom uses its smallest encoding.
+        '''
+        buffer = bytearray(serialize.serialize_stream_id(self.stream_id))
 
-    def to_bytes(self):
-        buffer = io.BytesIO()
-        buffer.write(serialize.serialize_stream_id(self.stream_id))
+        if compress:
+            serialize.encode_atoms(buffer, self.atoms, compress=True)
+            return bytes(buffer)
 
         for item in self.atoms:
             atom_def = item[0]
@@ -35,8 +85,158 @@ class AtomStream(object):
 
             serialize.serialize(buffer, atom_def, *args)
 
-        return buffer.getvalue()
+        return bytes(buffer)
 
     def __str__(self):
         return '<AtomStream at {} SID={} Atoms={}>'.format(
             id(self), self.stream_id, self.atoms)
+
+
+_ARG_BYTES = 0
+_ARG_INT = 1
+_ARG_NONE = 2
+
+
+class CompactAtomStream(object):
+    '''Atom stream stored as columns over the encoded data.
+
+    Each atom takes one entry in a few :class:`array.array` columns. The
+    arguments stay in the parsed data and are sliced from it when an atom
+    is accessed. Items are the same ``(Atom, arg)`` tuples as in
+    :attr:`AtomStream.atoms`, with memoryview arguments.
+
+    Attributes:
+        stream_id (int): Stream ID.
+        protocol_ids (array): Protocol ID of each atom.
+        atom_ids (array): Atom ID of each atom.
+        offsets (array): Offset of each argument in the data, or the value
+            of arguments that were compressed into the atom header.
+        lengths (array): Argument length of each atom.
+    '''
+    __slots__ = ('stream_id', 'protocol_ids', 'atom_ids', 'offsets',
+                 'lengths', '_kinds', '_data')
+
+    def __init__(self):
+        self.stream_id = None
+        self.protocol_ids = array.array('B')
+        self.atom_ids = array.array('B')
+        self.offsets = array.array('I')
+        self.lengths = array.array('I')
+        self._kinds = array.array('B')
+        self._data = memoryview(b'')
+
+    def parse(self, data, last_protocol_id=0):
+        '''Parse the stream ID and index the atoms of the stream.'''
+        self.__init__()
+        self.stream_id, stream_id_bytes = serialize.unserialize_stream_id(data)
+        view = memoryview(data)
+        index = len(stream_id_bytes)
+        length = len(view)
+
+        while index < length:
+            result = serialize.decode_atom(view, index, last_protocol_id)
+
+            if result is None:
+                raise IndexError(
+                    'Atom at offset {} is truncated'.format(index))
+
+            atom, next_index = result
+            last_protocol_id, atom_id, name, arg_length, arg = atom
+
+            # Repeated extended prefixes can add up past the byte columns.
+            if last_protocol_id > 0xff or atom_id > 0xff:
+                raise IndexError(
+                    'Atom at offset {} has an ID out of range'.format(index))
+
+            index = next_index
+
+            if arg is None:
+                self._append(last_protocol_id, atom_id, 0, 0, _ARG_NONE)
+            elif isinstance(arg, int):
+                self._append(last_protocol_id, atom_id, arg, 1, _ARG_INT)
+            else:
+                self._append(last_protocol_id, atom_id, index - arg_length,
+                             arg_length, _ARG_BYTES)
+
+        self._data = view
+
+    def _append(self, atom_protocol_id, atom_id, offset, length, kind):
+        self.protocol_ids.append(atom_protocol_id)
+        self.atom_ids.append(atom_id)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self._kinds.append(kind)
+
+    def __len__(self):
+        return len(self.protocol_ids)
+
+    def _atom_info(self, index):
+        return serialize.get_decode_table().get(
+            serialize.atom_key(self.protocol_ids[index],
+                               self.atom_ids[index]),
+            serialize.UNKNOWN_ATOM_INFO)
+
+    def atom(self, index):
+        '''Return the :class:`Atom` at an index.'''
+        return self._atom_info(index).atom
+
+    def arg(self, index):
+        '''Return the argument at an index.'''
+        kind = self._kinds[index]
+
+        if kind == _ARG_BYTES:
+            offset = self.offsets[index]
+            arg = self._data[offset:offset + self.lengths[index]]
+        elif kind == _ARG_INT:
+            arg = self.offsets[index]
+        else:
+            arg = None
+
+        return self._atom_info(index).decode(arg)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+
+        return (self.atom(index), self.arg(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield (self.atom(index), self.arg(index))
+
+    def take(self, indexes):
+        '''Return a stream of the atoms at the given indexes.
+
+        The new stream shares the data of this one.
+        '''
+        stream = CompactAtomStream()
+        stream.stream_id = self.stream_id
+        stream._data = self._data
+
+        for index in indexes:
+            stream._append(self.protocol_ids[index], self.atom_ids[index],
+                           self.offsets[index], self.lengths[index],
+                           self._kinds[index])
+
+        return stream
+
+    def filter_protocol(self, atom_protocol_id):
+        '''Return a stream of the atoms of one protocol.'''
+        return self.take(
+            index for index, value in enumerate(self.protocol_ids)
+            if value == atom_protocol_id)
+
+    def to_atom_stream(self):
+        '''Return an :class:`AtomStream` holding the atoms as tuples.'''
+        atom_stream = AtomStream()
+        atom_stream.stream_id = self.stream_id
+        atom_stream.atoms = list(self)
+
+        if len(self):
+            atom_stream.atom_protocol_id = self.protocol_ids[-1]
+
+        return atom_stream
+
+    def __str__(self):
+        return '<CompactAtomStream at {} SID={} Atoms={}>'.format(
+            id(self), self.stream_id, len(self))
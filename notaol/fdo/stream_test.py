@@ -0,0 +1,61 @@
+import unittest
+
+from notaol.fdo.atomdef import Atom, AtomProtocol
+from notaol.fdo.stream import AtomStream, CompactAtomStream
+
+
+def new_atom_stream():
+    atom_stream = AtomStream()
+    atom_stream.stream_id = 0x16
+    atom_stream.atoms = [
+        (Atom.uni_start_stream,),
+        (Atom.man_set_context_relative, 1),
+        (Atom.de_data, b'asdf'),
+        (Atom.man_end_context,),
+        (Atom.de_data, b'qwerty'),
+        (Atom.uni_end_stream,),
+    ]
+    return atom_stream
+
+
+class TestCompactAtomStream(unittest.TestCase):
+    def test_parse(self):
+        for compress in (False, True):
+            data = new_atom_stream().to_bytes(compress=compress)
+            atom_stream = AtomStream()
+            atom_stream.parse(data)
+            stream = CompactAtomStream()
+            stream.parse(data)
+
+            self.assertEqual(0x16, stream.stream_id)
+            self.assertEqual(6, len(stream))
+            self.assertEqual(atom_stream.atoms, list(stream))
+            self.assertEqual(atom_stream.atoms,
+                             stream.to_atom_stream().atoms)
+
+    def test_access(self):
+        stream = CompactAtomStream()
+        stream.parse(new_atom_stream().to_bytes())
+
+        self.assertEqual(Atom.de_data, stream.atom(2))
+        self.assertEqual(b'asdf', stream.arg(2))
+        self.assertIsInstance(stream.arg(2), memoryview)
+        self.assertEqual((Atom.de_data, b'qwerty'), stream[4])
+
+        sliced = stream[1:3]
+        self.assertEqual(2, len(sliced))
+        self.assertEqual((Atom.de_data, b'asdf'), sliced[1])
+
+        de_atoms = stream.filter_protocol(AtomProtocol.DE)
+        self.assertEqual([b'asdf', b'qwerty'],
+                         [arg for atom, arg in de_atoms])
+
+    def test_bad_data(self):
+        stream = CompactAtomStream()
+
+        with self.assertRaises(IndexError):
+            stream.parse(b'\x00\x16\x00\x01\x00\x03\x01\x09as')
+
+        # Extended prefixes adding up to protocol 480.
+        with self.assertRaises(IndexError):
+            stream.parse(b'\x00\x16' + b'\xf8' * 5 + b'\x00\x01\x00')
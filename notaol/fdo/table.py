@@ -0,0 +1,308 @@
+'''Packed binary atom and token tables.
+
+The generators in :mod:`notaol.extra` can write the atom and token
+metadata as binary files. Readers map a file into memory and look up
+entries without loading the whole table.
+
+All integers are big-endian. A file starts with a header::
+
+    magic (4s) version (H) kind (H) record count (I) pool offset (I)
+
+Fixed size records sorted by key follow, then a pool of the variable
+length data that records point to.
+
+Atom records are ``protocol ID (B) atom ID (B) data type code (B)
+padding (x) name offset (I)``. The data type code is the position of the
+:class:`DataType` member in the enum. Names are stored in the pool as a
+length byte and UTF-8 text.
+
+Token records are ``token key (2s) metadata offset (I)``. The key is the
+first two bytes of the Latin-1 token padded with NUL bytes. A token may
+have several records, kept in the order they were written. Metadata is
+stored in the pool as the six :class:`TokenMetadata` fields. Each field
+is a tag byte followed by its value:
+- 0 is None.
+- 1 is a string: a 2-byte length and UTF-8 text.
+- 2 is a 4-byte signed integer.
+- 3 is a list: a count byte, then strings in the same format.
+'''
+import abc
+import collections
+import mmap
+import os
+import struct
+
+from notaol.fdo.datatype import DataType
+
+
+MAGIC = b'NOTB'
+VERSION = 1
+
+KIND_ATOMS = 1
+KIND_TOKENS = 2
+
+DATA_TYPES = tuple(DataType)
+'''Data types by code.'''
+
+# Same as notaol.fdo.tokenmeta.TokenMetadata which is slow to import.
+TokenMetadata = collections.namedtuple(
+    'TokenMetadataType',
+    ['token', 'description', 'category', 'flags', 'arg', 'form']
+)
+
+_HEADER = struct.Struct('!4sHHII')
+_ATOM_RECORD = struct.Struct('!BBBxI')
+_ATOM_KEY = struct.Struct('!H')
+_TOKEN_RECORD = struct.Struct('!2sI')
+_BYTE = struct.Struct('!B')
+_WORD = struct.Struct('!H')
+_INT = struct.Struct('!i')
+
+_TAG_NONE = 0
+_TAG_STR = 1
+_TAG_INT = 2
+_TAG_LIST = 3
+
+
+class TableError(ValueError):
+    '''The file is not a table of the expected kind.'''
+
+
+def _pack_str(pool, value):
+    data = value.encode('utf-8')
+    pool += _WORD.pack(len(data))
+    pool += data
+
+
+def _pack_field(pool, value):
+    if value is None:
+        pool.append(_TAG_NONE)
+    elif isinstance(value, str):
+        pool.append(_TAG_STR)
+        _pack_str(pool, value)
+    elif isinstance(value, int):
+        pool.append(_TAG_INT)
+        pool += _INT.pack(value)
+    else:
+        pool.append(_TAG_LIST)
+        pool.append(len(value))
+
+        for item in value:
+            _pack_str(pool, item)
+
+
+def _token_key(token):
+    return token.encode('latin-1')[:2].ljust(2, b'\x00')
+
+
+def _write_table(file, kind, records, pool):
+    pool_offset = _HEADER.size + sum(len(record) for record in records)
+    file.write(_HEADER.pack(MAGIC, VERSION, kind, len(records), pool_offset))
+
+    for record in records:
+        file.write(record)
+
+    file.write(pool)
+
+
+def write_atom_table(file, rows):
+    '''Write an atom table.
+
+    Args:
+        file: A binary file object.
+        rows: Tuples of protocol ID, atom ID, name and :class:`DataType`.
+    '''
+    pool = bytearray()
+    records = []
+
+    for atom_protocol_id, atom_id, name, data_type in sorted(rows):
+        name_data = name.encode('utf-8')
+        records.append(_ATOM_RECORD.pack(
+            atom_protocol_id, atom_id, DATA_TYPES.index(DataType(data_type)),
+            len(pool)))
+        pool += _BYTE.pack(len(name_data))
+        pool += name_data
+
+    _write_table(file, KIND_ATOMS, records, pool)
+
+
+def write_token_table(file, rows):
+    '''Write a token table.
+
+    Args:
+        file: A binary file object.
+        rows: :class:`TokenMetadata` tuples.
+    '''
+    pool = bytearray()
+    records = []
+
+    # sorted() is stable so rows of the same token keep their order.
+    for row in sorted(rows, key=lambda row: _token_key(row[0])):
+        records.append(_TOKEN_RECORD.pack(_token_key(row[0]), len(pool)))
+
+        for value in row:
+            _pack_field(pool, value)
+
+    _write_table(file, KIND_TOKENS, records, pool)
+
+
+class BinaryTable(object, metaclass=abc.ABCMeta):
+    '''Base class of memory mapped table readers.
+
+    Args:
+        path (str): The table file.
+
+    Attributes:
+        count (int): Number of records.
+    '''
+    kind = None
+    record_struct = None
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            # mmap cannot map an empty file.
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise TableError('File too short')
+
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, kind, self.count, self._pool_offset = \
+            _HEADER.unpack_from(self._map)
+
+        if magic != MAGIC or version != VERSION or kind != self.kind:
+            self.close()
+            raise TableError('Not a version {} table of kind {}'.format(
+                VERSION, self.kind))
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        '''Unmap the file.'''
+        self._map.close()
+
+    def _record_offset(self, index):
+        return _HEADER.size + index * self.record_struct.size
+
+    @abc.abstractmethod
+    def _key(self, index):
+        '''Return the sort key of a record.'''
+
+    def _bisect(self, key):
+        # Index of the first record with a key not less than `key`.
+        low = 0
+        high = self.count
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+
+class AtomTable(BinaryTable):
+    '''Reader of atom tables.'''
+    kind = KIND_ATOMS
+    record_struct = _ATOM_RECORD
+
+    def _key(self, index):
+        return _ATOM_KEY.unpack_from(self._map, self._record_offset(index))[0]
+
+    def lookup(self, atom_protocol_id, atom_id):
+        '''Return the name and :class:`DataType` of an atom or None.'''
+        key = atom_protocol_id << 8 | atom_id
+        index = self._bisect(key)
+
+        if index == self.count or self._key(index) != key:
+            return None
+
+        dummy, dummy, type_code, name_offset = _ATOM_RECORD.unpack_from(
+            self._map, self._record_offset(index))
+        offset = self._pool_offset + name_offset
+        length = self._map[offset]
+        name = self._map[offset + 1:offset + 1 + length].decode('utf-8')
+
+        return (name, DATA_TYPES[type_code])
+
+
+class TokenTable(BinaryTable):
+    '''Reader of token tables.'''
+    kind = KIND_TOKENS
+    record_struct = _TOKEN_RECORD
+
+    def _key(self, index):
+        offset = self._record_offset(index)
+        return self._map[offset:offset + 2]
+
+    def _read_str(self, offset):
+        length = _WORD.unpack_from(self._map, offset)[0]
+        offset += _WORD.size
+
+        return (self._map[offset:offset + length].decode('utf-8'),
+                offset + length)
+
+    def _read_metadata(self, offset):
+        fields = []
+
+        for dummy in TokenMetadata._fields:
+            tag = self._map[offset]
+            offset += 1
+
+            if tag == _TAG_NONE:
+                fields.append(None)
+            elif tag == _TAG_STR:
+                value, offset = self._read_str(offset)
+                fields.append(value)
+            elif tag == _TAG_INT:
+                fields.append(_INT.unpack_from(self._map, offset)[0])
+                offset += _INT.size
+            else:
+                count = self._map[offset]
+                offset += 1
+                items = []
+
+                for dummy in range(count):
+                    value, offset = self._read_str(offset)
+                    items.append(value)
+
+                fields.append(items)
+
+        return TokenMetadata(*fields)
+
+    def lookup(self, token):
+        '''Return a list of :class:`TokenMetadata` rows of a token.'''
+        key = _token_key(token)
+        index = self._bisect(key)
+        rows = []
+
+        while index < self.count and self._key(index) == key:
+            metadata_offset = _TOKEN_RECORD.unpack_from(
+                self._map, self._record_offset(index))[1]
+            row = self._read_metadata(self._pool_offset + metadata_offset)
+
+            if row.token == token:
+                rows.append(row)
+
+            index += 1
+
+        return rows
+
+    def get_description(self, token):
+        '''Return the description of the last row of a token or None.
+
+        This matches :data:`notaol.fdo.token.TOKEN_TO_DESC_MAP`.
+        '''
+        rows = self.lookup(token)
+
+        if rows:
+            return rows[-1].description
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from notaol.fdo.atomdatatype import AtomDataType
+from notaol.fdo.atomdef import Atom
+from notaol.fdo.datatype import DataType
+from notaol.fdo.table import AtomTable, TokenTable, TableError, \
+    write_atom_table, write_token_table
+from notaol.fdo.token import TOKEN_TO_DESC_MAP
+from notaol.fdo.tokenmeta import TOKEN_METADATA
+
+
+class TestTable(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'table.bin')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_atom_table(self):
+        with open(self.path, 'wb') as file:
+            write_atom_table(file, [
+                (atom.value[0], atom.value[1], atom.name,
+                 getattr(AtomDataType, atom.name))
+                for atom in Atom])
+
+        with AtomTable(self.path) as table:
+            self.assertEqual(len(Atom), len(table))
+            self.assertEqual(('de_data', DataType.str), table.lookup(3, 1))
+            self.assertEqual(('uni_start_stream', DataType.raw),
+                             table.lookup(0, 1))
+
+            for atom in Atom:
+                self.assertEqual(atom.name, table.lookup(*atom.value)[0])
+
+            self.assertIsNone(table.lookup(31, 254))
+
+        with self.assertRaises(TableError):
+            TokenTable(self.path)
+
+        for data in (b'', b'NOTB'):
+            with open(self.path, 'wb') as file:
+                file.write(data)
+
+            with self.assertRaises(TableError):
+                AtomTable(self.path)
+
+    def test_token_table(self):
+        with open(self.path, 'wb') as file:
+            write_token_table(file, TOKEN_METADATA)
+
+        with TokenTable(self.path) as table:
+            self.assertEqual(len(TOKEN_METADATA), len(table))
+
+            rows = table.lookup('DD')
+            self.assertEqual(
+                [row for row in TOKEN_METADATA if row.token == 'DD'], rows)
+            self.assertEqual(['PL', 'SP', 'NU'], rows[0].flags)
+
+            for token, description in TOKEN_TO_DESC_MAP.items():
+                self.assertEqual(description, table.get_description(token))
+
+            self.assertEqual([], table.lookup('\x00\x00'))
+            self.assertIsNone(table.get_description('\x00\x00'))
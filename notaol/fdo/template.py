@@ -0,0 +1,94 @@
+'''Precompiled atom stream templates.'''
+from notaol.fdo import serialize
+
+
+class Slot(object):
+    '''Placeholder for an atom argument given when a template is rendered.
+
+    Attributes:
+        name (str): The keyword argument that fills the slot.
+    '''
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return 'Slot({!r})'.format(self.name)
+
+
+class StreamTemplate(object):
+    '''An atom stream compiled once and rendered with different arguments.
+
+    Atoms without a :class:`Slot` argument are serialized when the template
+    is created and joined into static chunks. Rendering copies the chunks
+    and encodes only the atoms holding slots, so their length bytes follow
+    the values given.
+
+    Args:
+        atoms (list): Atom tuples as used by :attr:`AtomStream.atoms`.
+            Arguments may be :class:`Slot` instances.
+        stream_id (int): If given, the rendered bytes start with the stream
+            ID like :meth:`AtomStream.to_bytes`.
+
+    Attributes:
+        slots (frozenset): The slot names that must be given to
+            :meth:`render`.
+    '''
+    __slots__ = ('_parts', 'slots')
+
+    def __init__(self, atoms, stream_id=None):
+        self._parts = []
+        slots = set()
+
+        if stream_id is None:
+            chunk = bytearray()
+        else:
+            chunk = bytearray(serialize.serialize_stream_id(stream_id))
+
+        for item in atoms:
+            atom_def = item[0]
+            args = item[1:]
+            slot_names = [(index, arg.name) for index, arg in enumerate(args)
+                          if isinstance(arg, Slot)]
+
+            if not slot_names:
+                serialize.encode_atom(chunk, atom_def, *args)
+                continue
+
+            header, encoder = serialize.get_encoder(atom_def)
+            chunk += header
+            self._parts.append(bytes(chunk))
+            self._parts.append((encoder, args, slot_names))
+            slots.update(name for index, name in slot_names)
+            chunk = bytearray()
+
+        self._parts.append(bytes(chunk))
+        self.slots = frozenset(slots)
+
+    def render(self, **values):
+        '''Return the stream bytes with the slots filled in.
+
+        Raises:
+            ValueError: A slot value is missing or an unknown name is given.
+        '''
+        if values.keys() != self.slots:
+            raise ValueError('Expected slots {}, got {}'.format(
+                sorted(self.slots), sorted(values)))
+
+        buffer = bytearray()
+
+        for part in self._parts:
+            if isinstance(part, bytes):
+                buffer += part
+                continue
+
+            encoder, args, slot_names = part
+            args = list(args)
+
+            for index, name in slot_names:
+                args[index] = values[name]
+
+            encoder(buffer, args)
+
+        return bytes(buffer)
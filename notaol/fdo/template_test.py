@@ -0,0 +1,36 @@
+import unittest
+
+from notaol.fdo.atomdef import Atom
+from notaol.fdo.template import Slot, StreamTemplate
+from notaol.p3.login import new_login_atom_stream, render_login
+
+
+class TestStreamTemplate(unittest.TestCase):
+    def test_render(self):
+        template = StreamTemplate([
+            (Atom.uni_start_stream,),
+            (Atom.de_data, Slot('text')),
+            (Atom.man_set_context_relative, Slot('context')),
+            (Atom.uni_end_stream,),
+        ])
+
+        self.assertEqual(frozenset(['text', 'context']), template.slots)
+        self.assertEqual(
+            b'\x00\x01\x00' b'\x03\x01\x04asdf'
+            b'\x01\x0a\x04\x00\x00\x01\x2c' b'\x00\x02\x00',
+            template.render(text='asdf', context=300))
+        self.assertEqual(
+            b'\x00\x01\x00' b'\x03\x01\x00' b'\x01\x0a\x01\x02'
+            b'\x00\x02\x00',
+            template.render(text='', context=2))
+
+        with self.assertRaises(ValueError):
+            template.render(text='asdf')
+
+        with self.assertRaises(ValueError):
+            template.render(text='asdf', context=1, extra=1)
+
+    def test_login(self):
+        self.assertEqual(
+            new_login_atom_stream('user', 'password').to_bytes(),
+            render_login('user', 'password'))
@@ -1,6 +1,8 @@
+import array
+import bisect
+import collections
 import enum
-
-from notaol.fdo.tokenmeta import TOKEN_METADATA
+import struct
 
 
 class Token(enum.Enum):
@@ -8,6 +10,227 @@ class Token(enum.Enum):
     pass
 
 
-TOKEN_TO_DESC_MAP = dict([
-    (meta.token, meta.description) for meta in TOKEN_METADATA
-    ])
+TOKEN_ID_COUNT = 65536
+'''Number of possible 2 byte tokens.'''
+
+TOKEN_ID_STRUCT = struct.Struct('!H')
+'''Reads a token as its integer ID.'''
+
+
+def token_id(token):
+    '''Return the integer ID of a 2 byte or 2 character token.'''
+    if isinstance(token, str):
+        token = token.encode('latin-1')
+
+    return TOKEN_ID_STRUCT.unpack(token)[0]
+
+
+def token_from_id(token_id):
+    '''Return the 2 bytes of a token ID.'''
+    return TOKEN_ID_STRUCT.pack(token_id)
+
+
+_description_table = None
+
+
+def get_description_table():
+    '''Return the descriptions and their index for each token ID.
+
+    Returns:
+        tuple: A tuple of description strings whose first item is None,
+        and an ``array('H')`` of :data:`TOKEN_ID_COUNT` indexes into it.
+        Tokens without a description have index 0.
+    '''
+    global _description_table
+
+    if _description_table is None:
+        descriptions = [None]
+        indexes = array.array('H', bytes(2 * TOKEN_ID_COUNT))
+
+        for token, description in get_token_descriptions().items():
+            if len(token) != 2:
+                continue
+
+            indexes[token_id(token)] = len(descriptions)
+            descriptions.append(description)
+
+        _description_table = (tuple(descriptions), indexes)
+
+    return _description_table
+
+
+def get_token_id_description(token_id):
+    '''Return the description of a token ID or None.'''
+    descriptions, indexes = _description_table or get_description_table()
+
+    return descriptions[indexes[token_id]]
+
+
+def get_token_descriptions():
+    '''Return :data:`TOKEN_TO_DESC_MAP`.'''
+    return globals().get('TOKEN_TO_DESC_MAP') or _load_descriptions()
+
+
+def _load_descriptions():
+    # TOKEN_TO_DESC_MAP is loaded from the generated table on first use.
+    global TOKEN_TO_DESC_MAP
+    from notaol.fdo.tokendesc import TOKEN_DESCRIPTIONS
+
+    TOKEN_TO_DESC_MAP = TOKEN_DESCRIPTIONS
+
+    return TOKEN_DESCRIPTIONS
+
+
+def get_token_description(token):
+    '''Return the description of a token string or None.'''
+    return get_token_descriptions().get(token)
+
+
+class TokenIndex(object):
+    '''Token metadata indexed by token, category, flag and form.
+
+    Lookups return tuples of :class:`TokenMetadata` rows in the order of
+    the source list, including every row of a token that is listed more
+    than once.
+
+    Args:
+        rows: :class:`TokenMetadata` rows.
+    '''
+    def __init__(self, rows):
+        by_token = collections.defaultdict(list)
+        by_category = collections.defaultdict(list)
+        by_flag = collections.defaultdict(list)
+        by_form = collections.defaultdict(list)
+        prefixes = []
+        texts = []
+        self._text_rows = []
+        self._text_offsets = []
+        offset = 0
+
+        for row in rows:
+            by_token[row.token].append(row)
+
+            if row.category is not None:
+                by_category[row.category].append(row)
+
+            for flag in row.flags or ():
+                by_flag[flag].append(row)
+
+            if row.form is not None:
+                by_form[row.form].append(row)
+
+            if row.description:
+                text = row.description.lower()
+                prefixes.append((text, len(self._text_rows)))
+                texts.append(text)
+                self._text_rows.append(row)
+                self._text_offsets.append(offset)
+                offset += len(text) + 1
+
+        def freeze(index):
+            return dict((key, tuple(value)) for key, value in index.items())
+
+        self._by_token = freeze(by_token)
+        self._by_category = freeze(by_category)
+        self._by_flag = freeze(by_flag)
+        self._by_form = freeze(by_form)
+        self._prefixes = sorted(prefixes)
+        self._prefix_keys = [text for text, index in self._prefixes]
+        # Descriptions joined by newlines so a substring search runs as
+        # str.find over one string.
+        self._text = '\n'.join(texts)
+
+    def __len__(self):
+        return len(self._by_token)
+
+    def __contains__(self, token):
+        return token in self._by_token
+
+    def lookup(self, token):
+        '''Return the rows of a token.'''
+        return self._by_token.get(token, ())
+
+    def by_category(self, category):
+        '''Return the rows of a category.'''
+        return self._by_category.get(category, ())
+
+    def by_flag(self, flag):
+        '''Return the rows that have a flag.'''
+        return self._by_flag.get(flag, ())
+
+    def by_form(self, form):
+        '''Return the rows of a form.'''
+        return self._by_form.get(form, ())
+
+    @property
+    def categories(self):
+        return self._by_category.keys()
+
+    @property
+    def flags(self):
+        return self._by_flag.keys()
+
+    @property
+    def forms(self):
+        return self._by_form.keys()
+
+    def search(self, text, prefix=False):
+        '''Return the rows whose description contains some text.
+
+        The search ignores case. If `prefix` is True, the description must
+        start with the text.
+        '''
+        text = text.lower()
+
+        if prefix:
+            start = bisect.bisect_left(self._prefix_keys, text)
+            indexes = []
+
+            for key, index in self._prefixes[start:]:
+                if not key.startswith(text):
+                    break
+
+                indexes.append(index)
+
+            return tuple(self._text_rows[index] for index in sorted(indexes))
+
+        rows = []
+        offset = self._text.find(text)
+
+        while offset >= 0:
+            index = bisect.bisect_right(self._text_offsets, offset) - 1
+            rows.append(self._text_rows[index])
+
+            # Continue after this description.
+            if index + 1 == len(self._text_offsets):
+                break
+
+            offset = self._text.find(text, self._text_offsets[index + 1])
+
+        return tuple(rows)
+
+
+_token_index = None
+
+
+def get_token_index():
+    '''Return the :class:`TokenIndex` of all token metadata.
+
+    The index is built on first use.
+    '''
+    global _token_index
+
+    if _token_index is None:
+        from notaol.fdo.tokenmeta import TOKEN_METADATA
+
+        _token_index = TokenIndex(TOKEN_METADATA)
+
+    return _token_index
+
+
+def __getattr__(name):
+    if name == 'TOKEN_TO_DESC_MAP':
+        return _load_descriptions()
+
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
@@ -0,0 +1,77 @@
+import unittest
+
+from notaol.fdo import token
+from notaol.fdo.tokenmeta import TOKEN_METADATA, TokenMetadata
+
+
+class TestToken(unittest.TestCase):
+    def test_descriptions(self):
+        self.assertEqual('Initial login pkt (form based)',
+                         token.get_token_description('Dd'))
+        self.assertIsNone(token.get_token_description('\x00\x00'))
+
+    def test_token_id(self):
+        self.assertEqual(0x4464, token.token_id(b'Dd'))
+        self.assertEqual(0x4464, token.token_id('Dd'))
+        self.assertEqual(b'Dd', token.token_from_id(0x4464))
+        self.assertEqual('Initial login pkt (form based)',
+                         token.get_token_id_description(0x4464))
+        self.assertIsNone(token.get_token_id_description(0))
+
+        descriptions, indexes = token.get_description_table()
+        self.assertEqual(token.TOKEN_ID_COUNT, len(indexes))
+        self.assertIsNone(descriptions[0])
+
+    def test_generated_table(self):
+        # tokendesc.py must be regenerated when tokenmeta.py changes.
+        self.assertEqual(
+            dict((meta.token, meta.description) for meta in TOKEN_METADATA),
+            token.TOKEN_TO_DESC_MAP)
+
+
+class TestTokenIndex(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            TokenMetadata('AA', 'Normal chat message', None, None, None,
+                          None),
+            TokenMetadata('AB', 'Chat message with name', 'Chat', ['PL'],
+                          None, 'chat'),
+            TokenMetadata('AA', 'Various methods of Chat Send', 'Chat',
+                          ['PL', 'SP'], 1, None),
+            TokenMetadata('Dd', 'Initial login pkt', 'Login', None, None,
+                          'login'),
+        ]
+        self.index = token.TokenIndex(self.rows)
+
+    def test_lookup(self):
+        self.assertEqual((self.rows[0], self.rows[2]),
+                         self.index.lookup('AA'))
+        self.assertEqual((), self.index.lookup('ZZ'))
+        self.assertIn('Dd', self.index)
+        self.assertEqual(3, len(self.index))
+
+    def test_secondary(self):
+        self.assertEqual((self.rows[1], self.rows[2]),
+                         self.index.by_category('Chat'))
+        self.assertEqual((self.rows[1], self.rows[2]),
+                         self.index.by_flag('PL'))
+        self.assertEqual((self.rows[2],), self.index.by_flag('SP'))
+        self.assertEqual((self.rows[3],), self.index.by_form('login'))
+        self.assertEqual({'Chat', 'Login'}, set(self.index.categories))
+
+    def test_search(self):
+        self.assertEqual((self.rows[0], self.rows[1], self.rows[2]),
+                         self.index.search('CHAT'))
+        self.assertEqual((self.rows[1],),
+                         self.index.search('chat m', prefix=True))
+        self.assertEqual((self.rows[3],),
+                         self.index.search('login'))
+        self.assertEqual((), self.index.search('xyz'))
+
+    def test_full_index(self):
+        index = token.get_token_index()
+
+        self.assertIs(index, token.get_token_index())
+        self.assertEqual(
+            [row for row in TOKEN_METADATA if row.token == 'DD'],
+            list(index.lookup('DD')))
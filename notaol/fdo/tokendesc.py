@@ -0,0 +1,2276 @@
+# This file was automatically generated by process_token_desc.py.
+# Do not edit!
+
+TOKEN_DESCRIPTIONS = {
+    'AA': 'Various methods of Chat Send',
+    'AB': 'Chat message with name',
+    'AC': 'Chat message with count',
+    'AD': 'disable music (Rm/Aud)',
+    'CA': 'Add club member',
+    'CB': 'Message Box - "Form is not in a valid format."',
+    'D3': 'Message Box - "This area of America Online is no longer available."',
+    'OT': 'Display Alert Message',
+    'XS': 'Force Off and Hang up',
+    'hO': 'Luanch a PC Game',
+    'D*': 'Disconnect',
+    '**': 'P3 Release - Not used any longer',
+    'tj': "The packet contains info about file we're getting ready to download",
+    'ta': 'file flags, count, size, and filename to be D/Led',
+    'tf': 'receive D/L file; host requests immediate xG ack (?????)',
+    'F8': 'receive D/L file; host requests immediate xG ack',
+    'FF': 'QLink - Ack download block',
+    'F7': 'receive D/L file; no immediate ack required',
+    'F9': 'receive D/L file; this is the last packet of the file',
+    'fX': 'Upload Token',
+    'tN': 'Mail download - got file name',
+    'tt': 'send URL to compan info',
+    'td': 'Upload Token',
+    'th': 'Upload Token',
+    'ti': 'Upload Token',
+    'tc': 'Upload Token',
+    'tx': 'Message Box - "Highlight a line of data in the list and try again."',
+    'f2': 'request dod',
+    'ff': 'New-style DOD request',
+    'ft': 'process vrm aat pict header',
+    'fh': 'hinting something or other',
+    'AN': '"Send Answer" button',
+    'ET': 'Phone Home report',
+    'Wh': 'Client received ACK for INIT and is secure',
+    'Wk': 'Acknowledgement for Wh',
+    'Wd': 'Encrypted version of Dd token',
+    'Tu': 'Message Box - "An error occurred while AOL was updating your software. Please try again."',
+    'SD': 'Go ahead after INIT',
+    'ya': 'to be determined',
+    'at': '"Continue" button',
+    'At': 'Log in confirmed',
+    'AT': 'Log in ???',
+    'gv': 'All casino games special tokens',
+    '$A': 'Add product to shopping cart',
+    '$B': '"Continue" button on Credit Card Information form',
+    '$C': 'Begin checkout process',
+    '$D': 'Delete product from cart',
+    '$F': '"Use Credit Card" button on Your Choice Of Billing Method form',
+    '$I': 'Show store information',
+    '$L': 'List items in shopping cart',
+    '$M': '"Continue" button on Shipping Information form',
+    '$P': 'Show product desc',
+    '$S': '"Continue" on Your Shopping Cart screen',
+    '$V': '"Review/Delete Item" button on your shopping cart form',
+    '$b': '"Bill to My Account" on Your Choice Of Billing Method form',
+    '$d': 'Delete product from cart',
+    '$f': 'Request clerk form',
+    '$E': '"Continue" button on $W',
+    '$G': 'get_product(ext id appd to ft 1)',
+    '$Q': '"Continue" button on the form that "Modify Option" takes you to',
+    '$R': 'retrieve_product(int_id=hard_cod',
+    '$a': 'add_store',
+    '$c': '"Review Cart" button on $i',
+    '$e': '"Remove Item From Cart" on $W',
+    '$g': 'request_id',
+    '$h': 'process_screen',
+    '$i': '"AOL Shop - Credit Card information',
+    '$j': '"Previous Screen" button on the form that "Modify Option" takes you to',
+    '$k': 'process_checkout',
+    '$l': 'process_list_option',
+    '$m': 'modify_store',
+    '$n': 'remove_from_cart_screen',
+    '$o': '"Modify Option" button on $W',
+    '$p': 'display_product_summary',
+    '$r': 'process_radio_option',
+    '$s': 'display_about_this_store',
+    '$t': 'process_text_option',
+    '$u': 'copy from_bill_to',
+    '$v': '"Continue" button on Shipping Information form',
+    '$w': 'display_previous_screen',
+    '$x': 'request_cc_info',
+    '$y': '"Continue" button on $i',
+    '$z': '"Continue" button on Credit Card Address form',
+    '$W': 'Shopping Direct form. Must go to $G to gain access to this form',
+    '$X': '"Back to Shopping" button on $i',
+    '$Y': 'not yet decided',
+    '$Z': 'not yet decided',
+    'dM': 'Set domain - message board',
+    'eT': 'Start mail text entry',
+    'C1': 'Old Collection',
+    'C2': '"More" button',
+    'C3': 'Old Collection',
+    'C4': 'Live wire',
+    'C5': 'Disable live wired',
+    'C6': 'Reset collman domain',
+    'C7': 'Show "where" info',
+    'Ct': 'Start Flashsession?',
+    'Ca': 'Rainman Areas',
+    'Cb': '"More" button on Ca forms.',
+    'Cc': 'Request latest stories',
+    'Cd': 'Sign up for Live Wire',
+    'Ce': 'Cancel LiveWire registration',
+    'Cf': 'Reset collman2 domain',
+    'Cg': 'Open Coll info for Edit',
+    'Ch': 'Modify Coll info',
+    'Ci': 'Act on named collection',
+    'Cj': 'Convert Overwrite Confirm',
+    'Ck': 'Send collman form',
+    'Cm': 'Display item for edit',
+    'Cn': 'Cut item from collection',
+    'Co': 'Copy item from collection',
+    'Cp': 'Paste item (above) to collection',
+    'Cq': 'Paste item (below) to collection',
+    'Cr': 'Start add item to collection',
+    'Cs': 'Add/Update item data',
+    '&1': 'display acct page 1',
+    '&2': 'display acct page 2',
+    '&3': 'display acct page 3',
+    '&4': 'select credit reason',
+    '&5': 'select credit type',
+    '&B': 'print detail bill',
+    '&C': 'Message Box - "Internal error - message logged."',
+    '&E': 'write new credit',
+    '&F': 'send form with pop',
+    '&G': 'update cc info',
+    '&H': 'add history',
+    '&K': 'write new credit',
+    '&L': 'select acct from list',
+    '&M': 'load menu selection',
+    '&N': 'write sw order',
+    '&P': 'update payment info',
+    '&S': 'search for account',
+    '&T': 'generate certificate',
+    '&U': 'update certificate',
+    '&a': 'update address',
+    '&b': 'display detail bill',
+    '&c': 'display credit',
+    '&d': 'display payment info',
+    '&e': 'select credit reason',
+    '&f': 'Message Box - "Internal error (context)"',
+    '&g': 'display cc info',
+    '&h': 'display history',
+    '&j': 'display online status',
+    '&k': 'Display Price Plan Description',
+    '&m': 'display menu',
+    '&n': 'select sw order type',
+    '&o': 'display order',
+    '&p': 'load pay list selection',
+    '&q': 'update comment',
+    '&r': 'write resubmit',
+    '&t': 'display certificate',
+    '&u': 'update passwords',
+    '&v': 'update privileged',
+    '&w': 'update acct status',
+    '&x': 'make internal',
+    '&y': 'make overhead',
+    '&z': 'bump acct',
+    'ZA': 'c64 user answered question',
+    'ZC': 'c64 user cancel current dialog',
+    'ZK': "c64 user couldn't accept ZM",
+    'ZN': 'c64 user replied NO to question',
+    'ZO': 'c64 user accept ZM & continue',
+    'ZY': 'c64 user replied YES to question',
+    'eX': 'Mail download complete',
+    'xA': 'Download - abort',
+    'xB': 'Completed one file in album',
+    'xC': 'Completed LAST file in album',
+    'xG': 'Download - go ahead',
+    'NA': 'same as Na with escaping',
+    'NB': 'update location with escaping',
+    'NC': 'broadcast info with escaping',
+    'ND': 'identify user with escaping',
+    'NE': 'read user with escaping',
+    'NF': 'write user with escaping',
+    'NG': 'read reg loc with escaping',
+    'NH': 'read reg nolock with escaping',
+    'NI': 'write region with escaping',
+    'NL': 'send time with escaping',
+    'NM': 'send info with escaping',
+    'NP': 'same as Np with escaping',
+    'NW': 'same as Nw with escaping',
+    'NX': 'user exit with escaping',
+    'Na': 'D&D 2.0 entry token',
+    'Nb': 'D&D 2.0 update location token',
+    'Nc': 'D&D 2.0 broadcast info token',
+    'Nd': 'D&D 2.0 identify user token',
+    'Ne': 'D&D 2.0 read user record token',
+    'Nf': 'D&D 2.0 write user record token',
+    'Ng': 'D&D 2.0 read & lock region token',
+    'Nh': 'D&D 2.0 read region w/o lock',
+    'Ni': 'D&D 2.0 re-write region token',
+    'Nj': 'D&D 2.0 send pathname token',
+    'Nk': 'D&D 2.0 current timestamp token',
+    'Nl': 'D&D 2.0 quest message token',
+    'Nm': 'D&D 2.0 quest completed token',
+    'Nn': 'D&D 2.0 save and quit token',
+    'No': 'D&D 2.0 send direct chat',
+    'Np': 'D&D 2.0 notify nearby new stats',
+    'Nt': 'NWN2.0: gen4 List users/Lounge',
+    'Nu': 'D&D 2.0 alternate load game',
+    'Nv': 'debug info from D&D 2.0',
+    'Nw': 'D&D 2.0 list users from lounge',
+    'Nx': 'D&D 2.0 exit token',
+    'Ny': 'D&D 2.0 god tools token',
+    'Nz': 'D&D 2.0 locking error token',
+    '0*': 'route to AA good thru 3/31',
+    'Y0': 'Establish gateway connection',
+    'Y1': 'Message Box - "You are disconnected from the gateway host."',
+    'Y2': 'Message Box - "You are disconnected from the gateway host."',
+    'Y3': 'Continue sending data (pos ack)',
+    'Y4': 'Leaving gateway due to reset',
+    'Y5': 'Multi pkt gateway input',
+    'Y6': 'Message Box - "You are disconnected from the gateway host."',
+    'Y7': 'Send input to managing host',
+    'Y8': 'Message Box - "Form not defined."',
+    'yn': 'gng list articles',
+    'yo': 'gng download article',
+    'yp': 'gng post article',
+    'ga': 'Set video mode for game',
+    'gb': 'List box for Extra Turn Mode',
+    'gc': 'Current pathname for this game',
+    'gd': 'Database update return token',
+    'gg': 'Request for game load',
+    'gi': 'Initial application "hello" msg',
+    'gl': 'Load request for applications',
+    'gm': 'Modify current game pathname',
+    'gn': 'New DB rec creation response tkn',
+    'go': 'Check-file status return code',
+    'gp': 'Send back pathname fopr load now',
+    'gt': 'Test item for GUS functions',
+    'gu': 'Application user response msg',
+    'gw': 'List Terminal Warrior rooms',
+    'gx': 'Exit and unload application',
+    'wa': 'Set video mode for game - gen4',
+    'wf': 'request gus_win form',
+    'wg': 'Request for windows game load',
+    'wl': 'Load request for gen4 apps',
+    'wm': 'Set mouse for game - gen 4',
+    'Ic': 'Message Box - "Invalid search request."',
+    'Ie': 'Message Box - "Invalid search request."',
+    'Im': 'Message Box - "Invalid search request."',
+    'Iq': 'Message Box - "Invalid search request."',
+    'Ir': 'Reset Invert server domain',
+    'Is': '"Search" button',
+    'It': 'Message Box - "Invalid search request."',
+    'Ix': 'Message Box - "Invalid search request."',
+    'yb': 'to be determined',
+    'yc': 'to be determined',
+    'yd': 'to be determined',
+    'ye': 'to be determined',
+    'CE': 'edit club members',
+    'CL': 'generate owned club list',
+    'CR': 'Remove club member',
+    'TA': 'add new page',
+    'TD': 'delete last page',
+    'TE': 'Open existing text record',
+    'TF': 'Message Box - "This area of America Online is no longer available."',
+    'TL': 'List edittable text records',
+    'TN': "Open 'empty' text edit window",
+    'TP': 'Replace text in chain',
+    'TS': 'Edit text by lib record number',
+    'TT': 'edit library record title',
+    'TU': 'Update text record',
+    'Td': 'confirm deletion',
+    'Tf': 'Message Box - "This area of America Online is no longer available."',
+    'Tp': 'edit text in chain',
+    'Ts': 'Replace text by lib record #',
+    'Tt': 'update library title',
+    'V2': 'delete last page',
+    'V4': 'edit title',
+    'V5': 'update text',
+    'V6': 'add new page',
+    'V7': 'complete delete',
+    'V8': 'edit text pages',
+    'V9': 'update title',
+    'VA': 'add to menu',
+    'VB': 'move to bottom of menu',
+    'VD': 'move down in menu',
+    'VE': 'edit menu item',
+    'VI': 'replace menu text',
+    'VJ': 'edit menu text',
+    'VL': 'menu list',
+    'VM': 'menu edit',
+    'VR': 'remove from menu',
+    'VT': 'move to top of menu',
+    'VU': 'move up in menu',
+    'Va': 'Add club member',
+    'Ve': 'Get club modify info',
+    'Vl': 'List owned clubs',
+    'Vm': 'List members',
+    'Vr': 'Replace club member',
+    'K0': 'Message Box - "Internal error."',
+    'K1': 'Message Box - "Internal error."',
+    'K2': 'Message Box - "Internal error."',
+    'K3': 'Message Box - "Internal error."',
+    'K5': 'Message Box - "Internal error."',
+    'K6': 'Message Box - "Internal error."',
+    'K7': 'Message Box - "Internal error."',
+    'K8': 'Message Box - "Internal error."',
+    'KI': 'QLINK, Cont scan of subj (Lib)',
+    'KJ': 'QLINK, Abort srch of subj (Lib)',
+    'KL': 'QLINK, Last line file (Lib)',
+    'KP': 'QLINK, Get doc 4 software (Lib)',
+    'KQ': 'QLINK, Start a suggestion (Lib)',
+    'KS': 'QLINK, For obs vers Q2 - like K1',
+    'KT': 'QLINK, For obs vers Q2 - like K1',
+    'KW': 'QLINK, Srch subj lst for brd/lib',
+    'KX': 'Request a Library record',
+    'Kc': 'Request lib rec (with prepop)',
+    'Ki': 'Access area via promoter keyword',
+    'Kj': 'Access area via dir svcs keyword',
+    'Kk': 'Go to Keyword',
+    'Kn': 'Cont sending text - gen 4',
+    'k*': 'General Library tokens',
+    'F1': 'QLink - Start upload',
+    'F2': 'QLink - Upload data',
+    'F3': 'QLink - Upload last data',
+    'F4': 'QLink - Start download',
+    'FK': 'QLink - Abort transfer',
+    'FO': 'QLink - Ack download block',
+    'MD': 'Give/Switch to Loader',
+    'MF': 'Give/Switch to Loader',
+    'eW': 'mark mail deleted - pre gen4',
+    'ew': 'Mark mail_deleted',
+    'oW': 'Message Box - "An internal error has occurred. Please try again later."',
+    'ow': 'Mark Outbox Deleted (form mail)',
+    'LN': 'Message Box - "This area of America Online is no longer available."',
+    'LX': 'Message Box - "This area of America Online is no longer available."',
+    'LY': 'Message Box - "This area of America Online is no longer available."',
+    'Ln': 'Locate Member',
+    'TM': 'Time Online',
+    'ct': "Who's Chatting - Town Square Room",
+    'g&': 'Send user-config form',
+    'g0': 'Switch current mbox domain',
+    'g1': 'Message Box - "The e-mail address notification feature is only available to members who upgrade to (or migrate to) the CompuServe 2000 software."',
+    'g2': 'View currently loaded group',
+    'g3': 'OK button on remove-user form',
+    'g4': 'Toggle sender_list on custom',
+    'g5': 'OK btn - transfer ownership',
+    'g6': 'Edit form letter',
+    'g7': 'Toggle en/disabled - form letter',
+    'g8': 'Delete form letter',
+    'g9': 'Send btn on edit form ltr',
+    'gA': 'Add new group address',
+    'gB': 'List members/mgrs/senders for gp',
+    'gC': 'Create new group addr',
+    'gD': 'Delete Gruop',
+    'gE': 'Edit mailbox configuration',
+    'gF': 'Set Form Letters for Groups',
+    'gG': 'Save group config changes',
+    'gH': 'Remove user from list',
+    'gI': 'Manage Specific Mbox (super)',
+    'gJ': 'Send subscription req form',
+    'gK': 'Mgr processes current request',
+    'gL': 'List group/special mboxes',
+    'gM': 'Manage selected mailbox',
+    'gN': 'Accept new group name',
+    'gO': 'Mgr get next request',
+    'gP': 'Request delegation form',
+    'gQ': 'Set delegation info',
+    'gR': 'Remove user from group',
+    'gS': 'Save custom group config',
+    'gT': 'Transfer ownership of group',
+    'gU': 'Unsubscribe to group',
+    'gV': 'View Group mbox info',
+    'gW': 'Stop delegation',
+    '2d': '"Pardon the delay, this feature is temporarily closed for maintenance or improvements. Please try again later."',
+    '2r': '"Pardon the delay, this feature is temporarily closed for maintenance or improvements. Please try again later."',
+    '2u': '"Pardon the delay, this feature is temporarily closed for maintenance or improvements. Please try again later."',
+    '2v': '"Pardon the delay, this feature is temporarily closed for maintenance or improvements. Please try again later."',
+    'jD': 'Delete from member_dir (part 2)',
+    'jR': 'Edit Your Profile',
+    'jU': 'Delete Profile Information?',
+    'jV': 'Update Profile',
+    'jd': 'Delete Profile',
+    'jr': 'Start profile add or mod',
+    'ju': 'User says delete profile',
+    'jv': '"OK" button',
+    '2i': 'Get member profile',
+    '2w': 'View own Profile',
+    'Id': 'Get Member Profile',
+    'id': 'Get Profile',
+    'jI': 'Get Member Profile',
+    'jW': 'View Own Profile',
+    'ji': 'Get Member Profile',
+    'jw': 'View Own Profile',
+    '2c': 'reset a2k_search domain',
+    '2e': 'Message Box - "INTERNAL ERROR"',
+    '2m': 'more AOL2000 search results',
+    '2s': 'search AOL2000 database',
+    'jL': 'Find users by Last name',
+    'jS': 'jA, jS',
+    'RA': 'Show name info for modify',
+    'RB': 'Display Billing List',
+    'RC': 'Modify checking acct info',
+    'RF': 'Current Billing Summary',
+    'RN': 'Modify name info',
+    'RP': 'Password validation',
+    'RT': 'Message Box - "This function is not available at present"',
+    'Ra': 'Change Current Pricing Plan',
+    'Rc': 'Modify credit card info',
+    'Rf': 'Display autorep form',
+    '%*': 'bb_ip_search tokens',
+    'RD': 'Request detail bill',
+    'RS': 'Current Bill Summary',
+    'RE': 'Request formless billing summary',
+    'b$': 'display message with replace',
+    'b&': 'display original msg w/ replace',
+    'b+': 'request to add an owner',
+    'b,': 'update rights',
+    'b-': 'request to delete an owner',
+    'b.': 'tool, disp container phrase upd',
+    'b/': 'show owners',
+    'b3': 'send tool "status" form',
+    'b4': 'udpated Title/Description',
+    'b5': 'show parents w/o req. owner acc',
+    'b7': 'edit title',
+    'b8': 'edit description',
+    'b9': 'edit owner rights',
+    'b:': 'edit title',
+    'b;': 'edit_description',
+    'b<': 'delete an owner',
+    'b=': 'confirm reply message delete',
+    'b>': 'add an owner',
+    'b?': 'enter tools area, use old forms',
+    'b@': 'application disabled button',
+    'bC': 'create a container standalone',
+    'bG': 'resequence info',
+    'bI': 'change status to hidden',
+    'bJ': 'move info',
+    'bK': 'delink form',
+    'bL': 'insert info',
+    'bM': 'display message without replace',
+    'bN': 'display message with replace',
+    'bT': 'tool_cc_update',
+    'bV': 'change status to released',
+    'bX': 'change status to deleted',
+    'bY': 'confirm message delete',
+    'b[': 'tools - get phrase for container',
+    'b\\': 'change reply status to released',
+    'b]': 'tools, upd & commit cntnr phrase',
+    'b_': 'enter tools area with replies',
+    'b`': 'change reply status to deleted',
+    'bb': 'toggle display fifo',
+    'bc': 'create a container child',
+    'be': 'Edit Title/Description',
+    'bf': 'create a folder',
+    'bg': 'send resequence form to user',
+    'bh': 'move confirmation',
+    'bi': 'change node status to hidden',
+    'bj': 'move form',
+    'bk': 'delink form',
+    'bl': 'invert form',
+    'bn': 'cancel link tool lock',
+    'bp': 'show parents',
+    'bt': 'get & lck container hdr for mods',
+    'bu': 'verify accessibility',
+    'bv': 'change node status to unread',
+    'bw': 'mk container "store" node (root)',
+    'bx': 'change node status to deleted',
+    'by': 'confirm container delete',
+    'b{': 'toggle display fifo of thread',
+    'b|': 'display message with replace',
+    'b~': 'change reply status to hidden',
+    'q@': 'build search database',
+    'bF': 'send_bboard_form',
+    'b!': 'display reply messages',
+    'b#': 'open folder with list of replies',
+    'b%': 'more folder menu',
+    'b(': 'browse_new_threads',
+    'b0': 'more_find_new',
+    'b1': 'browse new',
+    'b2': 'more find new',
+    'b6': 'more_new_threads',
+    'bA': 'current_container',
+    'bE': 'Enter msg board',
+    'bO': 'open_folder',
+    'bS': 'send_find_since_form',
+    'bU': 'pop_cc_context',
+    'bW': 'open_folder',
+    'bZ': 'more folder menu',
+    'b^': 'find_new_thread',
+    'ba': 'enter the folder with tools',
+    'bm': 'Jump to board',
+    'bo': 'open_folder',
+    'bq': 'Read 1st New',
+    'br': 'find_new_now',
+    'bs': 'find_since',
+    'bz': 'more_container_menu',
+    'b}': 'enter the folder with tools',
+    'z$': 'display reply board read',
+    'z&': 'orig. msg. board read',
+    'zM': 'board read disp. msg',
+    'zN': 'board read disp. next',
+    'z|': 'repl. reply disp. board read',
+    'zF': 'post message',
+    'zR': 'post response',
+    'ma': 'No longer functioning board functions',
+    'mb': 'No longer functioning board functions',
+    'mc': 'No longer functioning board functions',
+    'md': 'No longer functioning board functions',
+    'mu': 'Add message to new boards folder',
+    'gr': 'All special cashier tokens',
+    'ge': 'Transfer chips',
+    'gh': 'Show leader boards',
+    'gj': 'Show cashier form',
+    'gs': 'Show user balance',
+    'gY': 'Request personal ignore list',
+    'gZ': 'Request delegate form',
+    'mS': 'Send Stratus line-25 msg',
+    'eD': 'Download file attached to mail',
+    'ed': 'Download method for MIP',
+    'ek': 'download direct by mail id',
+    'eq': 'Add attached mail file to queue',
+    'm0': 'Flash Mail?',
+    'ou': 'PCAO unsend',
+    'ef': 'Form driven mail token',
+    'eL': 'Request to list unread mail',
+    'eM': 'Mail menu continue',
+    'eN': 'Read "next" mail message',
+    'eO': 'List old mail',
+    'el': 'List unread mail - use MIP',
+    'eo': 'List old mail - use MIP',
+    'ep': 'Display previous mail message',
+    'm7': 'Flash Mail?',
+    'm8': 'List outbound mail w/atoms',
+    'm9': 'List read mail w/atoms',
+    'oL': 'Outbox - starting list',
+    'oO': 'Outbox - continue listing',
+    'ol': 'Get outbox list - use MIP',
+    'e0': 'Initiate form-based forward',
+    'e3': 'New message board comment',
+    'e4': 'Answer author only',
+    'e5': 'mail_read domain',
+    'e8': 'Read mail for View Description',
+    'eC': 'Continue mail_read',
+    'eR': 'Read mail',
+    'eb': 'Read mail, no header info',
+    'ec': 'Continue sending mip mail',
+    'eg': 'Read mail, show no Next btn',
+    'eh': 'Read from outbox',
+    'er': 'Read mail - use MIP',
+    'ev': 'Make unread - pre gen4',
+    'ex': 'Method to mark read w/o read MIP',
+    'ey': 'Mark mail read w/o read via atom',
+    'ez': 'Mark mail unread',
+    'm3': 'atomized mail read (WAOL)',
+    'm6': 'Read mail',
+    'oI': 'Message Box - "This area of America Online is no longer available."',
+    'oR': 'Message Box - "That message is no longer available."',
+    'oS': 'Mail Status',
+    'oU': 'Unsend Mail',
+    'or': 'Message Box - "An internal error has occurred. Please try again later."',
+    'os': 'Get status - MIP format',
+    'af': '"Continue" button',
+    'e1': 'New form mail header',
+    'e2': 'New form mail file header',
+    'e9': 'Send header on forward',
+    'eI': 'Email - file info for upload',
+    'm4': 'Start atom mail',
+    'm5': 'Send atom mail text',
+    'mB': 'Message Box - "An internal error has occurred. Please try again later."',
+    'mC': 'Message Box - "This area of America Online is no longer available."',
+    'mT': 'Message Interchange Protocol pkt',
+    'Da': "Initiate 'walkaround' pw change",
+    'Dc': '"Change Password" button',
+    'Ds': "Set new 'walkaround' password",
+    'Dx': "Turn 'walkaround' password off",
+    'n@': 'update parental control',
+    'nA': 'add subaccount name',
+    'nC': 'Interactive Communications Cntl',
+    'nD': 'delete subaccount name',
+    'nJ': 'process_new_master_sn_form',
+    'nM': 'add new subact to member dir',
+    'nP': '"Set Password" on set password form',
+    'nR': 'Refresh lcl db with user list',
+    'nU': 'update disk profile',
+    'nZ': '"Cancel" on any of the screen name functions',
+    'na': 'Start sub-acct add',
+    'nc': 'Request create name form',
+    'nd': 'Request delete name form',
+    'ni': 'Request chat control form',
+    'nj': 'send user preferences form',
+    'nk': 'process user preferences form',
+    'nl': 'send_user_spotlight',
+    'nm': 'process user spotlight',
+    'nn': 'send kids only form',
+    'no': 'process kids only',
+    'np': 'process user close form',
+    'nr': 'Process parental controls form',
+    'nz': 'process usr cancl kids-only form',
+    '*T': 'Message Box - "This area of America Online is no longer available"',
+    'ID': 'Message Box - "This area of America Online is no longer available."',
+    'K4': 'Message Box - "Internal error."',
+    'MZ': 'Message Box - "This area of America Online is no longer available."',
+    'Sb': 'Message Box - "This area of America Online is no longer available."',
+    'Sr': 'Message Box - "This area of America Online is no longer available."',
+    'Ss': 'Message Box - "This area of America Online is no longer available."',
+    'a1': 'Message Box - "This area of America Online is no longer available."',
+    'a4': 'Message Box - "This area of America Online is no longer available."',
+    'e6': 'Address book header',
+    'e7': 'Address book header (file xfer)',
+    'eA': 'get list of released files',
+    'eE': 'Remote upload request',
+    'eH': 'Start remote upload',
+    'eP': 'description for file folder',
+    'eQ': 'apple_file_info for multi-file',
+    'eU': 'Mac file name for email upload',
+    'gf': 'Message Box - "This area of America Online is no longer available."',
+    'h1': 'Message Box - "This area of America Online is no longer available."',
+    'h2': 'Message Box - "This area of America Online is no longer available."',
+    'h3': 'Message Box - "This area of America Online is no longer available."',
+    'h4': 'Message Box - "This area of America Online is no longer available."',
+    'hN': 'Next hidden topic/file',
+    'hP': 'Message Box - "This area of America Online is no longer available."',
+    'iM': 'Message Box - "This area of America Online is no longer available."',
+    'iQ': 'Cancel sending of IM',
+    'jE': 'Close search form',
+    'jM': 'List More users from prev. searc',
+    'jX': 'Add name to member_dir (II)',
+    'jY': 'Add/Modify Profile part 4',
+    'jZ': 'Add/Modify Profile part 5',
+    'je': 'Edit Your Profile',
+    'jf': 'Update Profile',
+    'jl': 'Delete Profile Information?',
+    'jm': 'Delete Profile',
+    'js': 'Close/Cancel button',
+    'jx': '"OK" button',
+    'jy': '"OK" button',
+    'jz': 'Send modify form',
+    'm2': 'Keep Mail as New/Delete Mail?',
+    'mA': 'Message Box - "This area of America Online is no longer available."',
+    'mE': 'Message Box - "This area of America Online is no longer available."',
+    'mG': 'Message Box - "This area of America Online is no longer available."',
+    'mH': 'Message Box - "This area of America Online is no longer available."',
+    'mN': 'Start atom mail',
+    'mP': 'Message Box - "This area of America Online is no longer available."',
+    'mU': 'Message Box - "This area of America Online is no longer available."',
+    'mV': '"Cancel" button',
+    'mX': 'Message Box - "This area of America Online is no longer available."',
+    'mf': 'No longer functioning board functions',
+    'ml': 'No longer functioning board functions',
+    'mo': 'No longer functioning board functions',
+    'qQ': 'Trade plus - get stock price',
+    'qS': 'Trade plus - get stock symbol',
+    'rF': 'Message Box - "This area of America Online is no longer available."',
+    'rL': 'play station',
+    'rM': 'description of station',
+    'rN': 'radio program schedule',
+    'rP': 'preset station',
+    'rS': 'Message Box - "This area of America Online is no longer available."',
+    'rU': 'Message Box - "This area of America Online is no longer available."',
+    'rV': 'Message Box - "This area of America Online is no longer available."',
+    'rX': 'Message Box - "This area of America Online is no longer available."',
+    'rY': 'Message Box - "This area of America Online is no longer available."',
+    'rZ': 'Message Box - "This area of America Online is no longer available."',
+    'tF': 'Message Box - "This area of America Online is no longer available."',
+    'sk': 'Message Box - "This area of America Online is no longer available."',
+    'tO': 'Message Box - "This area of America Online is no longer available."',
+    'uD': 'Message Box - "This area of America Online is no longer available."',
+    'uF': 'Message Box - "This area of America Online is no longer available."',
+    'uI': 'Message Box - "This area of America Online is no longer available."',
+    'uP': 'Message Box - "This area of America Online is no longer available."',
+    'uU': 'Message Box - "This area of America Online is no longer available."',
+    'vn': 'Message Box - "This area of America Online is no longer available."',
+    'pa': '"Add to Portfolio" button',
+    'pd': '"Remove from Portfolio"',
+    'pf': 'Portfolio Summary',
+    'pg': 'Message Box - "Internal error - please close and redisplay the window."',
+    'ph': 'Message Box - "Your portfolio has nothing in it."',
+    'pi': 'mp create new portfolio',
+    'pk': '"Details"',
+    'pl': 'Get Stock Information',
+    'pm': 'display more search sym db hits',
+    'pp': '"OK" button',
+    'pq': '"Get Guote" button',
+    'pr': 'rqst to send a form',
+    'ps': '"Seach by Company" button',
+    'px': '"Remove" button',
+    'D5': 'Message Box - "This area of America Online is no longer available."',
+    'D6': 'Confirm password updated',
+    'D9': 'Message Box - "This area of America Online is no longer available."',
+    'DD': 'Initial login packet',
+    'Db': 'Accepted AOL conversion.',
+    'Dd': 'Initial login pkt (form based)',
+    'De': 'Message Box - "This area of America Online is no longer available."',
+    'Dg': '"OK" on Sign On Guest form',
+    'Di': 'Message Box - "This area of America Online is no longer available."',
+    'Dl': '"Continue" on Connection Information form',
+    'Dp': '"OK" on Invalid Password form',
+    'LO': 'Sign Offline',
+    'd5': 'Message Box - "This area of America Online is no longer available."',
+    'd6': 'Password update complete',
+    'pU': 'Message Box - "This area of America Online is no longer available."',
+    'u2': 'Disk update complete sent by pc',
+    'd7': 'Message Box - "This area of America Online is no longer available."',
+    'pA': 'Add a new promotion',
+    'pC': 'Change promotion',
+    'pL': 'Message Box - "You do not have access to this area."',
+    'pM': 'Request promotion screen',
+    'pN': 'List selected promotions',
+    'pO': 'Message Box - "Form not defined."',
+    'pP': 'Message Box - "Form not defined."',
+    'pR': 'Remove a pending promotion',
+    'pS': 'Save promotion permanently',
+    'pT': 'Timer report from signon screen',
+    'R$': '"Show Info" button',
+    'R0': 'Examine Object Info',
+    'R1': 'interactive rainman cmds',
+    'R2': 'create rainman group',
+    'R3': 'Message Box - "You do not have access to this feature."',
+    'R4': 'Message Box - "You do not have access to this feature."',
+    'R5': 'modify rainman group config',
+    'R6': 'add rainman group auth user',
+    'R7': 'add rainman group mapword',
+    'R8': 'Message Box - "You do not have access to this feature."',
+    'R9': 'list rainman group auth users',
+    'RG': 'Open mapword description',
+    'RH': 'Update mapword description',
+    'RR': 'List Groups',
+    'RU': 'Open ranman mapword for delete',
+    'RV': 'Message Box - "You do not have access to this feature."',
+    'RW': 'Open rainman Auth User for edit',
+    'RX': 'Reconfigure rainman auth user',
+    'RY': 'Open rainman Auth User for delet',
+    'RZ': 'Confirm delete rainman auth user',
+    'Rg': 'Add slugword',
+    'Rh': 'List slugwords',
+    'Ri': 'Message Box - "You do not have access to this feature."',
+    'Rj': 'Confirm slugword update',
+    'Rk': 'Message Box - "You do not have access to this feature."',
+    'Rl': 'Confirm slugword delete',
+    'Rp': 'user configure rainman password',
+    'Rq': 'open usr rainmn2 pswd display',
+    'Rr': 'Message Box - "You do NOT have access to this function. "',
+    'Rs': 'manage rmp pswd delete',
+    'Rt': 'Message Box - "You do NOT have access to this function. "',
+    'Ru': 'user group delete',
+    'Rv': 'user rainman2 delete',
+    'Rw': 'Message Box - "This area of America Online is no longer available."',
+    'Rz': 'display user groups',
+    'D1': 'QLINK start certificate dialog',
+    'D2': 'QLINK registration complete Register cashier_win gX',
+    'Dr': 'Continue" on expired AOL trial period form',
+    'aA': 'Process county info',
+    'aB': 'Process ext invoice',
+    'aD': 'Process group member',
+    'aE': 'Dislay Intl addr form',
+    'aF': 'Process city info',
+    'aG': 'process_username_reset',
+    'aH': 'finish updating user disk',
+    'aa': 'process certificate info',
+    'ab': '"Next" on registration page',
+    'ac': '"Discover" button',
+    'ad': '"Next" button',
+    'ae': '"Continue" button',
+    'ag': 'Get suggested screen name',
+    'ah': '"Payment Options" button',
+    'ai': '"Next" button',
+    'aj': 'proc_cc_debit_auth',
+    'ak': '"Continue" button',
+    'al': '"Debit Checking Account" button',
+    'am': 'Manage offer descriptions',
+    'ap': '"Select Password" button',
+    'aq': 'Process Intll address',
+    'ar': 'Message Box - "You Do Not Have Access To This Function"',
+    'as': '"Accept Name" button',
+    'au': 'Ask for name & address form',
+    'av': 'Display more billing type',
+    'aw': 'process_offer_description',
+    'ax': 'Cancel Registration',
+    'ay': 'User really wants to cancel',
+    'az': 'Kick gen_2 user offline',
+    'f1': 'Form',
+    'f3': '"Modify Binary" button',
+    'f4': '"Update" button on Update Database Record form',
+    'f5': 'Batch upload of pictures',
+    'f6': 'Install Local DB for Windows',
+    'f7': '"Update Database Record" on Star Tool',
+    'f8': '"Send" button',
+    'f9': 'pc initiated binary upload',
+    'fa': 'host initiated binary upload',
+    'fb': 'binary information',
+    'fc': 'modify picture record',
+    'fd': 'modify binary record',
+    'fe': '"Modify Picture" button',
+    'fg': 'bulk record update from file',
+    'fi': 'bulk record update for MAC',
+    'fj': 'result for updating local record',
+    'YA': 'Misc areas on AOL',
+    'YB': 'Misc areas on AOL',
+    'YC': 'Misc areas on AOL',
+    'YD': 'Disconnect from TCP RMG',
+    'YE': 'Domain change',
+    'YF': 'Send .c1 command',
+    'YG': 'Send .c1 command',
+    'YH': 'Send .c1 command',
+    'YI': 'Send .c1 command',
+    'YJ': 'Send .c1 command',
+    'YK': 'Send .c1 command',
+    'YL': 'Misc areas on AOL',
+    'YM': 'Sub-input 1 for rmg',
+    'YN': 'Sub-input 1 for rmg',
+    'YO': 'Sub-input 1 for rmg',
+    'YP': 'Sub-input 1 for rmg',
+    'YQ': 'Sub-input 1 for rmg',
+    'YS': 'Disconnect from RMG w/clustering',
+    '7A': 'Connect to LMG',
+    '7B': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7C': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7D': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7E': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7F': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7G': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7H': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7I': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7J': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7K': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7L': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7M': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7N': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7O': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7P': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7Q': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7R': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7S': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7T': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7U': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7V': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7W': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7X': 'Newsgroup Functions - Message Box - "You are no longer connected to this feature."',
+    '7Y': 'board_disp_msg_nrep',
+    'YY': 'Special token for free curtain',
+    'r1': 'New eoi token',
+    'AE': 'Various methods of Chat Send',
+    'AK': 'Message Box - "This area of America Online is no longer available."',
+    'AM': '"Send Question" button',
+    'AP': '"Delete" button',
+    'AR': '"Right" button',
+    'AS': '"Edit" button',
+    'AW': '"Wrong" button',
+    'AX': 'Message Box - "This area of America Online is no longer available."',
+    'Aa': 'Various methods of Chat Send',
+    'CM': 'Message Box - "This area of America Online is no longer available."',
+    'CP': 'Message Box - "This area of America Online is no longer available."',
+    'CX': 'Message Box - "This area of America Online is no longer available."',
+    'G!': 'Message Box - "This area of America Online is no longer available."',
+    'G4': 'Message Box - "This area of America Online is no longer available."',
+    'G8': 'Message Box - "This area of America Online is no longer available."',
+    'GA': 'Message Box - "This area of America Online is no longer available."',
+    'GB': 'Message Box - "This area of America Online is no longer available."',
+    'GC': 'Message Box - "This area of America Online is no longer available."',
+    'GE': 'Message Box - "This area of America Online is no longer available."',
+    'GF': 'Message Box - "This area of America Online is no longer available."',
+    'GH': 'Message Box - "This area of America Online is no longer available."',
+    'GI': 'Message Box - "This area of America Online is no longer available."',
+    'GJ': 'Message Box - "This area of America Online is no longer available."',
+    'GL': 'Message Box - "This area of America Online is no longer available."',
+    'GM': 'Message Box - "This area of America Online is no longer available."',
+    'GN': 'Message Box - "This area of America Online is no longer available."',
+    'GQ': 'Message Box - "This area of America Online is no longer available."',
+    'GR': 'Message Box - "This area of America Online is no longer available."',
+    'GS': 'Message Box - "This area of America Online is no longer available."',
+    'GT': 'Message Box - "This area of America Online is no longer available."',
+    'GU': 'Message Box - "This area of America Online is no longer available."',
+    'GV': 'Message Box - "This area of America Online is no longer available."',
+    'GW': 'Message Box - "This area of America Online is no longer available."',
+    'GY': 'Message Box - "This area of America Online is no longer available."',
+    'GZ': 'Message Box - "This area of America Online is no longer available."',
+    'I0': 'Ignore user - gen 4',
+    'I1': 'Cancel Ignore User - gen 4',
+    'M1': 'IG Ignore User',
+    'IX': 'Message Box - "This area of America Online is no longer available."',
+    'J1': 'Message Box - "This area of America Online is no longer available."',
+    'JA': 'Message Box - "This area of America Online is no longer available."',
+    'JF': 'Message Box - "This area of America Online is no longer available."',
+    'JG': 'Message Box - "This area of America Online is no longer available."',
+    'JN': 'Message Box - "This area of America Online is no longer available."',
+    'JS': 'Message Box - "This area of America Online is no longer available."',
+    'JY': 'Message Box - "This area of America Online is no longer available."',
+    'LG': 'Message Box - "This area of America Online is no longer available."',
+    'MS': 'Message Box - "This area of America Online is no longer available."',
+    'PR': 'Message Box - "We are unable to process your request right now"',
+    'c.': 'Message Box - "This area of America Online is no longer available."',
+    'c0': 'Message Box - "This area of America Online is no longer available."',
+    'c1': 'Message Box - "This area of America Online is no longer available."',
+    'c2': 'Message Box - "This area of America Online is no longer available."',
+    'c3': 'Message Box - "This area of America Online is no longer available."',
+    'c4': 'Message Box - "This area of America Online is no longer available."',
+    'c5': 'Message Box - "This area of America Online is no longer available."',
+    'c6': 'Aud (Sp)-delete active question',
+    'c7': 'Aud (Sp)-get question frm hold Q',
+    'c8': 'Message Box - "This area of America Online is no longer available."',
+    'c9': 'Message Box - "This area of America Online is no longer available."',
+    'cA': 'Message Box - "This area of America Online is no longer available."',
+    'cC': 'Message Box - "This area of America Online is no longer available."',
+    'cD': 'Message Box - "This area of America Online is no longer available."',
+    'cE': 'Message Box - "This area of America Online is no longer available."',
+    'cH': 'Aud-list my chat group',
+    'cJ': '"Show Row" button',
+    'cK': 'Message Box - "This area of America Online is no longer available."',
+    'cM': 'Message Box - "This area of America Online is no longer available."',
+    'cN': 'Aud-list chat group number #',
+    'cO': 'Aud-list occupied chat groups',
+    'cP': '"Move to Row" button',
+    'cR': 'Aud-turn my chat on/off',
+    'cS': 'Message Box - "This area of America Online is no longer available."',
+    'cU': 'Message Box - "This area of America Online is no longer available."',
+    'cW': 'Aud (Sp)-Wake Aud. questions',
+    'cX': 'Message Box - "This area of America Online is no longer available."',
+    'c{': 'Aud (Sp)-broadcast quest as cmnt',
+    'q?': 'Aud-(non-Q) get question form',
+    'qA': 'Aud (Sp)-request a comment',
+    'qB': 'Aud (Sp)-broadcast question',
+    'qC': 'Aud-(non-Q) add question line',
+    'qD': 'Aud-(non-Q) add question line',
+    'qE': 'Aud-End of incoming question',
+    'qF': 'Aud-(non-Q) tally vote',
+    'qG': 'Aud-(non-Q) accept bid',
+    'qM': 'Aud-Incoming question',
+    'qN': 'Aud-(non-Q) withdraw Sp invite',
+    'qR': 'Aud (Sp)-request a question',
+    'qU': 'Aud (Sp)-get Auditorium stats',
+    'qY': 'Aud-(non-Q) accept Sp invite',
+    'qZ': 'Aud(nonQ)MusicMstr invit',
+    'qc': 'Aud - 4th gen add question',
+    'qd': 'Aud - 4th gen add comment',
+    'a5': 'End of Registration Survey',
+    'sA': 'Abort Script',
+    'sE': 'End of Script',
+    'sI': 'Initialize Script',
+    'sN': 'Asking script for a record numbe',
+    'sP': 'Script processing needed',
+    'sQ': 'Script processing needed - gen_4',
+    'sR': 'Script process registration form',
+    'sT': 'Scripts scoreboard',
+    'se': 'End of Script - gen_4',
+    '#C': 'Reset a2k_search_new domain',
+    '#c': 'Message Box - "This area of America Online is no longer available."',
+    '*C': 'Move File',
+    '*D': '"You do not have access to this file/library"',
+    '*H': 'Hide File',
+    '*R': 'Release File',
+    '*X': '"File not found."',
+    '*d': 'Delete File',
+    '*x': '"File not found."',
+    'eB': 'Enter software board',
+    'hL': 'See Hidden Files in Library',
+    'hM': 'File not found',
+    'mL': 'Start list of software board',
+    'mM': 'File Not Found',
+    'eG': 'Email - file info for download',
+    'eJ': 'Ok to proceed w/ file sys dnload',
+    'eK': 'User aborted download',
+    'eV': 'Email - volume info for download',
+    'eY': 'Disk operation result',
+    'eZ': 'Mail file delete response',
+    'mD': 'Download File from Library',
+    'mq': 'Download Later',
+    'tD': 'OK to delete file',
+    'tJ': 'Start forced download of tool',
+    'tk': 'download direct by file ID',
+    'tl': 'Initiate tool download - WAOL',
+    'tn': 'Cancel tool download',
+    'to': 'Initiate tool download - WAOL',
+    'tw': 'request dl of widget tool',
+    'vD': 'Start File Transfer',
+    '*E': 'Edit File',
+    '*M': 'Modify File Description',
+    'm1': 'Ask the Staff',
+    'mF': 'Get File Destriptiony',
+    'mR': 'Get File Destriptiony',
+    'mY': 'Get File Destriptiony',
+    'mZ': 'Handle input from comment form',
+    'Ba': 'graphic type of thumbnail',
+    'Bb': 'thumbnail packet eob',
+    'Bd': 'thumbnail packet',
+    'Be': 'Message Box - "This file could not be uploaded. Please check to see if the file is open in another application."',
+    'eF': 'End text, start upld',
+    'eS': 'Start upload',
+    'ei': 'Start library upload',
+    'es': 'Get upload info form',
+    'eu': 'Mac file name for lib upload',
+    'uB': 'file names to upload (soft_text)',
+    'so': 'Message Box - "Add/Update Cancelled"',
+    'me': 'No longer functioning board functions',
+    'mg': 'No longer functioning board functions',
+    'mh': 'No longer functioning board functions',
+    'mi': 'No longer functioning board functions',
+    'mj': 'No longer functioning board functions',
+    'mk': 'No longer functioning board functions',
+    'mm': 'No longer functioning board functions',
+    'mn': 'No longer functioning board functions',
+    'mp': 'No longer functioning board functions',
+    'mr': 'select drv rec from list',
+    'K9': 'abort text transmission',
+    'KN': 'go ahead',
+    'T1': 'Message Box - "That information is not available."',
+    'T2': 'Message Box - "That information is not available."',
+    'T3': 'appl. level ack',
+    'T4': 'reset domain info',
+    'T5': 'Message Box - "That information is not available."',
+    't6': 'for atom mip',
+    't0': 'Get text doc, override gfx prefs',
+    't1': 'Article Request',
+    't2': 'request text from more button',
+    't4': 'reset textman domain info',
+    't5': 'next text record',
+    'U*': 'reserved for future use',
+    'Kg': 'PC indicating surcharge switch',
+    'MX': 'Q-Link 3 char token (strip X)',
+    'PD': 'PC requests circular dump',
+    'S#': 'Speed indication',
+    'S&': 'Init pkt',
+    'S?': 'PC suspects host hang',
+    'S@': None,
+    'SG': 'Start sending to pre-gen 3rd',
+    'SR': 'Message Box - "This area of America Online is no longer available."',
+    'SS': 'Stop',
+    'SV': 'Message Box - "This area of America Online is no longer available."',
+    'S]': 'disconnect',
+    'Sm': 'Download meter toggle',
+    'Su': 'Restore version (RESET based)',
+    'Sv': 'Change',
+    'XX': 'XS acknowledgement (C64)',
+    'Ro': 'Remain online hotkey',
+    'ua': '"Continue" button',
+    'ub': 'Choose a number in your area',
+    'uc': '"Select" button',
+    'ud': 'Choose Access Numerb in your Area',
+    'ue': '"Same as First Choice" button',
+    'uf': '"Continue" button',
+    'ug': 'Cancel select area code - sign offline',
+    'uh': '"Previous screen" button',
+    'up': 'Choose a number in your area',
+    'dE': 'General DB update response',
+    'dK': 'Update initial dept keyword',
+    'dd': 'Dump database record',
+    'dk': 'Request to change init dept',
+    'do': 'options',
+    'dr': 'Request a database dump',
+    'ds': 'Show current',
+    'dv': 'Disk information',
+    'tC': 'catalog window',
+    'tE': 'operation error',
+    'tG': 'on',
+    'tM': 'create directory',
+    'tP': 'set prefix',
+    'tR': 'Rename a file',
+    'tS': 'Scratch',
+    'tV': 'Do "set prefix"',
+    'tY': 'Will replace volumes',
+    'tZ': 'tF',
+    'u1': 'Generic',
+    'u3': 'Udo',
+    'uC': 'DOD for Mac',
+    'xK': None,
+    'xb': 'packet end of blk',
+    'xd': None,
+    'xe': 'eof',
+    'ui': 'Message Box - "Creation of Favorite Places has been disabled"',
+    'ur': 'Visit address',
+    'CI': 'Enter Chat',
+    'CJ': 'lobby gen 4',
+    'CK': 'similar family',
+    'L!': 'Find a Chat',
+    'L$': 'Find a Chat',
+    'L&': 'Find a Chat',
+    'L(': '<More> public rooms',
+    'L)': '<more> list of sanctioned',
+    'L1': 'Search Member Chats',
+    'L2': 'send',
+    'L3': None,
+    'L@': 'list member created rooms',
+    'LB': 'Find a Chat',
+    'LC': 'Find a Chat',
+    'LD': 'Find a Chat',
+    'LF': '"More Rooms" on Active Conference Room form',
+    'LP': 'Find a Chat',
+    'LQ': 'Find a Chat',
+    'LR': '"List More"',
+    'LS': 'List rooms w/class and format',
+    'LT': 'Continue of LS',
+    'MA': 'Message Box - "Please use the new config interface to sanction and desanction rooms"',
+    'ML': 'Message Box - "Please use the new config interface to sanction and desanction rooms"',
+    'MM': 'Message Box - "Internal error 3"',
+    'MO': 'Message Box - "This area of America Online is no longer available."',
+    'MP': 'Message Box - "This area of America Online is no longer available."',
+    'MQ': 'Message Box - "Invalid room name"',
+    'MR': 'People Connection',
+    'c%': 'Message Box - "This area of America Online is no longer available."',
+    'cG': 'Enter Auditorium Audience',
+    'cL': 'rooms',
+    'cQ': '"Go" button',
+    'cT': 'as Master',
+    'cV': '"Go Chat" button. Private Chat Room',
+    'cb': "Who's Chatting - Town Square Room",
+    'cd': "Who's Chatting - Town Square Room",
+    'ch': 'Message Box - "You do not have access to this function"',
+    'rA': 'Message Box - "This area of America Online is no longer available."',
+    'rB': 'List rooms (casino)',
+    'rC': 'List rooms (casino, continue)',
+    'rD': 'Exit Chat Area',
+    'rG': 'Message Box - "This area of America Online is no longer available."',
+    'v1': None,
+    'v3': '1 cug',
+    'v4': None,
+    'v5': None,
+    'v6': 'save view rule',
+    'v7': 'func.',
+    'v8': 'rec display',
+    'v9': '2',
+    'vE': 'add user_rights to mask',
+    'vF': 'user_rights mask',
+    'vG': None,
+    'vH': 'remove user_rights from value',
+    'vI': 'user_preferences',
+    'vJ': None,
+    'vK': 'cancel pop',
+    'vL': 'user_prefs delete',
+    'vM': 'user_session',
+    'vN': None,
+    'vO': 'editting',
+    'vP': 'remove user_session from value',
+    'vQ': 'user_group func',
+    'vR': None,
+    'vS': 'add user_group to value',
+    'vT': None,
+    'vU': 'add vp attr to mask',
+    'vV': 'attr',
+    'vW': 'user_feature',
+    'vX': None,
+    'vY': 'instvote',
+    'vZ': None,
+    'va': None,
+    'vb': 'undelete view_rule',
+    'vc': 'get rec & display undelete form',
+    'vd': 'confirmation find rules all insert',
+    've': 'records',
+    'vf': 'find view rules',
+    'vg': 'list all view rules',
+    'vh': None,
+    'vi': 'insert function',
+    'vj': 'get rec & display modify form',
+    'vk': 'get rec & display delete form',
+    'vl': 'delete current view rule',
+    'vm': 'cancel and pop current form',
+    'vo': 'delete function',
+    'vp': 'form for editting action type',
+    'vq': 'show args for a func',
+    'vr': 'insert func for view rule',
+    'vs': 'modify action type',
+    'vt': 'get rec & display rename form',
+    'vu': 'the',
+    'vw': 'add user_feature to mask',
+    'vx': 'remove user_feature to mask',
+    'vy': 'add user_feature to value',
+    'vz': 'remove user_feature from value',
+    'W1': 'Chart tool tester',
+    'W2': 'General',
+    'W3': None,
+    'WM': 'Watch manager',
+    'i2': 'Message Box - "Internal error."',
+    'iA': 'Able receive',
+    'iG': 'Accept flashnotes games',
+    'iN': 'Request to send IM',
+    'iO': 'Locate Member',
+    'iR': 'decline/cancel/hangup FlashNote single Instant way',
+    'iS': 'Send Instant Message',
+    'is': 'Send Instant Message',
+    '2t': 'trip curtain AOL2000 search',
+    '2M': 'Message Box - "That database is currently unavailable"',
+    '2S': 'Search AOL2000 Database',
+    '2T': 'Message Box - "That database is currently unavailable"',
+    '2C': 'Reset a2k_search Domain',
+    '#E': 'Message Box - "That database is currently unavailable."',
+    '#M': 'Message Box - "That database is currently unavailable."',
+    '#S': 'Search a2k Database',
+    '#T': 'Message Box - "That database is currently unavailable."',
+    'aR': 'Ad Response Request',
+    'aS': 'Ad Selection Request',
+    '1Y': 'Message Box - "Internal data error"',
+    '1X': 'Message Box - "Internal data error"',
+    'Ij': 'Cancel changing AIM password',
+    'IJ': 'Message Box - "Internal error. Please try again later."',
+    'wM': 'Music Svc Subscription Form',
+    'As': 'Fady S',
+    'Ea': 'aud_event_man list auditoriums',
+    'Ed': 'aud_event_man create event',
+    'Ee': 'aud_event_man confirm delete',
+    'Ef': 'aud_event_man edit event',
+    'Eh': 'aud_event_man save event',
+    'Ej': 'aud_event_man delete event rec',
+    'El': 'aud_event_man refresh aud list',
+    'Eo': 'aud_event_man exit aud_event_man',
+    'Ep': 'aud_event_man cannot edit item',
+    'Eb': 'aud_event_man edit auditorium',
+    'Ec': 'aud_event_man list events',
+    'Eg': 'aud_event_man create auditorium',
+    'Ei': 'aud_event_man save auditorium',
+    'Ek': 'aud_event_man delete auditorium',
+    'Em': 'aud_event_man confirm sys upd',
+    'En': 'aud_event_man update system',
+    '#P': '"Select Plan" button',
+    'Rb': 'Change Current Pricing Plan',
+    'Re': 'Direct Debit PIN',
+    'RI': '"Display Plan" button',
+    'RJ': 'Electronic signature in autorep',
+    'RK': 'Display Price Plan Change Menu',
+    'RL': '"Cancel Pending" button',
+    'RM': 'Debit card FTC elec sig',
+    'RO': 'Display credit card form',
+    'RQ': 'Change Current Pricing Plan',
+    '3N': 'Message Box - "Internal error"',
+    '3n': 'Message Box - "Internal Error"',
+    '3c': 'Message Box - "Internal Error"',
+    '3d': 'Message Box - "Internal Error"',
+    '3e': 'Message Box - "Internal Error"',
+    '3f': 'Message Box - "Internal Error"',
+    '3g': 'Message Box - "Internal Error"',
+    '3h': 'Message Box - "Internal Error"',
+    '3A': 'Message Box - "You do not have access to this function"',
+    '3B': 'Message Box - "You do not have access to this function"',
+    '3C': 'Message Box - "You do not have access to this function"',
+    '3D': 'Message Box - "You do not have access to this function"',
+    '3E': 'Message Box - "You do not have access to this function"',
+    '3F': 'Message Box - "You do not have access to this function"',
+    '3G': 'Message Box - "You do not have access to this function"',
+    '3H': 'Message Box - "You do not have access to this function"',
+    '3I': 'Message Box - "Sorry, that tour is not available."',
+    '3i': 'autotour run alt',
+    '3J': 'Message Box - "Invalid TOKEN_2 arg!"',
+    '3j': 'autotour run alt',
+    '3K': 'Message Box - "You do not have access to this function"',
+    '3k': 'autotour run alt',
+    '3L': 'Message Box - "You do not have access to this function"',
+    '3l': 'autotour run alt',
+    '3M': 'Message Box - "You do not have access to this function"',
+    '3m': 'autotour run alt',
+    '52': 'board_update_title',
+    '5B': 'board_add_owner2',
+    '5D': 'board_bxfer_send',
+    '5d': 'board_edit_title',
+    '5F': 'board_change_nod_del',
+    '5f': 'board_edit_descriptn',
+    '5G': 'board_change_nod_hid',
+    '5H': 'board_change_nod_unr',
+    '5I': 'board_change_msg_del',
+    '5J': 'board_change_msg_hid',
+    '5K': 'board_change_msg_rel',
+    '5L': 'board_change_rpl_del',
+    '5M': 'board_change_rpl_hid',
+    '5N': 'board_change_rpl_rel',
+    '5o': 'board_make_cnt_store',
+    '5p': 'board_move_confirm',
+    '5u': 'board_send_tool_stat',
+    '5w': 'board_show_parents',
+    '5Z': 'board_disp_msg_rep',
+    '6d': 'srch_upd_cont_phrs',
+    '51': 'board_update_rights',
+    '54': 'form_send_board_form',
+    '5b': 'board_disp_msg_rep3',
+    '5E': 'board_cancel_tool_lck',
+    '5e': 'board_edit_title2',
+    '5g': 'board_edit_descriptn2',
+    '5i': 'board_edit_title_desc',
+    '5j': 'board_enter_tools',
+    '5k': 'board_enter_tools_rep',
+    '5l': 'board_insert_form',
+    '5m': 'board_insert_info',
+    '5n': 'board_lock_cnt_for_ud',
+    '5O': 'board_confirm_cnt_del',
+    '5P': 'board_confirm_msg_del',
+    '5Q': 'board_confirm_rpl_del',
+    '5q': 'board_move_form',
+    '5r': 'board_move_info',
+    '5s': 'board_resequence_info',
+    '5T': 'board_create_folder',
+    '5t': 'board_send_reseq_form',
+    '5V': 'board_delete_owner2',
+    '5W': 'board_delink_form',
+    '5X': 'board_delink_item',
+    '5Y': 'board_disp_msg_nrep',
+    '5y': 'board_toggle_fifo',
+    '5z': 'board_toggle_fifo_thr',
+    '6e': 'srch_build_database',
+    '82': 'board_update_title',
+    '8B': 'board_add_owner2',
+    '8D': 'board_bxfer_send',
+    '8d': 'board_edit_title',
+    '8F': 'board_change_nod_del',
+    '8f': 'board_edit_descriptn',
+    '8G': 'board_change_nod_hid',
+    '8H': 'board_change_nod_unr',
+    '8I': 'board_change_msg_del',
+    '8J': 'board_change_msg_hid',
+    '8K': 'board_change_msg_rel',
+    '8L': 'board_change_rpl_del',
+    '8M': 'board_change_rpl_hid',
+    '8N': 'board_change_rpl_rel',
+    '8o': 'board_make_cnt_store',
+    '8p': 'board_move_confirm',
+    '8u': 'board_send_tool_stat',
+    '8w': 'board_show_parents',
+    '8Z': 'board_disp_msg_rep',
+    '9d': 'srch_upd_cont_phrs',
+    '7j': 'No longer functioning board function',
+    '81': 'board_update_rights',
+    '84': 'form_send_board_form',
+    '8b': 'board_disp_msg_rep3',
+    '8E': 'board_cancel_tool_lck',
+    '8e': 'board_edit_title2',
+    '8g': 'board_edit_descriptn2',
+    '8i': 'board_edit_title_desc',
+    '8k': 'board_enter_tools_rep',
+    '8l': 'board_insert_form',
+    '8m': 'board_insert_info',
+    '8n': 'board_lock_cnt_for_ud',
+    '8O': 'board_confirm_cnt_del',
+    '8P': 'board_confirm_msg_del',
+    '8Q': 'board_confirm_rpl_del',
+    '8q': 'board_move_form',
+    '8r': 'board_move_info',
+    '8s': 'board_resequence_info',
+    '8T': 'board_create_folder',
+    '8t': 'board_send_reseq_form',
+    '8V': 'board_delete_owner2',
+    '8W': 'board_delink_form',
+    '8X': 'board_delink_item',
+    '8Y': 'board_disp_msg_nrep',
+    '8y': 'board_toggle_fifo',
+    '8z': 'board_toggle_fifo_thr',
+    '9e': 'srch_build_database',
+    ':c': 'srch_get_cont_phrs',
+    ':d': 'srch_upd_cont_phrs',
+    '^0': 'board_tool_update_cc',
+    '^2': 'board_update_title',
+    '^B': 'board_add_owner2',
+    '^D': 'board_bxfer_send',
+    '^d': 'board_edit_title',
+    '^F': 'board_change_nod_del',
+    '^f': 'board_edit_descriptn',
+    '^G': 'board_change_nod_hid',
+    '^H': 'board_change_nod_unr',
+    '^I': 'board_change_msg_del',
+    '^J': 'board_change_msg_hid',
+    '^K': 'board_change_msg_rel',
+    '^L': 'board_change_rpl_del',
+    '^M': 'board_change_rpl_hid',
+    '^N': 'board_change_rpl_rel',
+    '^o': 'board_make_cnt_store',
+    '^p': 'board_move_confirm',
+    '^R': 'board_create_container',
+    '^U': 'board_delete_owner',
+    '^u': 'board_send_tool_stat',
+    '^w': 'board_show_parents',
+    '^Z': 'board_disp_msg_rep',
+    ':b': 'srch_disp_cont_phrs',
+    ':e': 'srch_build_database',
+    '^1': 'board_update_rights',
+    '^3': 'board_verify_access',
+    '^4': 'form_send_board_form',
+    '^A': 'board_add_owner',
+    '^a': 'board_disp_msg_rep2',
+    '^b': 'board_disp_msg_rep3',
+    '^C': 'board_appl_disabled_b',
+    '^c': 'board_disp_or_msg_rep',
+    '^E': 'board_cancel_tool_lck',
+    '^e': 'board_edit_title2',
+    '^g': 'board_edit_descriptn2',
+    '^h': 'board_edit_own_rights',
+    '^i': 'board_edit_title_desc',
+    '^j': 'board_enter_tools',
+    '^k': 'board_enter_tools_rep',
+    '^l': 'board_insert_form',
+    '^m': 'board_insert_info',
+    '^n': 'board_lock_cnt_for_ud',
+    '^O': 'board_confirm_cnt_del',
+    '^P': 'board_confirm_msg_del',
+    '^Q': 'board_confirm_rpl_del',
+    '^q': 'board_move_form',
+    '^r': 'board_move_info',
+    '^S': 'board_create_cnt_chld',
+    '^s': 'board_resequence_info',
+    '^T': 'board_create_folder',
+    '^t': 'board_send_reseq_form',
+    '^V': 'board_delete_owner2',
+    '^v': 'board_show_owners',
+    '^W': 'board_delink_form',
+    '^X': 'board_delink_item',
+    '^x': 'board_show_prnt_noacc',
+    '^Y': 'board_disp_msg_nrep',
+    '^y': 'board_toggle_fifo',
+    '^z': 'board_toggle_fifo_thr',
+    '5"': 'list_more_new_threads',
+    '5#': 'list_read_1st_new',
+    '5$': 'list_send_find_sn_frm',
+    '5,': 'list_jump_to_board',
+    '5.': 'list_more_cnt_menu',
+    '5/': 'list_more_find_new',
+    '5:': 'list_more_folder_ment',
+    '5?': 'list_more_find_new2',
+    '5@': 'list_pop_apple_pc_cnt',
+    '5[': 'list_enter_fld_dpy1td',
+    '5]': 'list_enter_fld_wtool',
+    '5{': 'list_find_new_thread',
+    '5}': 'list_find_since',
+    '5<': 'list_enter_folder2',
+    '5>': 'list_enter_fld_dpy1st',
+    '55': 'list_browse_new',
+    '56': 'list_browse_new_thrd',
+    '57': 'list_currnt_container',
+    '58': 'list_enter_container',
+    '59': 'list_enter_folder',
+    '6A': 'list_enter_fld_wtools',
+    '6B': 'list_find_new_now',
+    '6C': 'list_more_folder_menu',
+    '6D': 'list_open_fld_list_rp',
+    '77': 'list_currnt_container',
+    '78': 'list enter container',
+    '8"': 'list_more_new_threads',
+    '8#': 'list_read_1st_new',
+    '8$': 'list_send_find_sn_frm',
+    '8,': 'list_jump_to_board',
+    '8.': 'list_more_cnt_menu',
+    '8/': 'list_more_find_new',
+    '8:': 'list_more_folder_ment',
+    '8?': 'list_more_find_new2',
+    '8@': 'list_pop_apple_pc_cnt',
+    '8[': 'list_enter_fld_dpy1td',
+    '8]': 'list_enter_fld_wtool',
+    '8{': 'list_find_new_thread',
+    '8}': 'list_find_since',
+    '8<': 'list_enter_folder2',
+    '8>': 'list_enter_fld_dpy1st',
+    '85': 'list_browse_new',
+    '86': 'list_browse_new_thrd',
+    '89': 'list_enter_folder',
+    '9A': 'No longer funcitoning board functions',
+    '9B': 'No longer funcitoning board functions',
+    '9C': 'No longer funcitoning board functions',
+    '9D': 'No longer funcitoning board functions',
+    ':A': 'list_enter_fld_wtools',
+    ':B': 'list_find_new_now',
+    ':C': 'list_more_folder_menu',
+    ':D': 'list_open_fld_list_rp',
+    '^"': 'list_more_new_threads',
+    '^#': 'list_read_1st_new',
+    '^$': 'list_send_find_sn_frm',
+    '^,': 'list_jump_to_board',
+    '^.': 'list_more_cnt_menu',
+    '^/': 'list_more_find_new',
+    '^:': 'list_more_folder_ment',
+    '^?': 'list_more_find_new2',
+    '^@': 'list_pop_apple_pc_cnt',
+    '^[': 'list_enter_fld_dpy1td',
+    '^]': 'list_enter_fld_wtool',
+    '^{': 'list_find_new_thread',
+    '^}': 'list_find_since',
+    '^<': 'list_enter_folder2',
+    '^>': 'list_enter_fld_dpy1st',
+    '^5': 'list_browse_new',
+    '^6': 'list_browse_new_thrd',
+    '^7': 'list_currnt_container',
+    '^8': 'list_enter_container',
+    '^9': 'list_enter_folder',
+    '5-': 'read_disp_rpl_w_repl',
+    '5&': 'read_disp_orig_msg',
+    '5\\': 'text_post_msg_w_re',
+    '5^': 'read_disp_msg_w_repl',
+    '5|': 'text_post_rpl_w_re',
+    '5%': 'read_disp_msg_no_repl',
+    '6E': 'read_disp_orig_msg_rp',
+    '8-': 'read_disp_rpl_w_repl',
+    '8&': 'read_disp_orig_msg',
+    '8\\': 'text_post_msg_w_re',
+    '8^': 'read_disp_msg_w_repl',
+    '8|': 'text_post_rpl_w_re',
+    '8%': 'read_disp_msg_no_repl',
+    '9E': 'No longer funcitoning board functions',
+    '^-': 'read_disp_rpl_w_repl',
+    '^&': 'read_disp_orig_msg',
+    '^^': 'read_disp_msg_w_repl',
+    ':E': 'read_disp_orig_msg_rp',
+    '^%': 'read_disp_msg_no_repl',
+    '5_': 'text_handle_msg_text',
+    '5`': 'text_off_rpl_by_mail',
+    '5+': 'text_send_msg_text',
+    '5=': 'text_handle_rpl_text',
+    '5~': 'text_off_rpl_w_mail',
+    '8_': 'text_handle_msg_text',
+    '8`': 'text_off_rpl_by_mail',
+    '8+': 'text_send_msg_text',
+    '8=': 'text_handle_rpl_text',
+    '8~': 'text_off_rpl_w_mail',
+    '^\\': 'text_post_msg_w_re',
+    '^_': 'text_handle_msg_text',
+    '^`': 'text_off_rpl_by_mail',
+    '^|': 'text_post_rpl_w_re',
+    '^+': 'text_send_msg_text',
+    '^=': 'text_handle_rpl_text',
+    '^~': 'text_off_rpl_w_mail',
+    '3O': 'buddylist',
+    '3P': 'Buddy List Privacy Preferences',
+    '3Q': 'Edit Group',
+    '3R': 'Remove Buddy from Ignore List',
+    '3S': 'Delete Group',
+    '3T': 'buddylist',
+    '3U': 'buddylist',
+    '3V': 'View Buddy List',
+    '3W': 'buddylist',
+    '3X': 'Buddy List Setup',
+    '3Y': 'Buddy Chat',
+    '3Z': 'buddylist',
+    'cf': 'For RoomList',
+    'cZ': 'Enter Town Square Room',
+    'LA': '"Search" button',
+    'LE': '"Search" button',
+    'LH': 'Start Member Chat',
+    'LI': 'new token for RoomList',
+    'LJ': '"List More"',
+    'LU': 'Message Box - "Internal error 1"',
+    'LV': 'Find a Chat',
+    'MB': '"Go Chat" button',
+    'MC': 'Message Box - "We are unable to put you in that room at this time, error 1"',
+    'ME': 'Chat Now',
+    'MG': 'Chg full_spec',
+    'MY': '"Go Chat" button',
+    'AI': 'New chat system FDO88 domain sw',
+    'AJ': 'New chat system close token',
+    'cI': 'create a public room...',
+    '$$': 'process_acct_cc_option',
+    '$&': 'Auto Tour Entry Point',
+    '$?': '"?" button on $W',
+    '$[': 'auto tour no HL',
+    '$]': 'auto tour w. HL',
+    '$>': 'Mult Scr Nms for E-Greet',
+    '$J': 'process_text_20_option',
+    '$N': 'empty_cart',
+    '$O': 'process_refresh',
+    '$q': 'process_text_14_option',
+    'k$': 'Message Box - "Internal error."',
+    'k?': 'AOL Quick Checkout Help',
+    'k>': 'Avail for Wallet',
+    'ka': 'Add/Edit Your Credit Cards',
+    'kB': 'RM-L2 HTLNK',
+    'kb': 'Auto Tour RM L2 HTLNK',
+    'kC': 'RM-L3 HTLNK',
+    'kc': 'Auto Tour RM-L3 HTLNK',
+    'kD': 'RM-L4 HTLNK',
+    'kd': 'Auto Tour RM-L4 HTLNK',
+    'kE': 'Shipping Information',
+    'ke': 'Call Wallet for Edit/Updt CC',
+    'kf': 'Process Flowers List Opt',
+    'kJ': '"Next" button',
+    'kK': 'process test 160 option',
+    'kM': 'Call to Make/Create New Wallet',
+    'kP': '"Cancel" button',
+    'kR': 'retrieve product',
+    'kS': 'process product summary',
+    'kT': 'QOrder RM-L2 HTLNK',
+    'kV': 'QOrder RM-L3 HTLNK',
+    'kW': 'For Future Use',
+    'kw': 'For Future Use',
+    'kX': 'QOrder RM-L4 HTLNK',
+    '$#': 'not defined',
+    '$%': 'not defined',
+    '$+': 'not defined',
+    '$K': 'process_text_160_option',
+    '$T': 'process_ship_choice',
+    '$U': '"Previous Screen" button on $i',
+    'kA': 'Add/Edit Your Address Book',
+    'kF': 'Process Flowers Options',
+    'kj': 'return product summary',
+    'km': 'process numeric option',
+    'kp': 'For Future UUse',
+    'kr': 'process radio option',
+    'ks': 'process text 40 option',
+    'kt': 'process text option',
+    'ku': 'place order',
+    '9S': 'Get Member Info. Occurs when double clicking the list box',
+    '9s': 'Send-input tok for ecr_chat_srvr',
+    '9F': 'Message Box - "Internal Error"',
+    '9G': 'Message Box - "Internal Error"',
+    '9Q': 'form-complete token',
+    '9R': 'form-complete token',
+    '9W': 'Conference Rooms',
+    '9X': '"Go" button',
+    'CC': 'Message Box - "Form is not in a valid format."',
+    'CS': 'Message Box - "Form is not in a valid format."',
+    'CN': 'Message Box - "Form is not in a valid format."',
+    'CQ': 'Acknowledge confirmation message',
+    'CO': 'Enter contest',
+    '%0': 'Update pending price plan',
+    '%1': 'Select account',
+    '%6': 'number of dups',
+    '%a': 'Update name address',
+    '%b': 'Display detail bill',
+    '%c': 'Select credit',
+    '%E': 'Select sw order',
+    '%e': 'search sor sw order',
+    '%G': 'Update CC database info',
+    '%g': 'Display CC database info',
+    '%h': 'Select history from list',
+    '%H': 'Select history from list',
+    '%j': 'Online status',
+    '%J': 'Deny credit',
+    '%K': 'Write credit',
+    '%k': 'cris_jp price plan change',
+    '%L': 'Japenese cris generic function',
+    '&0': 'Submit Pending Price Plan',
+    '&6': 'Set number CC/DD dups',
+    '&7': 'accept registration promo code',
+    '&8': 'Accept cris account reg info',
+    '&9': 'Disp prem sucbscr details',
+    '&A': 'Message Box - "You do not have access to this function."',
+    '&D': 'Manage Direct Debit Database',
+    '&I': 'Maintain Direct Debit DataBase',
+    '&i': 'Update sec. billing contact',
+    '&l': 'Update address from credit card',
+    '&O': 'modify securid',
+    '&Q': 'disallow dups',
+    '&R': 'Add to hotlist',
+    '&s': 'Select credit reason',
+    '&V': 'update vp info',
+    '&W': 'submit member_validation',
+    '&X': 'Remove from hot-list',
+    '&Y': 'reset_block_login',
+    '&J': 'Deny credit',
+    'fq': 'continue batch dod',
+    'fs': 'start batch art work',
+    'fp': 'start batch dod',
+    'fA': 'find_arts',
+    'fB': 'add_art_to_list_box',
+    'fC': 'rem_art_from_list_box',
+    'fD': 'proc_art_request',
+    'fk': 'batch_update_picture_file',
+    'fr': 'process picture list',
+    'fu': 'process vrm aat pict info',
+    'fv': 'process vrm aat binary header',
+    'fw': 'process vrm aat binary info',
+    'Xe': 'Mail download complete',
+    'ro': 'New force off message',
+    'h0': 'Message Box - "This area of America Online is no longer available."',
+    'yv': 'hist qtes chart serv',
+    'l2': 'Satellite Info - like yb',
+    'BR': 'for bos reservation',
+    'KA': 'Select Alternate Keyword',
+    'Kl': 'New approx keyword slct',
+    'Kr': 'Random Keywords',
+    'D8': 'Update language list',
+    'Vn': 'List Members - More',
+    '7@': 'list_pop_apple_pc_cnt',
+    'd8': 'Define language list - Gen4',
+    'Dz': 'Login authentication keys',
+    'PA': 'Login Popup -queue apollo',
+    'PB': 'Login Popup B',
+    'PC': 'Login Popup C',
+    'PP': 'Login Popup P',
+    'PU': 'Login Popup U',
+    'UR': 'Switch Screen Names',
+    'US': 'Sign Offline',
+    'p#': 'Get mail scroll control',
+    'p$': 'Set mail scroll control',
+    'p1': 'Mail parental control request',
+    'p2': "We're sorry, Mail is unavailable. Please try again later.",
+    'p3': "We're sorry, Mail is unavailable. Please try again later.",
+    'p4': "We're sorry, Mail is unavailable. Please try again later.",
+    'p5': 'Set mail parental controls',
+    'p8': "We're sorry, Mail is unavailable. Please try again later.",
+    'e@': 'Cancel download from warning',
+    'ED': 'Downld mail attach AOLAPI',
+    'ej': 'OK to proceed with mail download',
+    'uj': 'confirm download-japanese client',
+    'e!': 'Download file after warning',
+    'SC': 'Make screen name online. Sent while signing online.',
+    'l0': 'Check mailbox password',
+    'l1': 'Cancel mailbox password check',
+    'mI': 'Email - file info for upload',
+    'PM': 'database write request',
+    'p!': 'get spam prefs',
+    'p%': 'Mail Warn Preference',
+    'p@': 'set spam prefs',
+    'p^': 'OK on p%',
+    '7w': 'Message Box - "Internal error - please try agian later."',
+    '7r': 'Member Directory',
+    '7s': 'close window indicator',
+    '7x': '"Search" button on Member Directory form',
+    '7z': 'reset domain',
+    '7t': 'Message Box - "Internal error - please try agian later."',
+    '7u': 'Message Box - "Internal error - please try agian later."',
+    '7v': 'Message Box - "Internal error - please try agian later."',
+    '7y': '"More" button on Member Directory Search Results',
+    'jA': 'jA, jS',
+    'jB': 'Perform search',
+    'jC': 'Get more search results',
+    'jF': 'Retrieve profile from hit list',
+    '4A': 'Match Your Interests - Careers, Education, & Reference',
+    '4B': 'Match Your Interests Main',
+    '4C': 'close MYI',
+    '4D': 'close "Places to Explore" (PE)',
+    '4E': 'Your places to explore',
+    '4F': '"Stop EMail" button',
+    '4G': 'Cancel Create Interest Profile',
+    '4H': 'interest profiles KW',
+    '4I': '"Prev" button',
+    '4J': '"Done" button',
+    '4K': 'interest profiles:listbox',
+    '4L': 'interest profiles',
+    '4M': '"Modify Your Interest Profile" button',
+    '4N': 'interest profiles',
+    '(e': 'Games MOO 01 input',
+    '(f': 'Games MOO 01 entry',
+    '(g': 'Games MOO 02 input',
+    '(h': 'Games MOO 02 entry',
+    '(i': 'Games MOO 03 input',
+    '(j': 'Games MOO 03 entry',
+    'DP': 'Display Places',
+    'nt': 'process_switch_screen_name',
+    'nb': 'process_kids_only_confirm',
+    'nE': 'nameman send to old mac client',
+    'nq': 'process_download_control',
+    'nv': 'send undelete SN form',
+    'nB': 'process_surcharge_control',
+    'nI': 'process_master_sn_control',
+    'ns': 'process web control',
+    'nu': 'process undelete SN',
+    '5R': 'board_create_container',
+    '5U': 'board_delete_owner',
+    '6c': 'srch_get_cont_phrs',
+    '8R': 'board_create_container',
+    '8U': 'board_delete_owner',
+    '9c': 'srch_get_cont_phrs',
+    'A&': 'Message Box - "This area of America Online is no longer available."',
+    'aT': 'Message Box - "This area of America Online is no longer available."',
+    'k1': 'Message Box - "This area of America Online is no longer available."',
+    'n[': '"Continue"',
+    '53': 'board_verify_access',
+    '5A': 'board_add_owner',
+    '5a': 'board_disp_msg_rep2',
+    '5C': 'board_appl_disabled_b',
+    '5c': 'board_disp_or_msg_rep',
+    '5h': 'board_edit_own_rights',
+    '5S': 'board_create_cnt_chld',
+    '5v': 'board_show_owners',
+    '5x': 'board_show_prnt_noacc',
+    '6b': 'srch_disp_cont_phrs',
+    '83': 'board_verify_access',
+    '8A': 'board_add_owner',
+    '8a': 'board_disp_msg_rep2',
+    '8C': 'board_appl_disabled_b',
+    '8c': 'board_disp_or_msg_rep',
+    '8h': 'board_edit_own_rights',
+    '8S': 'board_create_cnt_chld',
+    '8v': 'board_show_owners',
+    '8x': 'board_show_prnt_noacc',
+    '9b': 'srch_disp_cont_phrs',
+    'F6': 'Message Box - "This area of America Online is no longer available."',
+    'IG': 'Message Box - "This area of America Online is no longer available."',
+    'lR': 'Message Box - "This area of America Online is no longer available."',
+    'n]': 'snadmin process selected name',
+    'Ry': 'New Mac eoi token',
+    'Me': 'Delete keyword',
+    'Mo': 'Update synonyms',
+    'Mr': 'Create keyword',
+    'Mu': 'Modify keyword',
+    'My': 'Copy keyword',
+    'Mc': 'Create_keywords form',
+    'Md': 'Delete_keywords form',
+    'Mk': 'Manage_keywords form',
+    'Ml': 'List_keywords form',
+    'Mm': 'Modify_keywords form',
+    'Mn': 'Manage_synonyms form',
+    'Mp': 'Delete_synonyms form',
+    'Ms': 'Show keywords list',
+    'Mt': 'Cont. Keyword list',
+    'Mx': 'Copy_keywords form',
+    '!f': 'process main menu merch',
+    '!g': 'Sign Off. Message - "Internal Error #4213 - notify customer service"',
+    '!h': 'process screen',
+    '!i': 'Message Box - "Thank You For Using Order Inquiry"',
+    '!j': 'Sign Off. Message - "Internal Error #4213 - notify customer service"',
+    '!n': 'Message Box - "Internal Error"',
+    '!o': 'Message Box - "Internal Error"',
+    '!p': 'Message Box - "Internal Error"',
+    '!w': 'Sign Off. Message - "Internal Error #4213 - notify customer service"',
+    'Cu': 'Get indexed coll with mip_atom',
+    'Cv': 'Get permanent colls w/mip_atom',
+    't7': 'Request rich text for atom mip',
+    'Cw': 'autotour window minimized',
+    'yy': 'Added for Pager Requests',
+    'za': '"Send" on zb',
+    'zb': '"Address Book"',
+    'zc': 'address book pager',
+    'zd': 'address book for pager',
+    'ze': 'Message Box - "Paging Address book area is unavailable at this time. Please try again later."',
+    'zf': 'Message Box - "Paging Addressbook is unavailable now."',
+    'zg': 'address book for pager',
+    'zh': 'Message Box - "Paging Address book area is unavailable at this time. Please try again later."',
+    'zi': 'Message Box - "Paging Address book area is unavailable at this time. Please try again later."',
+    'zj': 'address book for pager',
+    'zk': 'address book for pager',
+    'Ja': 'Get Stock Quote',
+    'Jb': 'Get Stock Quote',
+    'Jc': 'sdk get pfolio or pfolio list',
+    'pe': 'Add stock to portfolio',
+    'PT': 'qp_server free curtain token',
+    'Qa': 'mp add to which portfolio',
+    'Qb': '"OK" button',
+    'Qd': 'mp rqst for named symbol quote',
+    'Qe': 'mp rqst quote of pfolio symbol',
+    'Qf': 'mp start editing pfolio item',
+    'Qg': 'Delete Portfolio',
+    'Qh': 'reserve for pcquote',
+    'Qi': 'mp update edited pfolio item',
+    'Qj': 'mp refresh pfolio display',
+    'Qk': 'rqst for mac sdk quote',
+    'Ql': 'rqst to display a public pfolio',
+    'Qm': 'mp display win save/print pfolio',
+    'Qn': 'Rename Portfolio',
+    'Qo': 'mp change portfolio name',
+    'Qp': 'mp start direct add to pfolio',
+    'Qq': 'mp direct add item to pfolio',
+    'Qr': 'reset gen3 pcquote domain',
+    'Qs': 'mp setup delete from portfolio',
+    'Qt': 'mp delete from portfolio',
+    'Qu': 'rqst for win sdk quote',
+    'Qv': 'Add item to Portfolio',
+    'Qy': 'mp disp quote token frm lookup',
+    'Qz': 'mp cancel edit portfolio item',
+    'Qw': 'mp Symbol name listboxMoreButton',
+    'Qx': 'mp symbol search list box',
+    'PF': 'Trigger popup action',
+    'PV': 'channel popup init',
+    'PW': 'adhoc popup init',
+    'PE': 'Select popup action',
+    'PX': 'logout popup init',
+    'p6': 'Popup preferences',
+    'p7': 'OK on p6',
+    'Q-': 'return from search',
+    'Q[': 'continue symbol search',
+    'Q^': 'TTharp',
+    'QZ': 'save preferences',
+    'Q\\': 'subscribe',
+    'Q]': 'unsubscribe',
+    'Q=': 'start symbol search',
+    'QY': 'display main form',
+    'pB': 'Add promotion without checking',
+    'pD': 'Display single promotion',
+    'pW': 'Preview Promo Screen Forward',
+    'pV': 'Preview promo screens',
+    'pX': 'Preview Promo Screen Backward',
+    'pE': 'Sign Offline w/ Exiting AOL',
+    'pc': 'start dynamic stock chart',
+    'pj': 'show stock list form',
+    'pn': 'update stock chart with delta',
+    'pt': 'clean up after chart close',
+    'pb': 'show a list of symbols form',
+    'k]': 'tour prod w/int id',
+    'kk': 'process checkout',
+    'ko': 'display current option',
+    'kq': 'process text 14 option',
+    'ky': 'process cc billing',
+    'ki': 'request cc info',
+    'kl': 'process list option',
+    'kQ': 'process quantity option',
+    'kU': 'display previous screen',
+    'kv': 'process ship addr',
+    'kz': 'process bill to',
+    'tz': 'request a stock chart via qmsg',
+    'QH': 'reserved',
+    'Q~': 'bounce token off of quote_detail',
+    'Q<': 'from stratus or iq',
+    'Q>': 'Lookup Symbol',
+    'QA': 'Quotes',
+    'QB': 'Get Symbol Info',
+    'QC': 'Lookup Symbol Info',
+    'Qc': 'Display Portfolio',
+    'QD': 'Select list item from search box',
+    'QE': 'More Search Results',
+    'QF': 'Exchange Info',
+    'QI': 'Add to Portfolio',
+    'tv': 'Message Box - "Symbol Not Found"',
+    'ty': 'Message Box - "Symbol Not Found"',
+    'QG': 'initial quote request',
+    'qj': 'display customize columns form',
+    'ql': 'Download Portfolio OK',
+    'qm': 'split symbol confirm',
+    'qo': 'Customize Columns OK',
+    'qs': '"Details" button',
+    'uv': 'Default view for portfolio',
+    "Q'": 'transfer symbol',
+    'Q': 'future use',
+    'Q!': 'Delete Portfolio',
+    'Q"': 'remove Symbol confirm',
+    'Q#': 'Edit Portfolio',
+    'Q$': 'Delete portfolio symbol',
+    'Q%': 'Print Portfolio',
+    'Q&': 'Refresh Portfolio',
+    'Q(': 'add cash portfolio list box sele',
+    'Q)': 'Exchange',
+    'Q0': 'add item list box',
+    'Q1': 'Rename Portfolio',
+    'Q2': 'Delete Portfolio',
+    'Q3': 'Rename Portfolio',
+    'Q4': 'dd Item to Portfolio',
+    'Q5': 'Transfer Portfolio',
+    'Q6': 'Copy Symbol',
+    'Q7': 'customize add column',
+    'Q8': 'Customize remove column',
+    'Q9': 'Customize move up',
+    'qa': '"Next" button',
+    'qb': 'Port Wiz remove',
+    'qe': 'Remove item from Portfolio',
+    'QJ': '"Previous" button',
+    'QK': 'Cancel Portfolio',
+    'qk': 'Download Portfolio',
+    'QL': 'Add Symbol to Portfolio',
+    'QM': 'Display Portfolio',
+    'QN': 'List Portfolio',
+    'qn': 'Customize move down',
+    'QO': '(que oh) Add Item confirm',
+    'QP': 'calculate split',
+    'qp': 'col config AOL defaults',
+    'QQ': 'Portfolio Wizard Step 3',
+    'qq': 'Customize clear columns',
+    'QR': 'Set port to defaults confirm',
+    'qr': 'Customize cancel button',
+    'QS': 'Finish Portfolio',
+    'QT': 'handle add cash',
+    'QU': 'Create Portfolio Ok Button',
+    'QV': 'Transfer Portfolio',
+    'QW': 'handle edit item',
+    'QX': 'Edit Portfolio',
+    'rb': 'Radio Broadcast data',
+    'rd': 'Radio Data (audio broadcast)',
+    'ri': 'Radio Input data',
+    'rc': 'Radio Control (audio radio)',
+    'rk': 'fifth preset station',
+    'rl': 'sixth preset station',
+    'rO': 'radio help',
+    'rT': '2nd preset station',
+    'rW': 'third preset station',
+    'rj': 'fourth preset station',
+    'rQ': 'Play preset station',
+    'rR': 'tbd',
+    'r3': 'manage group options',
+    'r4': 'modify group options',
+    'ry': 'test',
+    'rz': 'test',
+    'r5': 'update rainman2 group options',
+    'Rd': 'Add RMP Group Authorized User.',
+    'Rm': 'Open rmp_user limited groups.',
+    'Rx': 'Message Box - "You do NOT have access to this function. "',
+    'R!': 'Interactive "show sched status"',
+    'r7': 'test',
+    'r8': 'test',
+    'r9': 'test',
+    'ir': 'Message Box - "Internal error."',
+    'rr': 'Notify AOL',
+    'aI': 'send_member_dir_desc_form',
+    'aJ': 'process_member_dir_info',
+    'aK': 'process member dir cancel',
+    'aL': 'process billing address',
+    'an': 'Get next Register screen',
+    'aN': 'Get next Reg screen after passwd',
+    'aP': 'TOS text display',
+    'aQ': 'Process AIM info form',
+    'aU': 'Process short password info',
+    'aX': '"Cancel" button on Registration',
+    'aZ': 'kick user offline: Invalid Cert',
+    '4a': 'Holiday Reminder',
+    '4b': '"Quit" button',
+    '4c': 'free reminder service',
+    '4d': '"Holiday Reminders" button',
+    '4e': '""Continue" button',
+    '4f': '"Cancel" button',
+    '4g': '"Add Personal Reminder" button',
+    '4h': '"Edit" button',
+    '4i': '"Remove" button',
+    '4j': '"Save" button',
+    '4k': 'free reminder service',
+    '4l': '"Cancel" button',
+    '4m': 'free reminder service',
+    '4n': 'free reminder service',
+    '4o': 'free reminder service',
+    'Y@': 'token to rmg',
+    'YT': 'Individual RMG form closed',
+    'YU': 'Send .c1 command',
+    'YV': 'Send .c1 command',
+    'YW': 'Send .c9 command',
+    'YR': 'connect to RMG w/out unplug',
+    'YX': 'RMG command',
+    'n<': 'change AOLByPhone pin number',
+    'n1': '"Continue" on the create screen name form',
+    'n3': '"Customize Settings" button',
+    'n4': '"Create a Screen Name" button before Step 1',
+    'n6': 'process sosa request',
+    'n7': 'process sosa',
+    'Nq': '"Continue" on create alternate screen name form',
+    'Nr': '"Continue" on set parental controls form',
+    'Ns': '"Continue" on set password form',
+    'nT': 'askenter new pw form',
+    'nw': 'change hn pw',
+    'nx': '"Restore a Screen Name" button at keyword: Names',
+    'DA': 'Change Password',
+    'DC': '"Change Password" button',
+    'n2': '"Continue" on designate master screen name form',
+    'n5': '"Continue" with delete screen name process',
+    'n8': 'update client name list',
+    'n9': 'process sosa cancel',
+    'ng': '"Cancel" on any screen name process functions',
+    'nN': 'changing hn pw form',
+    'nS': 'ask2enter aim sn and pw',
+    'nX': 'process_undelete_sn',
+    'nY': 'process_undelete_sn',
+    'ny': '"Recover" a screen name',
+    '2a': 'Message Box - "That database is currently unavailable. Please try again later."',
+    '2b': 'Message Box - "Internal error - please try again later."',
+    '2g': 'reset domain',
+    '2h': 'Message Box - "That database is currently unavailable. Please try again later."',
+    '2k': 'mac enter-database',
+    '2l': 'Message Box - "Internal error - please try again later."',
+    '2n': 'URL free/pay curtain',
+    '2f': 'Message Box - "Internal error - please try again later."',
+    'hq': 'KW: choosemode and securid',
+    'hr': 'user response of form mode',
+    'hs': 'user response to host security',
+    'iW': 'IM image accept',
+    'VN': 'Video admin token',
+    'VO': 'Video Output',
+    'VP': 'Video Params',
+    'VQ': 'Video Control',
+    '!A': '"Cancel" button',
+    '!B': '"Back" button',
+    '!d': '"Send | Click Here" button on the third of three forms beginning with !E 1',
+    '!E': 'E-Mail Change Of Address In 3 Easy Steps',
+    '!N': 'All "Next" buttons on the series of forms that begin with !E 1',
+    '*A': '"You do not have access to this file/library"',
+    '*a': 'Edit All Files In Library',
+    '*B': 'Sort Order of Files',
+    '*e': '"You do not have access to this file/library"',
+    '*k': 'Special token for free curtain',
+    '*n': 'manage range',
+    '*p': '"File not found."',
+    'dA': 'secondary tod token',
+    '*f': '"You do not have access to this file/library"',
+    '*g': '"You do not have access to this file/library"',
+    '*h': 'Edit Hidden Files',
+    '*L': '"You do not have access to this file/library"',
+    '*l': 'Edit Deleted Files',
+    '*r': 'Edit Released Files',
+    'uM': 'Hidden lib close callback',
+    'uN': 'Edit lib close callback',
+    'EJ': 'Download a surcharged file',
+    'EK': 'tokenForFreeCurtainUrl',
+    'uJ': 'Unicode file for DL',
+    '*m': 'Edit Description',
+    '*F': 'show filename form',
+    '*i': 'token for free curtain (url)',
+    'mz': 'Send SWL comment',
+    '*c': 'ok to change filename',
+    '*t': 'retrieve desc. for edit by lang',
+    'mW': 'Related Files',
+    'Bg': 'Cont bulk Upload',
+    'Bf': 'Start Bulk Upload',
+    'Bh': 'End Bulk Upload',
+    'ea': 'MAC Filename for remote upload',
+    '2E': 'Message Box - "INTERNAL ERROR"',
+    '[A': 'TOKEN FOR SOSA',
+    '[B': 'Token for SOSA',
+    '[C': 'Token for SOSA',
+    '[D': 'Token for SOSA',
+    '[E': 'Token for SOSA',
+    '[F': 'Token for SOSA',
+    '[G': 'Token for SOSA',
+    '[H': 'Token for SOSA',
+    '[I': 'Token for SOSA',
+    '[J': 'Token for SOSA',
+    '[K': 'Token for SOSA',
+    '[L': 'Token for SOSA',
+    '[M': 'Token for SOSA',
+    '[N': 'Token for SOSA',
+    '[O': 'Token for SOSA',
+    '[P': 'Token for SOSA',
+    's1': 'aol stout form',
+    '<0': 'Message Box - "Sorry, Product is Not Available At This Time"',
+    '<1': 'Message Box - "Sorry, Product is Not Available At This Time"',
+    '<2': 'Message Box - "Sorry, Product is Not Available At This Time"',
+    '<3': 'Message Box - "Sorry, Product is Not Available At This Time"',
+    '<4': 'Message Box - "Sorry, Product is Not Available At This Time"',
+    '<f': 'TelSave Process Checking',
+    '<a': 'TelSave Process Bill_to',
+    '<b': 'TelSave Process Credit Card',
+    '<c': 'TelSave charge cc',
+    '<d': 'TelSave no chg acct',
+    '<e': 'TelSave Charge Checking',
+    '<g': 'TelSave Place Order',
+    '<h': 'TelSave Previous Screen',
+    '<i': 'TelSave back to shop cancel',
+    '<j': 'TelSave CC info',
+    '<k': 'TelSave Use',
+    '<l': 'TelSave Use',
+    'VC': 'connected',
+    'mO': 'Eventually ebuddy ???',
+    'Ya': 'tour server',
+    'Yb': None,
+    'Yc': None,
+    'Yd': None,
+    'Ye': None,
+    'Yf': None,
+    'Yg': None,
+    'Yh': None,
+    'Yi': None,
+    '7a': 'Message Box - "Invalid TOKEN_1 arg!"',
+    '7b': 'Message Box - "Invalid TOKEN_2 arg!"',
+    '7c': 'Message Box - "That entry is no longer active"',
+    '7d': 'Message Box - "That entry is no longer active"',
+    '7e': 'Message Box - "That entry is no longer active"',
+    '7f': 'Message Box - "Invalid Token_1_confirm arg!"',
+    '7g': None,
+    '7h': 'Message Box - "You are no longer authorized for this function"',
+    '7i': 'Message Box - "You are not authorized for this funciton"',
+    'uQ': 'Sat Xfer',
+    'uS': 'HS - data',
+    'ul': 'Message Box - "Invalid resource identifier"',
+    'in': 'P.C.',
+    'v-': 'select qc operator',
+    'v!': 'edit args search',
+    'v)': 'vp_test_screen',
+    'v/': 'rem promo box',
+    'v@': 'vp function',
+    'v[': 'qeneric_qc value',
+    'v=': 'v add',
+    'v_': 'remove',
+    'v+': None,
+    'vB': 'network addr undelete view_rule',
+    'v#': 'source',
+    'v$': 'help screens',
+    'v%': 'add_filter_user_to_list_box',
+    'v(': 'vp_test_display',
+    'v^': 'rem_filter_user_from_list_box',
+    'WA': 'starting point wallet',
+    'WC': 'Message Box - "Your request can not be processed at this time, please try again later"',
+    'Wq': '"OK" button',
+    'iV': 'Message Box - "Screen name not given."',
+    'pv': 'flag ygp_flag Youve Got Pictures',
+    'yJ': None,
+    'yK': None,
+    'yL': None,
+    'yM': 'ygp_metrics',
+    '!2': 'Signs you offline with message, "Invalid Direct Debit Authorization PIN"',
+    '!?': 'Message Box - "Internal Error"',
+    '!T': 'Message Box - "Internal Error"',
+    '!l': 'Message Box - "Internal Error"',
+    '!u': 'Message Box - "Internal Error"',
+    '!C': 'Message Box - "You do not have access to this function."',
+    '!V': 'Message Box - "You do not have access to this function."',
+    '!D': 'Message Box - "Promotion create canceled"',
+    '!M': 'Message Box - "Feature not supported"',
+    '!P': 'Message Box - "Feature not supported"',
+    '!U': 'Message Box - "Feature not supported"',
+    '!W': 'Message Box - "Use CANCEL to get last screen"',
+    '!Z': 'Sign Off. Message - "Internal Error #4213 - notify customer service"',
+    '!c': 'Message Box - "Sign Up Friend Canceled"',
+    '!s': 'Message Box - "The status of your friend\'s pack can be reviewed 24 hrs after order is placed."',
+    '%F': '"Add Product" button',
+    '%s': '"Search" button',
+    '%w': '"OK" button n Create a New Store form',
+    '*I': '"File not found."',
+    '.0': 'Signs you offline with message, "Your connection to AOL has been lost. Please sign on again."',
+    '.1': 'Signs you offline with message, "Your connection to AOL has been lost. Please sign on again."',
+    '.a': 'Signs you offline with message, "Your connection to AOL has been lost. Please sign on again."',
+    '.b': 'Signs you offline with message, "Your connection to AOL has been lost. Please sign on again."',
+    '.c': 'Signs you offline with message, "Your connection to AOL has been lost. Please sign on again."',
+    '.d': 'Signs you offline with message, "Your connection to AOL has been lost. Please sign on again."',
+    '.e ...': 'Signs you offline with message, "Your connection to AOL has been lost. Please sign on again."',
+    '<A': 'Message Box - "AOL Plus is currently only available for members with Windows 98/Millennium/Windows2000"',
+    '<C': '"Cancel" button',
+    '<D': '"Back to Order" button',
+    '<H': '"Next" button',
+    '<I': 'AOL Anywhere',
+    '<J': '"Cancel" button',
+    '<T': 'AOL for Home Networks',
+    '<X': '"AOL Plus - the easiest way to be online"',
+    '<u': '"AOL Plus - the easiest way to be online"',
+    '<v': '"Back" button',
+    '<w': '"Cancel" button',
+    '0_ (All 0 Tokens)': 'Message Box - "Gateway host has already been disconnected."',
+    '9P': 'Message Box - "Internal data error"',
+    '9T': 'Message Box - "Internal data error"',
+    '9U': 'Message Box - "Internal data error"',
+    '9V': 'Message Box - "Internal data error"',
+    '9Y': 'Message Box - "There is no conference room with ID = x"',
+    '9Z': 'Message Box - "You are not authorized to perform this function"',
+    '9_': 'No longer functioning board functions',
+    'AH': 'Message Box - "We are unable to put you in that room at this time, error 1"',
+    'b_ (All b tokens)': 'No longer functioning board functions',
+    'cY': 'Message Box - "This area of America Online is no longer available."',
+    'DS': 'Message Box - "Access denied"',
+    'd1': 'Sorry, you do not have access to this file/library.',
+    'd2': 'Sorry, you do not have access to this file/library.',
+    'd3': 'Sorry, you do not have access to this file/library.',
+    'dS': 'Message Box - "Access denied"',
+    'Fm': 'Message Box - "We\'re sorry, you do not have access to this area."',
+    'Fn': 'Message Box - "We\'re sorry, you do not have access to this area."',
+    'Fo': 'Message Box - "We\'re sorry, you do not have access to this area."',
+    'Fz': 'Message Box - "We\'re sorry, you do not have access to this area."',
+    'GD': 'Message Box - "This area of America Online is no longer available."',
+    'GG': 'Message Box - "This area of America Online is no longer available."',
+    'GK': 'Message Box - "This area of America Online is no longer available."',
+    'GO': 'Message Box - "This area of America Online is no longer available."',
+    'GP': 'Message Box - "This area of America Online is no longer available."',
+    'GX': 'Message Box - "This area of America Online is no longer available."',
+    'g!': 'Message Box - "You do not have access to this function."',
+    'g#': 'Message Box - "You do not have access to this function."',
+    'g$': 'Message Box - "You do not have access to this function."',
+    'g%': 'Message Box - "You do not have access to this function."',
+    'g@': 'Message Box - "You do not have access to this function."',
+    'gy': 'Message Box - "Sorry, that application has been removed."',
+    'hC': 'Message Box - "You do not have access to this function."',
+    'hD': 'Message Box - "You do not have access to this function."',
+    'hE': 'Message Box - "You do not have access to this function."',
+    'hb': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hc': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hd': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'he': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hf': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hg': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hh': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hi': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hj': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hk': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hl': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hm': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hn': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'ho': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'hp': 'Message Box - "Access denied. Please activate host access before using this function"',
+    'NJ': 'Parental Control Functions',
+    'NK': 'Parental Controls Main',
+    'NN': 'Edit Parental Controls',
+    'NO': 'Message Box - "Your request can not be processed at this time. Please try again later"',
+    'pw?': 'Get Stock Information',
+    'r@': 'Message Box - "You do not have access to this feature."',
+    'rh': 'AOL Rewards account history',
+    'rt': 'Message Box - " Sorry, but this AOL Rewards area is not available right now. Please try again later."',
+    'SP': 'Message Box - "Internal error."',
+    's2': 'Sorry, but you do not have access to this file/library',
+    's3': 'Sorry, but you do not have access to this file/library',
+    's4': 'Sorry, but you do not have access to this file/library',
+    's5': 'Sorry, but you do not have access to this file/library',
+    's6': 'Sorry, but you do not have access to this file/library',
+    's7': 'Sorry, but you do not have access to this file/library',
+    's8': 'Sorry, but you do not have access to this file/library',
+    's9': 'Sorry, but you do not have access to this file/library',
+    'sa': 'Sorry, but you do not have access to this file/library',
+    'sb': 'Sorry, but you do not have access to this file/library',
+    'sd': 'Sorry, but you do not have access to this file/library',
+    'sf': 'Sorry, but you do not have access to this file/library',
+    'sh': 'Sorry, but you do not have access to this file/library',
+    'sj': 'Sorry, but you do not have access to this file/library',
+    'sl': 'Sorry, but you do not have access to this file/library',
+    'sm': 'Sorry, but you do not have access to this file/library',
+    'sn': 'Sorry, but you do not have access to this file/library',
+    'ss': 'Sorry, but you do not have access to this file/library',
+    'U1': 'Article/Selection/Page',
+    'U2': 'Article/Selection/Page',
+    'U3': 'Article/Selection/Page',
+    'U4': 'Article/Selection/Page',
+    'V_ (All V tokens)': 'Sign offline with message, "Internal Error #4213 - notify customer service!"',
+    'WT': 'Message Box - "We\'re sorry, a system error has occurred. Please try again later."',
+}
@@ -0,0 +1,68 @@
+'''Acknowledgement of received packets.'''
+import asyncio
+import logging
+
+
+_logger = logging.getLogger(__name__)
+
+
+class AckScheduler(object):
+    '''Coalesces acknowledgements of received packets.
+
+    Every packet sent carries the receive sequence number, so an ACK is
+    only needed when nothing else goes out for a while. :meth:`schedule`
+    marks an acknowledgement pending and starts a timer of `delay`
+    seconds. Sending any packet calls :meth:`piggybacked` which clears it.
+
+    When the timer fires, `ack_callback` is called. It returns True if it
+    sent a standalone ACK, or False if other packets are queued, in which
+    case the timer starts again.
+
+    Attributes:
+        delay (float): Seconds to wait for an outgoing packet to carry the
+            acknowledgement.
+        sent (int): Standalone ACKs requested from `ack_callback`.
+        coalesced (int): Acknowledgements made unnecessary by another
+            acknowledgement or an outgoing packet.
+    '''
+    def __init__(self, ack_callback, delay=0.05):
+        self.delay = delay
+        self.sent = 0
+        self.coalesced = 0
+        self._ack_callback = ack_callback
+        self._timer = None
+
+    @property
+    def pending(self):
+        '''Whether an acknowledgement is waiting to be sent.'''
+        return self._timer is not None
+
+    def schedule(self):
+        '''Request an acknowledgement.'''
+        if self._timer:
+            self.coalesced += 1
+            return
+
+        self._timer = asyncio.get_running_loop().call_later(
+            self.delay, self._fire)
+
+    def piggybacked(self):
+        '''Note that an outgoing packet carried the acknowledgement.'''
+        if self._timer:
+            self.coalesced += 1
+            self.cancel()
+
+    def cancel(self):
+        '''Discard the pending acknowledgement.'''
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _fire(self):
+        self._timer = None
+
+        if self._ack_callback():
+            self.sent += 1
+        else:
+            _logger.debug('Writes queued, delaying ACK.')
+            self.schedule()
@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+
+from notaol.p3.ack import AckScheduler
+
+
+class TestAckScheduler(unittest.TestCase):
+    def test_coalesce(self):
+        async def run():
+            calls = []
+            scheduler = AckScheduler(lambda: calls.append(1) or True, 0.01)
+
+            scheduler.schedule()
+            scheduler.schedule()
+            scheduler.schedule()
+            self.assertTrue(scheduler.pending)
+
+            await asyncio.sleep(0.05)
+
+            self.assertEqual(1, len(calls))
+            self.assertEqual(1, scheduler.sent)
+            self.assertEqual(2, scheduler.coalesced)
+            self.assertFalse(scheduler.pending)
+
+        asyncio.run(run())
+
+    def test_piggybacked(self):
+        async def run():
+            calls = []
+            scheduler = AckScheduler(lambda: calls.append(1) or True, 0.01)
+
+            scheduler.schedule()
+            scheduler.piggybacked()
+            scheduler.piggybacked()
+
+            await asyncio.sleep(0.05)
+
+            self.assertFalse(calls)
+            self.assertEqual(1, scheduler.coalesced)
+
+        asyncio.run(run())
+
+    def test_busy(self):
+        async def run():
+            results = [False, True]
+            scheduler = AckScheduler(lambda: results.pop(0), 0.01)
+
+            scheduler.schedule()
+            await asyncio.sleep(0.05)
+
+            self.assertFalse(results)
+            self.assertEqual(1, scheduler.sent)
+
+        asyncio.run(run())
@@ -1,12 +1,15 @@
 import asyncio
 import logging
 
+from notaol.p3.ack import AckScheduler
 from notaol.p3.init import InitPayload
 from notaol.p3.packet import Packet, PacketType
 from notaol.p3.stream import Stream
-from notaol.p3.control import AckPayload
+from notaol.p3.control import AckPayload, NakPayload, SSRPayload
 from notaol.p3.data import DataPayload
-from notaol.p3 import login
+from notaol.p3.queue import PacketQueue, Overflow, QueueClosed
+from notaol.p3.router import TokenRouter
+from notaol.p3.window import TransmitWindow
 
 
 _logger = logging.getLogger(__name__)
@@ -24,111 +27,239 @@ class SequenceInfo(object):
             self.transmit = 0x10
 
 
-class Client(object):
+class SessionCounters(object):
+    '''Error counters for a session.
+
+    Attributes:
+        corrupt_packets (int): Received packets that failed the checksum.
+        naks_sent (int): NAK packets sent in reply to corrupt packets.
+        retransmitted_packets (int): Data packets sent again after a NAK
+            or SS.
+    '''
     def __init__(self):
+        self.corrupt_packets = 0
+        self.naks_sent = 0
+        self.retransmitted_packets = 0
+
+
+class Client(object):
+    '''P3 session.
+
+    Incoming data packets are first offered to the token handlers of
+    :attr:`router` and to :meth:`expect` waiters. Packets that nobody takes
+    are delivered through a bounded queue. Use ``async for packet in
+    client`` or :meth:`read_packet` to receive them.
+
+    Args:
+        window_size (int): Maximum number of unacknowledged data packets.
+        queue_size (int): Number of incoming packets kept for the consumer.
+        overflow (Overflow): What to do when the consumer falls behind.
+        ack_delay (float): Seconds to wait for an outgoing packet to carry
+            the acknowledgement of received packets before sending an ACK.
+
+    Attributes:
+        router (TokenRouter): Handlers for incoming data packets.
+        counters (SessionCounters): Error counters.
+    '''
+    def __init__(self, window_size=16, queue_size=256,
+                 overflow=Overflow.drop_oldest, ack_delay=0.05):
         self._stream = Stream()
         self._running = False
         self._read_task = None
         self._sequence_info = SequenceInfo()
-        self._incoming_packet_condition = asyncio.Condition()
-        self._incoming_packet = None
+        self._window = TransmitWindow(window_size)
+        self.counters = SessionCounters()
+        self._incoming_packets = PacketQueue(queue_size, overflow)
+        self.router = TokenRouter()
+        self._acks = AckScheduler(self._ack_due, ack_delay)
+        self._ack_packet = Packet(payload=AckPayload())
+        self._ack_task = None
+        self._writes_pending = 0
 
     def close(self):
         self._stream.close()
         self._running = False
+        self._incoming_packets.close()
+        self._acks.cancel()
+
+        if self._ack_task:
+            self._ack_task.cancel()
+
+    async def read_packet(self):
+        '''Return the next incoming data packet.
 
-    @asyncio.coroutine
-    def _read_packets(self):
+        Coroutine. Raises :class:`QueueClosed` after the client is closed.
+        '''
+        return await self._incoming_packets.get()
+
+    def __aiter__(self):
+        return self._incoming_packets.__aiter__()
+
+    async def expect(self, token, timeout=None):
+        '''Wait for the next data packet with `token` and return it.
+
+        Coroutine. Raises :class:`asyncio.TimeoutError` after `timeout`
+        seconds.
+        '''
+        return await asyncio.wait_for(self.router.expect(token), timeout)
+
+    async def _read_packets(self):
         assert self._running
 
         while self._running:
             try:
-                packet = yield from self._stream.read_packet()
+                packets = await self._stream.read_packets()
             except Exception:
                 _logger.exception('Read error')
                 self._running = False
                 self.close()
                 raise
 
-            try:
-                yield from self._process_packet(packet)
-            except Exception:
-                _logger.exception('Process packet error')
-                raise
+            for packet in packets:
+                if packet.corrupt:
+                    await self._reject_packet(packet)
+                    continue
+
+                try:
+                    await self._process_packet(packet)
+                except Exception:
+                    _logger.exception('Process packet error')
+                    raise
+
+    async def _reject_packet(self, packet):
+        _logger.debug('Reject corrupt packet %s', packet)
+
+        self.counters.corrupt_packets += 1
 
-    @asyncio.coroutine
-    def _process_packet(self, packet):
+        nak_packet = Packet(payload=NakPayload())
+        await self._write_packet(nak_packet)
+
+        self.counters.naks_sent += 1
+
+    async def _process_packet(self, packet):
         _logger.debug('Process packet %s', packet)
 
+        self._window.acknowledge(packet.rx_seq)
+
         if packet.type == PacketType.heartbeat:
             _logger.debug('Reply to heartbeat')
-            ack_packet = Packet(payload=AckPayload())
-            yield from self._write_packet(ack_packet)
+            self._acks.schedule()
         elif packet.type == PacketType.ack:
             assert isinstance(packet.tx_seq, int)
             self._sequence_info.receive = packet.tx_seq
+        elif packet.type == PacketType.ss:
+            _logger.debug('Reply to SS')
+            ssr_packet = Packet(payload=SSRPayload())
+            await self._write_packet(ssr_packet)
+            await self._retransmit()
+        elif packet.type == PacketType.nak:
+            _logger.debug('Got NAK')
+            await self._retransmit()
         else:
             _logger.debug('Unhandled packet')
             self._sequence_info.receive = packet.tx_seq
-            self._sequence_info.transmit = packet.rx_seq
 
-            yield from self._incoming_packet_condition.acquire()
-            self._incoming_packet = packet
-            self._incoming_packet_condition.notify()
-            self._incoming_packet_condition.release()
-            yield from asyncio.sleep(0.01)
+            if packet.type == PacketType.data:
+                self._acks.schedule()
+
+            if self.router.dispatch(packet):
+                return
+
+            try:
+                await self._incoming_packets.put(packet)
+            except QueueClosed:
+                pass
+
+    async def connect(self, timeout=30.0):
+        '''Connect and wait for the server to accept the session.
 
-    @asyncio.coroutine
-    def connect(self):
+        Coroutine. Raises :class:`asyncio.TimeoutError` if the SD token
+        packet does not arrive within `timeout` seconds.
+        '''
         _logger.info('Client connecting.')
         assert not self._running
         self._running = True
-        yield from self._stream.connect()
-        self._read_task = asyncio.async(self._read_packets())
+        await self._stream.connect()
+
+        # Wait before sending INIT so a quick reply is not missed.
+        sd_packet = self.router.expect(b'SD')
+        self._read_task = asyncio.ensure_future(self._read_packets())
 
         init_packet = Packet(payload=InitPayload())
 
-        yield from self._write_packet(init_packet)
+        try:
+            await self._write_packet(init_packet)
 
-        while True:
             _logger.debug('Waiting for SD token packet.')
+            await asyncio.wait_for(sd_packet, timeout)
+        finally:
+            sd_packet.cancel()
 
-            yield from self._incoming_packet_condition.acquire()
-            yield from self._incoming_packet_condition.wait()
-            packet = self._incoming_packet
-            self._incoming_packet_condition.release()
+        _logger.debug('Got SD token packet!')
 
-            if isinstance(packet.payload, DataPayload) and \
-                    packet.payload.token_str == 'SD':
-                _logger.debug('Got SD token packet!')
-                break
-            else:
-                _logger.debug('Did not get SD token packet.')
-
-    @asyncio.coroutine
-    def login(self, username, password):
+    async def login(self, username, password):
         _logger.info('Client login.')
 
+        # The login stream needs the atom tables, which load slowly, so it
+        # is imported when first used.
+        from notaol.p3 import login
+
         payload = DataPayload()
         payload.token_str = 'Dd'
-        payload.atom_stream = login.new_login_atom_stream(
-            username, password)
+        payload.data = login.render_login(username, password)
 
         packet = Packet()
         packet.apply_payload(payload)
 
-        yield from self._write_packet(packet)
+        await self._write_packet(packet)
 
-    @asyncio.coroutine
-    def _write_packet(self, packet):
+    def _ack_due(self):
+        if self._writes_pending:
+            return False
+
+        _logger.debug('Send ACK')
+        self._ack_task = asyncio.ensure_future(
+            self._write_packet(self._ack_packet))
+        self._ack_task.add_done_callback(self._ack_written)
+
+        return True
+
+    def _ack_written(self, task):
+        if self._ack_task is task:
+            self._ack_task = None
+
+        if not task.cancelled() and task.exception():
+            _logger.exception('ACK write error', exc_info=task.exception())
+
+    async def _write_packet(self, packet):
         if packet.type == PacketType.data:
+            await self._window.wait_for_space()
             self._sequence_info.increment_transmit()
-        
-        packet.tx_seq = self._sequence_info.transmit
-        packet.rx_seq = self._sequence_info.receive
-        packet.compute_checksum()
 
-        yield from self._stream.write_packet(packet)
+        # Counted only once the window has room. A writer blocked on a
+        # full window sends nothing, so the ACK must not wait for it.
+        self._writes_pending += 1
+
+        try:
+            packet.tx_seq = self._sequence_info.transmit
+            packet.rx_seq = self._sequence_info.receive
+            self._acks.piggybacked()
+
+            if packet.type == PacketType.data:
+                self._window.push(packet)
+
+            await self._stream.write_packet(packet)
+        finally:
+            self._writes_pending -= 1
 
         if packet.type == PacketType.init:
             self._sequence_info.increment_transmit()
+
+    async def _retransmit(self):
+        '''Send the unacknowledged data packets again.'''
+        for packet in tuple(self._window):
+            _logger.debug('Retransmit packet 0x%x', packet.tx_seq)
+            packet.rx_seq = self._sequence_info.receive
+            self._acks.piggybacked()
+            await self._stream.write_packet(packet)
+            self.counters.retransmitted_packets += 1
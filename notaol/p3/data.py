@@ -1,54 +1,234 @@
+import collections
 import logging
 
 from notaol.fdo.stream import AtomStream
-from notaol.fdo.token import TOKEN_TO_DESC_MAP
+from notaol.fdo.token import TOKEN_ID_STRUCT, token_id, \
+    get_token_id_description
 from notaol.p3.payload import BasePayload
 
 
 _logger = logging.getLogger(__name__)
 
 
+def _token_key(token):
+    return token if isinstance(token, int) else token_id(token)
+
+
+def _lookup_data(data):
+    # Read-only memoryviews hash and compare like bytes, so lookups need
+    # no copy.
+    if isinstance(data, bytes) or \
+            isinstance(data, memoryview) and data.readonly:
+        return data
+
+    return bytes(data)
+
+
+class ParseCache(object):
+    '''Least recently used cache of parsed atom streams.
+
+    Entries are keyed by the token ID and payload bytes, so a stream that
+    repeats is decoded once. Tokens may be given as bytes, strings or
+    integer IDs. Cached streams are shared, so their atoms
+    are stored as a tuple.
+
+    Args:
+        max_bytes (int): Budget for the payload bytes held as keys. The
+            least recently used entries are evicted to stay under it.
+
+    Attributes:
+        size (int): Payload bytes currently held.
+        hits (int): Lookups that found a stream.
+        misses (int): Lookups that did not.
+    '''
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, token, data):
+        '''Return the cached stream of a payload or None.'''
+        key = (_token_key(token), _lookup_data(data))
+        atom_stream = self._entries.get(key)
+
+        if atom_stream is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return atom_stream
+
+    def put(self, token, data, atom_stream):
+        '''Cache a parsed stream and return the shared copy.
+
+        `atom_stream` should be parsed from `data` given as bytes. Its
+        arguments are views of the data they were parsed from, so a stream
+        parsed from a larger buffer would keep all of it alive.
+        '''
+        data = bytes(data)
+        shared = AtomStream()
+        shared.stream_id = atom_stream.stream_id
+        shared.atom_protocol_id = atom_stream.atom_protocol_id
+        shared.errors = atom_stream.errors
+        shared.atoms = tuple(atom_stream.atoms)
+
+        if len(data) > self.max_bytes:
+            return shared
+
+        key = (_token_key(token), data)
+
+        if key not in self._entries:
+            self.size += len(data)
+
+        self._entries[key] = shared
+        self._entries.move_to_end(key)
+
+        while self.size > self.max_bytes:
+            key, dummy = self._entries.popitem(last=False)
+            self.size -= len(key[1])
+
+        return shared
+
+    def invalidate(self, token=None):
+        '''Remove the entries of a token, or all entries if None.'''
+        if token is None:
+            self._entries.clear()
+            self.size = 0
+            return
+
+        token = _token_key(token)
+
+        for key in [key for key in self._entries if key[0] == token]:
+            del self._entries[key]
+            self.size -= len(key[1])
+
+
 class DataPayload(BasePayload):
     '''FDO 91 Atom messages.
 
     Attributes:
-        token (bytes): 2 bytes. The type of atom message.
+        token_id (int): The token as a 16-bit integer. None if the token
+            is not set or was cut short.
+        token (bytes): 2 bytes. The type of atom message. Fewer if the
+            parsed data was too short.
         data (bytes): The payload bytes of the atom message.
         token_str (str): The token expressed as a string.
-        atom_stream (AtomStream): The atom stream.
+        atom_stream (AtomStream): The atom stream. Parsed from :attr:`data`
+            on first access.
     '''
+    __slots__ = ('token_id', 'data', '_short_token', '_atom_stream',
+                 '_atom_stream_parsed')
+
+    parse_cache = None
+    '''A :class:`ParseCache` shared by all payloads. Off if None.'''
+
     def __init__(self):
-        self.token = None
+        self.token_id = None
         self.data = None
-        self.atom_stream = None
+        self._short_token = None
+        self._atom_stream = None
+        self._atom_stream_parsed = True
+
+    @property
+    def token(self):
+        if self.token_id is not None:
+            return TOKEN_ID_STRUCT.pack(self.token_id)
+
+        return self._short_token
+
+    @token.setter
+    def token(self, token):
+        self.token_id = None if token is None else \
+            TOKEN_ID_STRUCT.unpack(token)[0]
+        self._short_token = None
 
     @property
     def token_str(self):
-        return self.token.decode('latin-1')
+        token = self.token
+
+        if token is not None:
+            return token.decode('latin-1')
 
     @token_str.setter
     def token_str(self, token):
         self.token = token.encode('latin-1')
 
+    @property
+    def atom_stream(self):
+        if not self._atom_stream_parsed:
+            self._atom_stream_parsed = True
+            cache = self.parse_cache
+
+            if cache is not None:
+                self._atom_stream = cache.get(self.token_id, self.data)
+
+                if self._atom_stream is not None:
+                    return self._atom_stream
+
+            data = self.data
+
+            if cache is not None:
+                # Cached arguments must not hold on to the packet buffer.
+                data = bytes(data)
+
+            self._atom_stream = AtomStream()
+
+            try:
+                self._atom_stream.parse(data)
+                atoms = self._atom_stream.atoms
+            except Exception:
+                _logger.exception('Error parsing atom stream.')
+                self._atom_stream = None
+                return None
+
+            if not atoms and self._atom_stream.errors:
+                _logger.debug('Atom stream %r could not be decoded: %s',
+                              self.token, self._atom_stream.errors)
+                self._atom_stream = None
+            elif cache is not None:
+                self._atom_stream = cache.put(
+                    self.token_id, data, self._atom_stream)
+
+        return self._atom_stream
+
+    @atom_stream.setter
+    def atom_stream(self, atom_stream):
+        self._atom_stream = atom_stream
+        self._atom_stream_parsed = True
+
     def parse(self, data):
-        self.token = data[:2]
-        self.data = data[2:]
+        '''Parse the token. The atom stream is parsed on first access.'''
+        if len(data) >= 2:
+            self.token_id = TOKEN_ID_STRUCT.unpack_from(data)[0]
+            self._short_token = None
+        else:
+            # Truncated packet. The short token is kept as it is so that
+            # to_bytes() gives back the same data.
+            self.token_id = None
+            self._short_token = bytes(data)
 
-        self.atom_stream = AtomStream()
-        try:
-            self.atom_stream.parse(data[2:])
-        except Exception:
-            _logger.exception('Error parsing atom stream.')
-            self.atom_stream = None
+        self.data = data[2:]
+        self._atom_stream = None
+        self._atom_stream_parsed = False
 
     def to_bytes(self):
-        if self.atom_stream:
-            self.data = self.atom_stream.to_bytes()
+        if self._atom_stream:
+            self.data = self._atom_stream.to_bytes()
 
         return self.token + self.data
 
     def __str__(self):
-        token_desc = TOKEN_TO_DESC_MAP.get(self.token_str)
+        if self.token_id is not None:
+            token_desc = get_token_id_description(self.token_id)
+        else:
+            token_desc = None
 
         if token_desc:
             token_text = '{} ({})'.format(self.token_str, token_desc)
@@ -0,0 +1,107 @@
+import codecs
+import unittest
+
+from notaol.fdo.atomdef import Atom
+from notaol.p3.data import DataPayload, ParseCache
+
+
+# Dd token sent from client
+SAMPLE_LOGIN_DATA = b'Dd' + codecs.decode(b'0016000100010a0400000001010b040000000503010a61736466202020202020011d00011d00010a040000000203010950617373576f726431011d00010a0400000010010b0400000001011d00011d00000200', 'hex')
+
+
+class TestDataPayload(unittest.TestCase):
+    def test_lazy_parse(self):
+        payload = DataPayload()
+        payload.parse(memoryview(SAMPLE_LOGIN_DATA))
+
+        self.assertEqual('Dd', payload.token_str)
+        self.assertEqual(0x4464, payload.token_id)
+        self.assertIsNone(payload._atom_stream)
+        self.assertEqual(SAMPLE_LOGIN_DATA, payload.to_bytes())
+
+        atom_stream = payload.atom_stream
+
+        self.assertEqual(0x16, atom_stream.stream_id)
+        self.assertEqual(Atom.uni_start_stream, atom_stream.atoms[0][0])
+        self.assertEqual(b'asdf      ', atom_stream.atoms[3][1])
+        self.assertIs(atom_stream, payload.atom_stream)
+
+    def test_no_token(self):
+        payload = DataPayload()
+
+        self.assertIsNone(payload.token)
+        self.assertIsNone(payload.token_str)
+        self.assertEqual('<Data Payload Token=None>', str(payload))
+
+        payload.parse(b'D')
+        self.assertIsNone(payload.token_id)
+        self.assertEqual('D', payload.token_str)
+        self.assertEqual(b'D', payload.to_bytes())
+        self.assertIn('Token=D ', str(payload))
+
+    def test_bad_atom_stream(self):
+        payload = DataPayload()
+        payload.parse(b'Dd\x16\x00')
+
+        self.assertEqual(b'Dd', payload.token)
+        self.assertIsNone(payload.atom_stream)
+
+    def test_partial_atom_stream(self):
+        payload = DataPayload()
+        payload.parse(SAMPLE_LOGIN_DATA[:-4])
+        atom_stream = payload.atom_stream
+
+        self.assertEqual(Atom.uni_start_stream, atom_stream.atoms[0][0])
+        self.assertEqual(1, len(atom_stream.errors))
+
+
+class TestParseCache(unittest.TestCase):
+    def tearDown(self):
+        DataPayload.parse_cache = None
+
+    def test_cache(self):
+        cache = ParseCache()
+        DataPayload.parse_cache = cache
+        atom_streams = []
+
+        for dummy in range(3):
+            payload = DataPayload()
+            payload.parse(memoryview(SAMPLE_LOGIN_DATA))
+            atom_streams.append(payload.atom_stream)
+
+        self.assertIs(atom_streams[0], atom_streams[2])
+        self.assertIsInstance(atom_streams[0].atoms, tuple)
+
+        for dummy, arg in atom_streams[0].atoms:
+            if isinstance(arg, memoryview):
+                self.assertIsNot(SAMPLE_LOGIN_DATA, arg.obj)
+
+        self.assertEqual(b'asdf      ', atom_streams[0].atoms[3][1])
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(len(SAMPLE_LOGIN_DATA) - 2, cache.size)
+
+        cache.invalidate(b'AB')
+        self.assertEqual(1, len(cache))
+
+        cache.invalidate(b'Dd')
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size)
+
+    def test_budget(self):
+        cache = ParseCache(max_bytes=10)
+        payload = DataPayload()
+        payload.parse(b'Dd\x16\x00\x01\x00')
+        atom_stream = payload.atom_stream
+
+        cache.put(b'AA', b'12345', atom_stream)
+        cache.put(b'BB', b'12345', atom_stream)
+        cache.get(b'AA', b'12345')
+        cache.put(b'CC', b'12345', atom_stream)
+
+        self.assertIsNotNone(cache.get(b'AA', b'12345'))
+        self.assertIsNone(cache.get(b'BB', b'12345'))
+        self.assertEqual(10, cache.size)
+
+        cache.put(b'DD', b'x' * 11, atom_stream)
+        self.assertEqual(2, len(cache))
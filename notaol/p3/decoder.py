@@ -0,0 +1,167 @@
+'''Incremental message framing.'''
+import logging
+
+from notaol.p3.packet import Packet, PACKET_START, PACKET_END, \
+    HEADER_LENGTH, HEADER_SIZE_OFFSET
+
+
+_logger = logging.getLogger(__name__)
+
+_START_BYTE = PACKET_START[0]
+_END_BYTE = PACKET_END[0]
+
+# header is 8 bytes + data + stop byte; the length field counts 3 header
+# bytes as part of the data.
+FRAME_OVERHEAD = HEADER_LENGTH - HEADER_SIZE_OFFSET + 1
+MIN_FREE_SPACE = 4096
+
+
+class FrameDecoder(object):
+    '''Sans-IO decoder that splits a byte stream into packets.
+
+    Bytes are appended to one receive buffer that is reused between calls.
+    Every complete packet found is returned by :meth:`feed`. The packets
+    of one call share a single copy of the received bytes through
+    memoryviews instead of each packet slicing its own.
+
+    When the start of a frame is not :data:`PACKET_START` or the frame does
+    not end with :data:`PACKET_END`, the decoder skips ahead to the next
+    start byte.
+
+    If `verify_checksum` is True, the checksum of each frame is checked
+    before its payload is parsed. Frames that fail are still returned but
+    are marked :attr:`Packet.corrupt` so the receiver can NAK them.
+
+    Attributes:
+        resync_count (int): Number of times framing was lost.
+        discarded_bytes (int): Number of bytes skipped while resyncing.
+        corrupt_count (int): Number of frames that failed the checksum.
+    '''
+    def __init__(self, buffer_size=8192, verify_checksum=True):
+        self._buffer = bytearray(buffer_size)
+        self._start = 0
+        self._end = 0
+        self._verify_checksum = verify_checksum
+        self.resync_count = 0
+        self.discarded_bytes = 0
+        self.corrupt_count = 0
+
+    def __len__(self):
+        '''Return the number of buffered bytes not yet decoded.'''
+        return self._end - self._start
+
+    def feed(self, data):
+        '''Add received bytes and return a list of complete packets.'''
+        size = len(data)
+
+        if size:
+            self._reserve(size)
+            self._buffer[self._end:self._end + size] = data
+            self._end += size
+
+        return self._decode()
+
+    def get_buffer(self, size_hint=-1):
+        '''Return a writable view of the free space in the buffer.
+
+        Data can be received directly into the view instead of calling
+        :meth:`feed`. Call :meth:`buffer_updated` with the number of bytes
+        written. The view must be released before the next call.
+        '''
+        self._reserve(max(size_hint, MIN_FREE_SPACE))
+
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, size):
+        '''Account for `size` bytes written into the view from
+        :meth:`get_buffer` and return a list of complete packets.'''
+        self._end += size
+
+        return self._decode()
+
+    def _reserve(self, size):
+        '''Make room for `size` more bytes at the end of the buffer.'''
+        if self._start == self._end:
+            self._start = self._end = 0
+
+        if self._end + size <= len(self._buffer):
+            return
+
+        pending = self._end - self._start
+
+        if self._start:
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+            self._start = 0
+            self._end = pending
+
+        if pending + size > len(self._buffer):
+            new_size = max(len(self._buffer) * 2, pending + size)
+            self._buffer.extend(bytes(new_size - len(self._buffer)))
+
+    def _skip(self, position):
+        '''Resync to the next start byte after `position`.'''
+        index = self._buffer.find(PACKET_START, position + 1, self._end)
+
+        if index == -1:
+            index = self._end
+
+        _logger.debug('Lost framing, skipping %d bytes.', index - position)
+
+        self.resync_count += 1
+        self.discarded_bytes += index - position
+
+        return index
+
+    def _decode(self):
+        buffer = self._buffer
+        end = self._end
+        position = self._start
+        frames = []
+
+        while end - position >= HEADER_LENGTH:
+            if buffer[position] != _START_BYTE:
+                position = self._skip(position)
+                continue
+
+            length = buffer[position + 3] << 8 | buffer[position + 4]
+
+            if length < HEADER_SIZE_OFFSET:
+                position = self._skip(position)
+                continue
+
+            frame_size = length + FRAME_OVERHEAD
+
+            if end - position < frame_size:
+                break
+
+            if buffer[position + frame_size - 1] != _END_BYTE:
+                position = self._skip(position)
+                continue
+
+            frames.append((position, frame_size))
+            position += frame_size
+
+        packets = []
+
+        if frames:
+            offset = frames[0][0]
+            view = memoryview(bytes(buffer[offset:position]))
+
+            for frame_start, frame_size in frames:
+                frame_start -= offset
+                packet = Packet()
+                packet.parse(view[frame_start:frame_start + frame_size],
+                             verify_checksum=self._verify_checksum)
+
+                if packet.corrupt:
+                    _logger.debug('Bad checksum 0x%x.', packet.crc)
+                    self.corrupt_count += 1
+
+                packets.append(packet)
+
+        if position == end:
+            self._start = self._end = 0
+        else:
+            self._start = position
+
+        return packets
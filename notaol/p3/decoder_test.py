@@ -0,0 +1,95 @@
+import codecs
+import unittest
+
+from notaol.p3.decoder import FrameDecoder
+from notaol.p3.packet import PacketType
+
+
+SAMPLE_INIT_PACKET = codecs.decode(b'5ab35f00377f7fa3039d116180000000050f00001fb4b53ec00014d1032000000000040a0000014b070504ffff0000000000fffec8f718000001b2070d', 'hex')
+SAMPLE_ACK_PACKET = codecs.decode(b'5a6a0c00031011a40d', 'hex')
+
+
+class TestFrameDecoder(unittest.TestCase):
+    def test_single_packet(self):
+        decoder = FrameDecoder()
+        packets = decoder.feed(SAMPLE_INIT_PACKET)
+
+        self.assertEqual(1, len(packets))
+        self.assertEqual(PacketType.init, packets[0].type)
+        self.assertEqual(157 << 8 | 17, packets[0].payload.client_version)
+        self.assertEqual(SAMPLE_INIT_PACKET, packets[0].to_bytes())
+        self.assertEqual(0, len(decoder))
+
+    def test_byte_at_a_time(self):
+        decoder = FrameDecoder(buffer_size=4)
+        packets = []
+
+        for index in range(len(SAMPLE_INIT_PACKET)):
+            packets.extend(decoder.feed(SAMPLE_INIT_PACKET[index:index + 1]))
+
+            if index < len(SAMPLE_INIT_PACKET) - 1:
+                self.assertFalse(packets)
+
+        self.assertEqual(1, len(packets))
+        self.assertEqual(SAMPLE_INIT_PACKET, packets[0].to_bytes())
+
+    def test_many_packets(self):
+        decoder = FrameDecoder()
+        data = SAMPLE_ACK_PACKET + SAMPLE_INIT_PACKET * 3 + SAMPLE_ACK_PACKET
+
+        packets = decoder.feed(data[:-4])
+
+        self.assertEqual(4, len(packets))
+        self.assertEqual(PacketType.ack, packets[0].type)
+        self.assertEqual(PacketType.init, packets[3].type)
+
+        packets = decoder.feed(data[-4:])
+
+        self.assertEqual(1, len(packets))
+        self.assertEqual(SAMPLE_ACK_PACKET, packets[0].to_bytes())
+
+    def test_resync(self):
+        decoder = FrameDecoder()
+        corrupt = bytearray(SAMPLE_INIT_PACKET)
+        corrupt[-1] = 0
+
+        packets = decoder.feed(
+            b'garbage' + bytes(corrupt) + SAMPLE_ACK_PACKET)
+
+        self.assertEqual(1, len(packets))
+        self.assertEqual(PacketType.ack, packets[0].type)
+        self.assertEqual(2, decoder.resync_count)
+        self.assertEqual(len(b'garbage') + len(corrupt),
+                         decoder.discarded_bytes)
+
+    def test_corrupt(self):
+        decoder = FrameDecoder()
+        corrupt = bytearray(SAMPLE_INIT_PACKET)
+        corrupt[20] ^= 0xff
+
+        packets = decoder.feed(bytes(corrupt) + SAMPLE_ACK_PACKET)
+
+        self.assertEqual(2, len(packets))
+        self.assertTrue(packets[0].corrupt)
+        self.assertIsNone(packets[0].payload)
+        self.assertFalse(packets[1].corrupt)
+        self.assertEqual(1, decoder.corrupt_count)
+        self.assertEqual(0, decoder.resync_count)
+
+    def test_get_buffer(self):
+        decoder = FrameDecoder(buffer_size=16)
+        data = SAMPLE_INIT_PACKET + SAMPLE_ACK_PACKET
+        packets = []
+
+        while data:
+            with decoder.get_buffer(7) as view:
+                self.assertGreaterEqual(len(view), 7)
+                size = min(7, len(data))
+                view[:size] = data[:size]
+
+            packets.extend(decoder.buffer_updated(size))
+            data = data[size:]
+
+        self.assertEqual(2, len(packets))
+        self.assertEqual(SAMPLE_INIT_PACKET, packets[0].to_bytes())
+        self.assertEqual(SAMPLE_ACK_PACKET, packets[1].to_bytes())
@@ -43,6 +43,16 @@ class InitPayload(BasePayload):
         unknown2 (int): 2 bytes.
         speed (int): 1 byte.
     '''
+    __slots__ = (
+        'platform', 'client_version', 'build_num', 'machine_memory',
+        'app_memory', 'pc_type', 'release_month', 'release_day',
+        'customer_class', 'timestamp', 'dos_version', 'session_flags',
+        'video_type', 'cpu_type', 'media_type', 'windows_version', 'unknown1',
+        'windows_mem_type', 'horizontal_res', 'vertical_res', 'num_colors',
+        'filler1', 'region', 'language_1', 'language_2', 'language_3',
+        'language_4', 'unknown2', 'speed',
+    )
+
     TYPE_1_LENGTH = 49
     TYPE_2_LENGTH = 52
     field_struct_1 = struct.Struct('!BHBBBHBBHIHHBBIHHBHHHBHHHHHB')
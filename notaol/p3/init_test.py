@@ -17,7 +17,8 @@ class TestInit(unittest.TestCase):
         for i in range(len(SAMPLE_INIT_DATA)):
             print(SAMPLE_INIT_DATA[i], data[i])
 
-        print(init_payload.__dict__)
+        print(dict((name, getattr(init_payload, name))
+                   for name in InitPayload.__slots__))
 
         self.assertEqual(Platform.windows, init_payload.platform)
         self.assertEqual(0x14d1, init_payload.session_flags)
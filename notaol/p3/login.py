@@ -1,21 +1,18 @@
 from notaol.fdo.stream import AtomStream
 from notaol.fdo.atomdef import Atom
+from notaol.fdo.template import Slot, StreamTemplate
 
 
-def new_login_atom_stream(username, password):
-    assert len(username) <= 10
-
-    atom_stream = AtomStream()
-    atom_stream.stream_id = 0x16
-    atom_stream.atoms = [
+def new_login_atoms(username, password):
+    return [
         (Atom.uni_start_stream,),
         (Atom.man_set_context_relative, 1),
         (Atom.man_set_context_index, 5),
-        (Atom.de_data, username.ljust(10).encode('ascii')),
+        (Atom.de_data, username),
         (Atom.man_end_context,),
         (Atom.man_end_context,),
         (Atom.man_set_context_relative, 2),
-        (Atom.de_data, password.encode('ascii')),
+        (Atom.de_data, password),
         (Atom.man_end_context,),
         (Atom.man_set_context_relative, 16),
         (Atom.man_set_context_index, 1),
@@ -24,4 +21,30 @@ def new_login_atom_stream(username, password):
         (Atom.uni_end_stream,),
     ]
 
+
+LOGIN_TEMPLATE = StreamTemplate(
+    new_login_atoms(Slot('username'), Slot('password')), stream_id=0x16)
+
+
+def new_login_atom_stream(username, password):
+    assert len(username) <= 10
+
+    atom_stream = AtomStream()
+    atom_stream.stream_id = 0x16
+    atom_stream.atoms = new_login_atoms(
+        username.ljust(10).encode('ascii'), password.encode('ascii'))
+
     return atom_stream
+
+
+def render_login(username, password):
+    '''Return the serialized login atom stream.
+
+    Same as :func:`new_login_atom_stream` but filled into
+    :data:`LOGIN_TEMPLATE`.
+    '''
+    assert len(username) <= 10
+
+    return LOGIN_TEMPLATE.render(
+        username=username.ljust(10).encode('ascii'),
+        password=password.encode('ascii'))
@@ -2,7 +2,10 @@
 import enum
 import struct
 
-import crcmod
+try:
+    import crcmod.predefined
+except ImportError:
+    crcmod = None
 
 from notaol.p3.control import AckPayload, HeartbeatPayload, SSPayload, \
     SSRPayload, NakPayload
@@ -15,6 +18,49 @@ PACKET_START = b'\x5a'
 PACKET_END = b'\r'
 HEADER_LENGTH = 8
 HEADER_SIZE_OFFSET = 3
+CHECKSUM_OFFSET = 3
+
+
+def _new_crc16_table():
+    table = []
+
+    for index in range(256):
+        crc = index
+
+        for dummy in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0xa001
+            else:
+                crc >>= 1
+
+        table.append(crc)
+
+    return tuple(table)
+
+
+# CRC-16/ARC: reflected 0x8005 polynomial, zero initial value.
+CRC16_TABLE = _new_crc16_table()
+
+
+def table_crc16(data, crc=0):
+    '''Return the 16 bit CRC of `data` using :data:`CRC16_TABLE`.
+
+    Pass the result of a previous call as `crc` to continue the checksum
+    over more data.
+    '''
+    table = CRC16_TABLE
+
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xff]
+
+    return crc
+
+
+# Same signature as table_crc16() but implemented in C when available.
+if crcmod:
+    crc16 = crcmod.predefined.mkPredefinedCrcFun('crc-16')
+else:
+    crc16 = table_crc16
 
 
 class PacketType(enum.IntEnum):
@@ -70,10 +116,18 @@ class Packet(object):
         data (bytes): The data which the packet encapsulates.
         stop (bytes): 1 byte. The end of the packet.
         type (int): The actual value of the :attr:`type_flag`
-        payload: Object representing the :attr:`data`.
+        payload: Object representing the :attr:`data`. Parsed from the data
+            of a received packet on first access.
+        corrupt (bool): If True, the received :attr:`crc` did not match the
+            contents and :attr:`payload` was not parsed.
     '''
+    __slots__ = ('sync', 'crc', 'length', 'tx_seq', 'rx_seq', 'type_flag',
+                 'data', 'stop', '_payload', 'corrupt')
+
     header_struct = struct.Struct(HEADER_FORMAT)
-    crc_func = crcmod.predefined.mkPredefinedCrcFun('crc-16')
+    checksum_struct = struct.Struct('!HBBB')
+    crc_struct = struct.Struct('!H')
+    crc_func = staticmethod(crc16)
 
     def __init__(self, payload=None):
         self.sync = PACKET_START
@@ -84,7 +138,8 @@ class Packet(object):
         self.type_flag = None
         self.data = None
         self.stop = PACKET_END
-        self.payload = None
+        self._payload = None
+        self.corrupt = False
 
         if payload is not None:
             self.apply_payload(payload)
@@ -97,6 +152,18 @@ class Packet(object):
     def type(self, type_val):
         self.type_flag = type_val | 0x80
 
+    @property
+    def payload(self):
+        if self._payload is None and self.data is not None and \
+                self.type_flag is not None and not self.corrupt:
+            self.data_to_payload()
+
+        return self._payload
+
+    @payload.setter
+    def payload(self, payload):
+        self._payload = payload
+
     def __str__(self):
         return ('<Packet at {obj_id} Len={length} Tx=0x{tx:x} Rx=0x{rx:x} '
                 'Type=0x{type:x} Payload={payload}>'
@@ -115,17 +182,30 @@ class Packet(object):
         self.type = results[5]
 
     def parse_body(self, data):
-        '''Parse data after the header including the end stop marker.'''
+        '''Parse data after the header including the end stop marker.
+
+        The payload is parsed when it is first accessed.
+        '''
         self.data = data[:-1]
         self.stop = data[-1:]
-        self.data_to_payload()
+        self._payload = None
 
-    def parse(self, data):
-        '''Parse a complete packet including the end stop marker.'''
+    def parse(self, data, verify_checksum=False):
+        '''Parse a complete packet including the end stop marker.
+
+        The payload is parsed when it is first accessed. Until then only
+        :attr:`data` is kept, which may be a memoryview of `data`.
+
+        If `verify_checksum` is True, the checksum is checked as well. A
+        packet that fails the check is marked :attr:`corrupt` and has no
+        payload.
+        '''
         self.parse_header(data[:8])
         self.data = data[8:-1]
         self.stop = data[-1:]
-        self.data_to_payload()
+        self._payload = None
+        self.corrupt = verify_checksum and \
+            crc16(data[CHECKSUM_OFFSET:-1]) != self.crc
 
     def header_to_bytes(self):
         '''Return the 12-byte header.'''
@@ -153,15 +233,47 @@ class Packet(object):
         self.length = len(self.data) + HEADER_SIZE_OFFSET
 
     def compute_checksum(self):
-        '''Compute and apply the checksum.'''
-        data = self.to_bytes()[3:-1]
+        '''Compute and apply the checksum.
+
+        The checksum covers the header fields after the CRC and the data.
+        '''
+        crc = crc16(self.checksum_struct.pack(
+            self.length, self.tx_seq, self.rx_seq, self.type_flag))
+
+        self.crc = crc16(self.data, crc)
 
-        self.crc = Packet.crc_func(data)
+    def verify_checksum(self):
+        '''Return whether the checksum matches the header and data.'''
+        crc = crc16(self.checksum_struct.pack(
+            self.length, self.tx_seq, self.rx_seq, self.type_flag))
+
+        return crc16(self.data, crc) == self.crc
 
     def to_bytes(self):
         '''Return the packet as bytes.'''
         return self.header_to_bytes() + self.data + self.stop
 
+    def encode(self):
+        '''Compute the checksum and return the packet as bytes.
+
+        The checksum is computed over the frame as it is written so the
+        packet is only copied once.
+        '''
+        frame = bytearray(HEADER_LENGTH + len(self.data) + len(self.stop))
+        self.header_struct.pack_into(
+            frame, 0, self.sync, 0, self.length,
+            self.tx_seq, self.rx_seq, self.type_flag
+            )
+        frame[HEADER_LENGTH:-1] = self.data
+        frame[-1:] = self.stop
+
+        with memoryview(frame) as view:
+            self.crc = crc16(view[CHECKSUM_OFFSET:-1])
+
+        self.crc_struct.pack_into(frame, 1, self.crc)
+
+        return frame
+
     def prepare(self):
         '''Prepare the packet for transmission.'''
         self.payload_to_data()
@@ -1,6 +1,7 @@
 import unittest
 
-from notaol.p3.packet import Packet, PacketType
+from notaol.p3.packet import Packet, PacketType, crc16, table_crc16
+from notaol.p3.control import AckPayload
 import codecs
 
 
@@ -49,3 +50,59 @@ class TestPacket(unittest.TestCase):
         packet.payload_to_data()
         packet.compute_checksum()
         self.assertEqual(0xb35f, packet.crc)
+
+    def test_table_crc16(self):
+        self.assertEqual(0xbb3d, table_crc16(b'123456789'))
+        self.assertEqual(0xbb3d, table_crc16(b'6789', table_crc16(b'12345')))
+        self.assertEqual(crc16(SAMPLE_INIT_PACKET[3:-1]),
+                         table_crc16(SAMPLE_INIT_PACKET[3:-1]))
+
+    def test_encode(self):
+        packet = Packet()
+        packet.parse(SAMPLE_INIT_PACKET)
+        packet.crc = 0
+
+        self.assertEqual(SAMPLE_INIT_PACKET, packet.encode())
+        self.assertEqual(0xb35f, packet.crc)
+
+        packet.crc = 0
+        packet.compute_checksum()
+        self.assertEqual(0xb35f, packet.crc)
+
+    def test_encode_empty(self):
+        packet = Packet(payload=AckPayload())
+        packet.tx_seq = 0x10
+        packet.rx_seq = 0x11
+
+        data = packet.encode()
+        self.assertEqual(crc16(data[3:-1]), packet.crc)
+        self.assertEqual(packet.to_bytes(), data)
+
+    def test_verify_checksum(self):
+        packet = Packet()
+        packet.parse(SAMPLE_INIT_PACKET, verify_checksum=True)
+
+        self.assertFalse(packet.corrupt)
+        self.assertTrue(packet.verify_checksum())
+
+        packet.crc ^= 1
+        self.assertFalse(packet.verify_checksum())
+
+        corrupt = bytearray(SAMPLE_INIT_PACKET)
+        corrupt[1] ^= 1
+        packet = Packet()
+        packet.parse(bytes(corrupt), verify_checksum=True)
+
+        self.assertTrue(packet.corrupt)
+        self.assertIsNone(packet.payload)
+
+    def test_lazy_payload(self):
+        packet = Packet()
+        packet.parse(memoryview(SAMPLE_INIT_PACKET))
+
+        self.assertIsNone(packet._payload)
+        self.assertEqual(157 << 8 | 17, packet.payload.client_version)
+        self.assertIs(packet.payload, packet._payload)
+
+        with self.assertRaises(AttributeError):
+            packet.extra = None
@@ -3,6 +3,7 @@ import abc
 
 class BasePayload(object, metaclass=abc.ABCMeta):
     '''Base class for packet data.'''
+    __slots__ = ()
 
     @abc.abstractmethod
     def parse(self, data):
@@ -0,0 +1,101 @@
+'''Transport protocol.'''
+import asyncio
+import collections
+import logging
+
+from notaol.p3.decoder import FrameDecoder
+
+
+_logger = logging.getLogger(__name__)
+
+
+class P3Protocol(asyncio.BufferedProtocol):
+    '''Receives packets straight into the decoder buffer.
+
+    The event loop reads socket data into the free space of a
+    :class:`FrameDecoder` buffer. Packets are decoded in place and given to
+    `packet_callback` as soon as they complete. No coroutine runs per
+    packet.
+
+    The protocol also provides ``writelines()`` and ``drain()`` so it can
+    be used as the writer of a :class:`WriteBatcher`.
+
+    Args:
+        packet_callback: Called with each received :class:`Packet`.
+        connection_lost_callback: Called with the exception, or None, when
+            the connection closes.
+        decoder (FrameDecoder): Decoder to use instead of a new one.
+
+    Attributes:
+        transport: The transport once connected.
+    '''
+    def __init__(self, packet_callback, connection_lost_callback=None,
+                 decoder=None):
+        self._packet_callback = packet_callback
+        self._connection_lost_callback = connection_lost_callback
+        self._decoder = decoder or FrameDecoder(buffer_size=65536)
+        self._paused = False
+        self._drain_waiters = collections.deque()
+        self._connection_lost = False
+        self._exception = None
+        self.transport = None
+
+    def connection_made(self, transport):
+        _logger.debug('Connection made.')
+        self.transport = transport
+
+    def get_buffer(self, size_hint):
+        return self._decoder.get_buffer(size_hint)
+
+    def buffer_updated(self, size):
+        for packet in self._decoder.buffer_updated(size):
+            self._packet_callback(packet)
+
+    def eof_received(self):
+        _logger.debug('EOF received.')
+        return False
+
+    def connection_lost(self, exc):
+        _logger.debug('Connection lost.')
+        self._connection_lost = True
+        self._exception = exc or ConnectionResetError('Connection lost')
+        self._wake_drain_waiters()
+
+        if self._connection_lost_callback:
+            self._connection_lost_callback(exc)
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        self._wake_drain_waiters()
+
+    def _wake_drain_waiters(self):
+        while self._drain_waiters:
+            waiter = self._drain_waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def writelines(self, data):
+        '''Send a list of frames.'''
+        self.transport.writelines(data)
+
+    async def drain(self):
+        '''Wait until the transport buffer is below its low watermark.
+
+        Coroutine.
+        '''
+        if self._connection_lost:
+            raise self._exception
+
+        if not self._paused:
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
+
+        if self._connection_lost:
+            raise self._exception
@@ -0,0 +1,126 @@
+'''Delivery of incoming packets.'''
+import asyncio
+import collections
+import enum
+import logging
+
+
+_logger = logging.getLogger(__name__)
+
+
+class Overflow(enum.Enum):
+    '''What a full :class:`PacketQueue` does with another item.'''
+
+    block = 'block'
+    '''Wait until the consumer takes an item. Stalls the reader.'''
+
+    drop_oldest = 'drop_oldest'
+    '''Discard the oldest queued item.'''
+
+    spill = 'spill'
+    '''Keep the item in an unbounded overflow list.'''
+
+
+class QueueClosed(Exception):
+    '''The queue was closed and no more items will arrive.'''
+
+
+class PacketQueue(object):
+    '''Bounded first-in first-out queue between the reader and a consumer.
+
+    Supports ``async for`` which ends once the queue is closed and empty.
+
+    Attributes:
+        maxsize (int): Number of items before `overflow` applies.
+        overflow (Overflow): Behaviour when full.
+        dropped (int): Items discarded by :attr:`Overflow.drop_oldest`.
+        spilled (int): Items that went to the overflow list.
+    '''
+    def __init__(self, maxsize=256, overflow=Overflow.drop_oldest):
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive.')
+
+        self.maxsize = maxsize
+        self.overflow = Overflow(overflow)
+        self.dropped = 0
+        self.spilled = 0
+        self._items = collections.deque()
+        self._spill = collections.deque()
+        self._closed = False
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def __len__(self):
+        return len(self._items) + len(self._spill)
+
+    def closed(self):
+        '''Return whether the queue was closed.'''
+        return self._closed
+
+    def close(self):
+        '''Stop accepting items and wake any waiting consumer.'''
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    async def put(self, item):
+        '''Add an item.
+
+        Coroutine. Only waits when the overflow is :attr:`Overflow.block`.
+        '''
+        if self._closed:
+            raise QueueClosed()
+
+        if len(self._items) >= self.maxsize:
+            if self.overflow == Overflow.block:
+                while len(self._items) >= self.maxsize and not self._closed:
+                    self._not_full.clear()
+                    await self._not_full.wait()
+
+                if self._closed:
+                    raise QueueClosed()
+            elif self.overflow == Overflow.drop_oldest:
+                self._items.popleft()
+                self.dropped += 1
+                _logger.debug('Queue full, dropped oldest item.')
+            else:
+                self._spill.append(item)
+                self.spilled += 1
+                return
+
+        self._items.append(item)
+        self._not_empty.set()
+
+    async def get(self):
+        '''Remove and return the oldest item.
+
+        Coroutine. Raises :class:`QueueClosed` when the queue is closed and
+        empty.
+        '''
+        while not self._items:
+            if self._closed:
+                raise QueueClosed()
+
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        item = self._items.popleft()
+
+        if self._spill:
+            self._items.append(self._spill.popleft())
+        elif not self._items:
+            self._not_empty.clear()
+
+        self._not_full.set()
+
+        return item
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except QueueClosed:
+            raise StopAsyncIteration()
@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+
+from notaol.p3.queue import PacketQueue, Overflow, QueueClosed
+
+
+class TestPacketQueue(unittest.TestCase):
+    def test_drop_oldest(self):
+        async def run():
+            queue = PacketQueue(2, Overflow.drop_oldest)
+
+            for item in range(4):
+                await queue.put(item)
+
+            self.assertEqual(2, queue.dropped)
+            self.assertEqual(2, await queue.get())
+            self.assertEqual(3, await queue.get())
+
+        asyncio.run(run())
+
+    def test_spill(self):
+        async def run():
+            queue = PacketQueue(2, Overflow.spill)
+
+            for item in range(5):
+                await queue.put(item)
+
+            self.assertEqual(3, queue.spilled)
+            self.assertEqual(5, len(queue))
+            queue.close()
+
+            self.assertEqual([0, 1, 2, 3, 4], [item async for item in queue])
+
+        asyncio.run(run())
+
+    def test_block(self):
+        async def run():
+            queue = PacketQueue(1, Overflow.block)
+            await queue.put(0)
+
+            task = asyncio.ensure_future(queue.put(1))
+            await asyncio.sleep(0)
+            self.assertFalse(task.done())
+
+            self.assertEqual(0, await queue.get())
+            await asyncio.wait_for(task, 1)
+            self.assertEqual(1, await queue.get())
+
+        asyncio.run(run())
+
+    def test_close(self):
+        async def run():
+            queue = PacketQueue()
+            task = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+
+            queue.close()
+
+            with self.assertRaises(QueueClosed):
+                await asyncio.wait_for(task, 1)
+
+            with self.assertRaises(QueueClosed):
+                await queue.put(0)
+
+        asyncio.run(run())
@@ -0,0 +1,164 @@
+'''Dispatch of data packets by token.'''
+import array
+import asyncio
+import collections
+import functools
+import logging
+
+from notaol.fdo.token import TOKEN_ID_COUNT, TOKEN_ID_STRUCT, token_id
+from notaol.p3.packet import PacketType
+
+
+_logger = logging.getLogger(__name__)
+
+ROUTE_DROP = 0x01
+'''Routing flag that discards packets of a token before delivery.'''
+ROUTE_LOG = 0x02
+'''Routing flag that logs each packet of a token when dispatched.'''
+
+
+def packet_token_id(packet):
+    '''Return the integer token ID of a data packet without parsing it.'''
+    return TOKEN_ID_STRUCT.unpack_from(packet.data)[0]
+
+
+def _token_index(token):
+    if isinstance(token, int):
+        if not 0 <= token < TOKEN_ID_COUNT:
+            raise ValueError('Token ID out of range.')
+
+        return token
+
+    if len(token) != 2:
+        raise ValueError('Token must be 2 bytes.')
+
+    return token_id(token)
+
+
+class TokenRouter(object):
+    '''Routes data packets to handlers registered for their token.
+
+    A subscription key may be a 2 byte token or its integer ID, a 1 byte
+    prefix that matches every token starting with it, or ``None`` for
+    every token. Handlers are kept in slots indexed by token ID and by its
+    first byte, so dispatching does not build or hash token bytes.
+
+    Handlers are called with the packet and should not block. One-shot
+    waiters created by :meth:`expect` are resolved before handlers run.
+
+    Attributes:
+        counts (array): Number of data packets dispatched per token ID.
+        flags (array): Routing flags such as :data:`ROUTE_DROP` per token
+            ID. Use :meth:`set_flags` to change them.
+    '''
+    def __init__(self):
+        self._handlers = [None] * TOKEN_ID_COUNT
+        self._prefix_handlers = [None] * 256
+        self._wildcard_handlers = []
+        self._waiters = collections.defaultdict(list)
+        self.counts = array.array('Q', [0]) * TOKEN_ID_COUNT
+        self.flags = array.array('B', [0]) * TOKEN_ID_COUNT
+
+    def _handler_list(self, token):
+        if token is None:
+            return self._wildcard_handlers
+
+        if isinstance(token, int) or len(token) == 2:
+            slots = self._handlers
+            index = _token_index(token)
+        elif len(token) == 1:
+            if isinstance(token, str):
+                token = token.encode('latin-1')
+
+            slots = self._prefix_handlers
+            index = token[0]
+        else:
+            raise ValueError('Token must be 1 or 2 bytes.')
+
+        if slots[index] is None:
+            slots[index] = []
+
+        return slots[index]
+
+    def subscribe(self, token, handler):
+        '''Call `handler` for each packet matching `token`.'''
+        self._handler_list(token).append(handler)
+
+    def unsubscribe(self, token, handler):
+        '''Remove a handler added by :meth:`subscribe`.'''
+        self._handler_list(token).remove(handler)
+
+    def set_flags(self, token, flags):
+        '''Set the routing flags of a token.
+
+        `token` is 2 bytes or an integer token ID. `flags` is a combination
+        of :data:`ROUTE_DROP` and :data:`ROUTE_LOG`, or 0 to clear them.
+        '''
+        self.flags[_token_index(token)] = flags
+
+    def expect(self, token):
+        '''Return a future resolved with the next packet with `token`.
+
+        `token` is 2 bytes or an integer token ID.
+        '''
+        token = _token_index(token)
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(functools.partial(self._discard, token))
+        self._waiters[token].append(future)
+
+        return future
+
+    def _discard(self, token, future):
+        waiters = self._waiters.get(token)
+
+        if waiters and future in waiters:
+            waiters.remove(future)
+
+            if not waiters:
+                del self._waiters[token]
+
+    def dispatch(self, packet):
+        '''Deliver a data packet.
+
+        Returns:
+            bool: Whether a handler or waiter took the packet.
+        '''
+        if packet.type != PacketType.data or len(packet.data) < 2:
+            return False
+
+        token = packet_token_id(packet)
+        consumed = False
+        self.counts[token] += 1
+        flags = self.flags[token]
+
+        if flags:
+            if flags & ROUTE_LOG:
+                _logger.debug('Dispatch token 0x%04x', token)
+
+            if flags & ROUTE_DROP:
+                return True
+
+        if self._waiters:
+            waiters = self._waiters.pop(token, None)
+
+            if waiters:
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(packet)
+                        consumed = True
+
+        for handlers in (self._handlers[token],
+                         self._prefix_handlers[token >> 8],
+                         self._wildcard_handlers):
+            if not handlers:
+                continue
+
+            for handler in tuple(handlers):
+                try:
+                    handler(packet)
+                except Exception:
+                    _logger.exception('Token handler error.')
+
+                consumed = True
+
+        return consumed
@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+
+from notaol.p3.control import AckPayload
+from notaol.p3.data import DataPayload
+from notaol.p3.packet import Packet
+from notaol.p3.router import ROUTE_DROP, TokenRouter
+
+
+def new_data_packet(token):
+    payload = DataPayload()
+    payload.token = token
+    payload.data = b''
+    return Packet(payload=payload)
+
+
+class TestTokenRouter(unittest.TestCase):
+    def test_subscribe(self):
+        router = TokenRouter()
+        exact = []
+        prefix = []
+        wildcard = []
+
+        router.subscribe(b'AB', exact.append)
+        router.subscribe(b'A', prefix.append)
+        router.subscribe(None, wildcard.append)
+
+        self.assertTrue(router.dispatch(new_data_packet(b'AB')))
+        self.assertTrue(router.dispatch(new_data_packet(b'AC')))
+        self.assertTrue(router.dispatch(new_data_packet(b'SD')))
+        self.assertFalse(router.dispatch(Packet(payload=AckPayload())))
+
+        self.assertEqual(1, len(exact))
+        self.assertEqual(2, len(prefix))
+        self.assertEqual(3, len(wildcard))
+
+        router.unsubscribe(None, wildcard.append)
+        self.assertFalse(router.dispatch(new_data_packet(b'SD')))
+
+        with self.assertRaises(ValueError):
+            router.subscribe(b'ABC', exact.append)
+
+        with self.assertRaises(ValueError):
+            router.subscribe(-1, exact.append)
+
+        with self.assertRaises(ValueError):
+            router.set_flags(70000, 0)
+
+        router.subscribe('S', prefix.append)
+        self.assertTrue(router.dispatch(new_data_packet(b'SD')))
+        self.assertEqual(3, len(prefix))
+
+    def test_token_id(self):
+        router = TokenRouter()
+        exact = []
+
+        router.subscribe(0x4142, exact.append)
+
+        self.assertTrue(router.dispatch(new_data_packet(b'AB')))
+        self.assertFalse(router.dispatch(new_data_packet(b'AC')))
+        self.assertEqual(1, len(exact))
+        self.assertEqual(1, router.counts[0x4142])
+        self.assertEqual(1, router.counts[0x4143])
+
+    def test_flags(self):
+        router = TokenRouter()
+        exact = []
+
+        router.subscribe(b'AB', exact.append)
+        router.set_flags(b'AB', ROUTE_DROP)
+
+        self.assertTrue(router.dispatch(new_data_packet(b'AB')))
+        self.assertEqual(0, len(exact))
+        self.assertEqual(1, router.counts[0x4142])
+
+        router.set_flags(0x4142, 0)
+
+        self.assertTrue(router.dispatch(new_data_packet(b'AB')))
+        self.assertEqual(1, len(exact))
+
+    def test_expect(self):
+        async def run():
+            router = TokenRouter()
+            future = router.expect(b'SD')
+
+            self.assertFalse(router.dispatch(new_data_packet(b'AB')))
+            self.assertFalse(future.done())
+
+            packet = new_data_packet(b'SD')
+            self.assertTrue(router.dispatch(packet))
+            self.assertIs(packet, await future)
+
+            self.assertFalse(router.dispatch(new_data_packet(b'SD')))
+
+        asyncio.run(run())
+
+    def test_expect_timeout(self):
+        async def run():
+            router = TokenRouter()
+
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(router.expect(b'SD'), 0.01)
+
+            await asyncio.sleep(0)
+            self.assertFalse(router.dispatch(new_data_packet(b'SD')))
+            self.assertFalse(router._waiters)
+
+        asyncio.run(run())
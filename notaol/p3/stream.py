@@ -1,75 +1,243 @@
 import asyncio
+import collections
 import logging
 
-from notaol.p3.packet import Packet, HEADER_LENGTH, HEADER_SIZE_OFFSET
+from notaol.p3.protocol import P3Protocol
 
 
 _logger = logging.getLogger(__name__)
 
 
+class WriteBatcher(object):
+    '''Gathers outgoing frames and writes them together.
+
+    Frames written in the same event loop iteration, or within `delay`
+    seconds of the first one, are given to the writer in one
+    ``writelines()`` call followed by one ``drain()``. Every caller of
+    :meth:`write` waits for the drain of its batch.
+
+    A batch is written right away once it holds `high_water` bytes. The
+    watermarks are also applied to the transport buffer so ``drain()``
+    blocks above `high_water` until it falls below `low_water`.
+
+    Attributes:
+        batches (int): Number of batches written.
+        frames (int): Number of frames written.
+    '''
+    def __init__(self, writer, delay=0, high_water=65536, low_water=16384):
+        self._writer = writer
+        self._delay = delay
+        self._high_water = high_water
+        self._frames = []
+        self._size = 0
+        self._handle = None
+        self._future = None
+        self._drain_tasks = set()
+        self.batches = 0
+        self.frames = 0
+
+        writer.transport.set_write_buffer_limits(
+            high=high_water, low=low_water)
+
+    async def write(self, data):
+        '''Queue a frame and wait until its batch is drained.
+
+        Coroutine.
+        '''
+        if not self._future:
+            loop = asyncio.get_running_loop()
+            self._future = loop.create_future()
+            self._future.add_done_callback(_batch_done)
+
+            if self._delay:
+                self._handle = loop.call_later(self._delay, self.flush)
+            else:
+                self._handle = loop.call_soon(self.flush)
+
+        self._frames.append(data)
+        self._size += len(data)
+        future = self._future
+
+        if self._size >= self._high_water:
+            self.flush()
+
+        await asyncio.shield(future)
+
+    def flush(self):
+        '''Write the queued frames now.'''
+        if not self._future:
+            return
+
+        frames = self._frames
+        future = self._future
+        self._frames = []
+        self._size = 0
+        self._future = None
+
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+        self.batches += 1
+        self.frames += len(frames)
+
+        try:
+            self._writer.writelines(frames)
+        except Exception as error:
+            future.set_exception(error)
+        else:
+            task = asyncio.ensure_future(self._drain(future))
+            self._drain_tasks.add(task)
+            task.add_done_callback(self._drain_tasks.discard)
+
+    def close(self):
+        '''Write the queued frames and stop waiting for drains.
+
+        Writers waiting for a drain get :class:`ConnectionResetError`.
+        '''
+        self.flush()
+
+        for task in tuple(self._drain_tasks):
+            task.cancel()
+
+    async def _drain(self, future):
+        try:
+            await self._writer.drain()
+        except asyncio.CancelledError:
+            future.set_exception(ConnectionResetError('Connection closed'))
+            raise
+        except Exception as error:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
+
+
+def _batch_done(future):
+    # Retrieve the error so it is not reported as never retrieved when
+    # no writer waits for the batch any more.
+    if not future.cancelled() and future.exception():
+        _logger.debug('Write batch failed: %s', future.exception())
+
+
 class Stream(object):
-    '''Connection handler.'''
-    def __init__(self, host='AmericaOnline.aol.com', port='5190'):
+    '''Connection handler.
+
+    A thin adapter over :class:`P3Protocol`. Received packets are queued
+    for :meth:`read_packet` and :meth:`read_packets`, or given to
+    `packet_callback` if one is set. Reading from the socket is paused
+    while more than `max_pending` packets wait to be read.
+    '''
+    def __init__(self, host='AmericaOnline.aol.com', port='5190',
+                 write_delay=0, packet_callback=None, max_pending=1024):
         self._host = host
         self._port = port
+        self._write_delay = write_delay
+        self._packet_callback = packet_callback
+        self._max_pending = max_pending
 
-        self._reader = None
-        self._writer = None
+        self._protocol = None
+        self._batcher = None
+        self._packets = collections.deque()
+        self._packet_event = asyncio.Event()
+        self._reading_paused = False
+        self._eof = False
 
     def closed(self):
         '''Return whether the connection is closed.'''
-        return not self._reader or self._reader.is_eof()
+        return not self._protocol or self._eof
 
     def close(self):
         '''Close the connection.'''
-        if self._reader:
+        if self._protocol:
             _logger.debug('Close connection.')
-            self._reader = None
-            self._writer.close()
-            self._writer = None
+            self._batcher.close()
+            self._protocol.transport.close()
+            self._protocol = None
+            self._batcher = None
 
-    @asyncio.coroutine
-    def connect(self):
+    async def connect(self):
         '''Connect to the service.
 
         Coroutine.
         '''
         _logger.debug('Connect.')
-        self._reader, self._writer = yield from asyncio.open_connection(
+        self._eof = False
+        loop = asyncio.get_running_loop()
+        dummy, self._protocol = await loop.create_connection(
+            lambda: P3Protocol(
+                self._packet_callback or self._packet_received,
+                self._connection_lost),
             self._host, self._port)
+        self._batcher = WriteBatcher(self._protocol, self._write_delay)
         _logger.debug('Connected.')
 
-    @asyncio.coroutine
-    def write_packet(self, packet):
+    def _packet_received(self, packet):
+        self._packets.append(packet)
+        self._packet_event.set()
+
+        if len(self._packets) > self._max_pending and \
+                not self._reading_paused:
+            _logger.debug('Pause reading.')
+            self._reading_paused = True
+            self._protocol.transport.pause_reading()
+
+    def _connection_lost(self, exc):
+        self._eof = True
+        self._packet_event.set()
+
+    async def write_packet(self, packet):
         '''Send a packet.
 
+        Packets written close together are sent as one batch.
+
         Coroutine.
         '''
         _logger.debug('Write packet %s', packet)
-        self._writer.write(packet.to_bytes())
 
-        yield from self._writer.drain()
+        await self._batcher.write(packet.encode())
+
+    async def read_packets(self):
+        '''Receive every packet that has arrived.
+
+        Waits until there is at least one packet.
 
-    @asyncio.coroutine
-    def read_packet(self):
-        '''Receive a packet.'''
-        _logger.debug('Begin read packet.')
+        Coroutine.
+        '''
+        while not self._packets:
+            if self._eof:
+                raise asyncio.IncompleteReadError(b'', None)
+
+            self._packet_event.clear()
+            await self._packet_event.wait()
 
-        packet = Packet()
-        header = yield from self._reader.readexactly(HEADER_LENGTH)
+        packets = list(self._packets)
+        self._packets.clear()
+        self._resume_reading()
 
-        packet.parse_header(header)
-        _logger.debug('Got header %s', packet)
+        return packets
 
-        # header is 8 bytes + data + stop byte
-        bytes_to_read = packet.length - HEADER_SIZE_OFFSET + 1
+    async def read_packet(self):
+        '''Receive a packet.
 
-        _logger.debug('Need to read %d bytes', bytes_to_read)
+        Coroutine.
+        '''
+        while not self._packets:
+            if self._eof:
+                raise asyncio.IncompleteReadError(b'', None)
 
-        data = yield from self._reader.readexactly(bytes_to_read)
+            self._packet_event.clear()
+            await self._packet_event.wait()
 
-        packet.parse_body(data)
+        packet = self._packets.popleft()
+        self._resume_reading()
 
         _logger.debug('Got packet %s', packet)
 
         return packet
+
+    def _resume_reading(self):
+        if self._reading_paused and self._protocol and \
+                len(self._packets) <= self._max_pending // 2:
+            _logger.debug('Resume reading.')
+            self._reading_paused = False
+            self._protocol.transport.resume_reading()
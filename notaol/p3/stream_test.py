@@ -0,0 +1,143 @@
+import asyncio
+import codecs
+import unittest
+
+from notaol.p3.control import AckPayload
+from notaol.p3.packet import Packet, PacketType
+from notaol.p3.stream import Stream, WriteBatcher
+
+
+SAMPLE_INIT_PACKET = codecs.decode(b'5ab35f00377f7fa3039d116180000000050f00001fb4b53ec00014d1032000000000040a0000014b070504ffff0000000000fffec8f718000001b2070d', 'hex')
+
+
+class MockTransport(object):
+    def __init__(self):
+        self.limits = None
+
+    def set_write_buffer_limits(self, high=None, low=None):
+        self.limits = (high, low)
+
+
+class MockWriter(object):
+    def __init__(self):
+        self.transport = MockTransport()
+        self.calls = []
+        self.drains = 0
+
+    def writelines(self, data):
+        self.calls.append(list(data))
+
+    async def drain(self):
+        self.drains += 1
+
+
+class TestWriteBatcher(unittest.TestCase):
+    def test_batch(self):
+        async def run():
+            writer = MockWriter()
+            batcher = WriteBatcher(writer, high_water=100, low_water=10)
+
+            self.assertEqual((100, 10), writer.transport.limits)
+
+            await asyncio.gather(
+                batcher.write(b'a'), batcher.write(b'b'), batcher.write(b'c'))
+
+            self.assertEqual([[b'a', b'b', b'c']], writer.calls)
+            self.assertEqual(1, writer.drains)
+
+            await batcher.write(b'd')
+
+            self.assertEqual([b'd'], writer.calls[1])
+            self.assertEqual(2, batcher.batches)
+            self.assertEqual(4, batcher.frames)
+
+        asyncio.run(run())
+
+    def test_high_water(self):
+        async def run():
+            writer = MockWriter()
+            batcher = WriteBatcher(writer, high_water=4, low_water=1)
+
+            await asyncio.gather(*[batcher.write(b'xx') for dummy in range(5)])
+
+            self.assertEqual([[b'xx', b'xx'], [b'xx', b'xx'], [b'xx']],
+                             writer.calls)
+
+        asyncio.run(run())
+
+    def test_delay(self):
+        async def run():
+            writer = MockWriter()
+            batcher = WriteBatcher(writer, delay=0.01)
+
+            async def write_later():
+                await asyncio.sleep(0.001)
+                await batcher.write(b'b')
+
+            await asyncio.gather(batcher.write(b'a'), write_later())
+
+            self.assertEqual([[b'a', b'b']], writer.calls)
+
+        asyncio.run(run())
+
+    def test_close(self):
+        async def run():
+            writer = MockWriter()
+            drained = asyncio.Event()
+
+            async def drain():
+                drained.set()
+                await asyncio.sleep(10)
+
+            writer.drain = drain
+            batcher = WriteBatcher(writer)
+            task = asyncio.ensure_future(batcher.write(b'a'))
+
+            await drained.wait()
+            batcher.close()
+
+            with self.assertRaises(ConnectionResetError):
+                await task
+
+        asyncio.run(run())
+
+
+class TestStream(unittest.TestCase):
+    def test_read_write(self):
+        async def run():
+            received = asyncio.get_running_loop().create_future()
+
+            async def handle(reader, writer):
+                writer.write(SAMPLE_INIT_PACKET * 3)
+                received.set_result(await reader.readexactly(9))
+                writer.close()
+
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+
+            stream = Stream('127.0.0.1', port)
+            await stream.connect()
+
+            packet = await stream.read_packet()
+            self.assertEqual(PacketType.init, packet.type)
+
+            packets = await stream.read_packets()
+
+            if len(packets) == 1:
+                packets.extend(await stream.read_packets())
+
+            self.assertEqual(2, len(packets))
+
+            await stream.write_packet(Packet(payload=AckPayload()))
+            data = await asyncio.wait_for(received, 1)
+            self.assertEqual(PacketType.ack | 0x80, data[7])
+
+            with self.assertRaises(asyncio.IncompleteReadError):
+                await asyncio.wait_for(stream.read_packet(), 1)
+
+            self.assertTrue(stream.closed())
+            stream.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(run())
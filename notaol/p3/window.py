@@ -0,0 +1,114 @@
+'''Flow control for data packets.'''
+import asyncio
+
+
+SEQUENCE_MIN = 0x10
+SEQUENCE_MAX = 0x7f
+SEQUENCE_SPAN = SEQUENCE_MAX - SEQUENCE_MIN + 1
+
+
+def next_sequence(sequence):
+    '''Return the sequence number following `sequence`.'''
+    if sequence >= SEQUENCE_MAX:
+        return SEQUENCE_MIN
+    else:
+        return sequence + 1
+
+
+def sequence_distance(start, end):
+    '''Return how many steps `end` is after `start`.'''
+    return (end - start) % SEQUENCE_SPAN
+
+
+class TransmitWindow(object):
+    '''Data packets sent but not yet acknowledged.
+
+    Packets are kept in a ring with one slot per sequence number until the
+    receive sequence number of an incoming packet covers them. At most
+    `size` packets may be outstanding; :meth:`wait_for_space` blocks
+    senders until an acknowledgement frees a slot.
+
+    Attributes:
+        size (int): Maximum number of unacknowledged packets.
+    '''
+    def __init__(self, size=16):
+        if not 0 < size < SEQUENCE_SPAN:
+            raise ValueError('Window size out of range.')
+
+        self.size = size
+        self._ring = [None] * SEQUENCE_SPAN
+        self._oldest = None
+        self._count = 0
+        self._space_event = asyncio.Event()
+        self._space_event.set()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        '''Iterate the unacknowledged packets in the order they were sent.'''
+        if not self._count:
+            return
+
+        index = self._oldest - SEQUENCE_MIN
+
+        for dummy in range(self._count):
+            yield self._ring[index]
+            index = (index + 1) % SEQUENCE_SPAN
+
+    def full(self):
+        '''Return whether no more packets may be sent.'''
+        return self._count >= self.size
+
+    async def wait_for_space(self):
+        '''Wait until another packet may be sent.
+
+        Coroutine.
+        '''
+        while self.full():
+            await self._space_event.wait()
+
+    def push(self, packet):
+        '''Keep a sent packet until it is acknowledged.'''
+        if self.full():
+            raise ValueError('Window is full.')
+
+        if not self._count:
+            self._oldest = packet.tx_seq
+        elif sequence_distance(self._oldest, packet.tx_seq) != self._count:
+            raise ValueError('Sequence number 0x{:x} out of order.'
+                             .format(packet.tx_seq))
+
+        self._ring[packet.tx_seq - SEQUENCE_MIN] = packet
+        self._count += 1
+
+        if self.full():
+            self._space_event.clear()
+
+    def acknowledge(self, sequence):
+        '''Release packets up to and including `sequence`.
+
+        Returns:
+            int: The number of packets released.
+        '''
+        if not self._count or \
+                not SEQUENCE_MIN <= sequence <= SEQUENCE_MAX:
+            return 0
+
+        distance = sequence_distance(self._oldest, sequence)
+
+        if distance >= self._count:
+            # Already acknowledged or not sent yet.
+            return 0
+
+        index = self._oldest - SEQUENCE_MIN
+
+        for dummy in range(distance + 1):
+            self._ring[index] = None
+            index = (index + 1) % SEQUENCE_SPAN
+
+        self._count -= distance + 1
+        self._oldest = next_sequence(sequence)
+        self._space_event.set()
+
+        return distance + 1
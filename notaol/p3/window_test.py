@@ -0,0 +1,66 @@
+import asyncio
+import unittest
+
+from notaol.p3.packet import Packet
+from notaol.p3.window import TransmitWindow, next_sequence, \
+    sequence_distance
+
+
+def new_packet(sequence):
+    packet = Packet()
+    packet.tx_seq = sequence
+    return packet
+
+
+class TestTransmitWindow(unittest.TestCase):
+    def test_sequence(self):
+        self.assertEqual(0x11, next_sequence(0x10))
+        self.assertEqual(0x10, next_sequence(0x7f))
+        self.assertEqual(1, sequence_distance(0x7f, 0x10))
+        self.assertEqual(0, sequence_distance(0x20, 0x20))
+
+    def test_acknowledge(self):
+        window = TransmitWindow(4)
+
+        for sequence in (0x7e, 0x7f, 0x10):
+            window.push(new_packet(sequence))
+
+        self.assertEqual(3, len(window))
+        self.assertFalse(window.full())
+
+        window.push(new_packet(0x11))
+        self.assertTrue(window.full())
+
+        with self.assertRaises(ValueError):
+            window.push(new_packet(0x12))
+
+        self.assertEqual(0, window.acknowledge(0x7d))
+        self.assertEqual(0, window.acknowledge(0x12))
+        self.assertEqual(2, window.acknowledge(0x7f))
+        self.assertEqual([0x10, 0x11],
+                         [packet.tx_seq for packet in window])
+        self.assertEqual(0, window.acknowledge(0x7f))
+        self.assertEqual(2, window.acknowledge(0x11))
+        self.assertEqual(0, len(window))
+        self.assertEqual([], list(window))
+
+    def test_out_of_order(self):
+        window = TransmitWindow()
+        window.push(new_packet(0x20))
+
+        with self.assertRaises(ValueError):
+            window.push(new_packet(0x22))
+
+    def test_wait_for_space(self):
+        async def run():
+            window = TransmitWindow(1)
+            window.push(new_packet(0x10))
+
+            task = asyncio.ensure_future(window.wait_for_space())
+            await asyncio.sleep(0)
+            self.assertFalse(task.done())
+
+            window.acknowledge(0x10)
+            await asyncio.wait_for(task, 1)
+
+        asyncio.run(run())
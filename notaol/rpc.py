@@ -9,79 +9,222 @@ _logger = logging.getLogger(__name__)
 
 
 class RPCServer(object):
-    def __init__(self, reader, writer):
+    '''JSON line RPC session controlling a client.
+
+    Each request is a JSON object on one line with a ``command`` and an
+    optional ``id``. Commands run concurrently. At most `max_in_flight` of
+    them run at a time and up to `max_queued` more wait for a slot. Further
+    commands get a ``busy`` error. A reply is sent when each command
+    finishes, so replies may arrive out of order. Each reply carries the
+    ``id`` of its request.
+
+    Replies have a ``status`` of ``ok``, ``error`` with a ``reason``, or
+    ``cancelled``. The ``cancel`` command stops the in-flight request whose
+    ``id`` is given as ``target``.
+
+    Args:
+        reader: The StreamReader of the connection.
+        writer: The StreamWriter of the connection.
+        max_in_flight (int): Number of commands that may run at once.
+        max_queued (int): Number of commands that may wait for a slot.
+
+    Attributes:
+        commands (dict): Command names mapped to coroutine functions called
+            with the request. A result other than None is sent as
+            ``result`` in the reply.
+    '''
+    def __init__(self, reader, writer, max_in_flight=16, max_queued=64):
         self._reader = reader
         self._writer = writer
         self._client = Client()
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._max_tasks = max_in_flight + max_queued
+        self._write_lock = asyncio.Lock()
+        self._tasks = {}
+        self._running_tasks = set()
+        self._closing = False
+        self.commands = {
+            'connect': self._connect,
+        }
 
-    @asyncio.coroutine
-    def run(self):
+    async def run(self):
         _logger.info('RPC session started on port %s',
                      self._writer.get_extra_info('sockname'))
 
-        command_map = {
-            'connect': self._connect
-        }
-
-        while True:
-            line = yield from self._reader.readline()
-
-            if not line.endswith(b'\n'):
-                self._close()
-                break
+        try:
+            while True:
+                line = await self._reader.readline()
 
-            try:
-                request = json.loads(line.decode('utf-8'))
-            except ValueError:
-                yield from self._reply(
-                    {'status': 'error', 'reason': 'syntax error'})
-                continue
+                if not line.endswith(b'\n'):
+                    break
 
-            if 'command' not in request:
-                yield from self._reply(
-                    {'status': 'error', 'reason': 'missing command'})
-                continue
-
-            command = command_map.get(request['command'])
-
-            if command:
-                yield from command(request)
-            else:
-                yield from self._reply(
-                    {'status': 'error', 'reason': 'unknown command'})
+                await self._handle_line(line)
+        finally:
+            await self._close()
 
         _logger.info('RPC session ended on port %s',
                      self._writer.get_extra_info('sockname'))
 
-    @asyncio.coroutine
-    def _reply(self, response):
-        self._writer.write(json.dumps(response).encode('utf-8'))
-        self._writer.write(b'\n')
-        yield from self._writer.drain()
-
-    @asyncio.coroutine
-    def _connect(self, request):
+    async def _handle_line(self, line):
+        try:
+            request = json.loads(line.decode('utf-8'))
+        except ValueError:
+            await self._reply({'status': 'error', 'reason': 'syntax error'})
+            return
+
+        if not isinstance(request, dict):
+            await self._reply({'status': 'error', 'reason': 'syntax error'})
+            return
+
+        request_id = request.get('id')
+
+        if not _is_key(request_id):
+            await self._reply({'status': 'error', 'reason': 'invalid id'})
+            return
+
+        if 'command' not in request:
+            await self._reply(
+                {'status': 'error', 'reason': 'missing command'}, request_id)
+            return
+
+        if not isinstance(request['command'], str):
+            await self._reply(
+                {'status': 'error', 'reason': 'syntax error'}, request_id)
+            return
+
+        if request['command'] == 'cancel':
+            await self._cancel(request)
+            return
+
+        command = self.commands.get(request['command'])
+
+        if not command:
+            await self._reply(
+                {'status': 'error', 'reason': 'unknown command'}, request_id)
+            return
+
+        if request_id is not None and request_id in self._tasks:
+            await self._reply(
+                {'status': 'error', 'reason': 'duplicate id'}, request_id)
+            return
+
+        # Lines are still read when all slots are taken so that cancel
+        # can reach the commands holding them.
+        if len(self._running_tasks) >= self._max_tasks:
+            await self._reply({'status': 'error', 'reason': 'busy'},
+                              request_id)
+            return
+
+        task = asyncio.ensure_future(self._run_command(command, request))
+        self._running_tasks.add(task)
+        task.add_done_callback(self._running_tasks.discard)
+
+        if request_id is not None:
+            self._tasks[request_id] = task
+
+        # Let the task enter _run_command so a cancel before it started
+        # still gets a reply.
+        await asyncio.sleep(0)
+
+    async def _run_command(self, command, request):
+        request_id = request.get('id')
+
+        try:
+            async with self._semaphore:
+                result = await command(request)
+        except asyncio.CancelledError:
+            response = {'status': 'cancelled'}
+        except KeyError as error:
+            response = {'status': 'error',
+                        'reason': 'missing argument {}'.format(error)}
+        except Exception:
+            _logger.exception('Command %s failed.', request['command'])
+            response = {'status': 'error', 'reason': 'command failed'}
+        else:
+            response = {'status': 'ok'}
+
+            if result is not None:
+                response['result'] = result
+        finally:
+            if request_id is not None:
+                self._tasks.pop(request_id, None)
+
+        try:
+            await self._reply(response, request_id)
+        except Exception:
+            _logger.exception('Reply to command %s failed.',
+                              request['command'])
+
+    async def _cancel(self, request):
+        request_id = request.get('id')
+        target = request.get('target')
+
+        if not _is_key(target):
+            await self._reply(
+                {'status': 'error', 'reason': 'invalid id'}, request_id)
+            return
+
+        task = self._tasks.get(target)
+
+        if task:
+            task.cancel()
+            await self._reply({'status': 'ok'}, request_id)
+        else:
+            await self._reply(
+                {'status': 'error', 'reason': 'unknown target'}, request_id)
+
+    async def _reply(self, response, request_id=None):
+        if self._closing:
+            return
+
+        if request_id is not None:
+            response['id'] = request_id
+
+        async with self._write_lock:
+            self._writer.write(json.dumps(response).encode('utf-8'))
+            self._writer.write(b'\n')
+            await self._writer.drain()
+
+    async def _connect(self, request):
         username = request['username']
         password = request['password']
 
-        yield from self._client.connect()
-        yield from self._client.login(username, password)
+        await self._client.connect()
+        await self._client.login(username, password)
+
+    async def _close(self):
+        self._closing = True
+        tasks = tuple(self._running_tasks)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-    def _close(self):
         self._writer.close()
         self._client.close()
 
 
-@asyncio.coroutine
-def session(reader, writer):
+def _is_key(value):
+    # bool is an int but 1 and true would be the same key.
+    return value is None or isinstance(value, (str, int)) and \
+        not isinstance(value, bool)
+
+
+async def session(reader, writer):
     server = RPCServer(reader, writer)
-    yield from server.run()
+    await server.run()
+
+
+async def serve(port=5000):
+    server = await asyncio.start_server(session, port=port)
+
+    async with server:
+        await server.serve_forever()
 
 
 def run_server():
-    event_loop = asyncio.get_event_loop()
-    handle = event_loop.run_until_complete(asyncio.start_server(session, port=5000))
-    event_loop.run_forever()
+    asyncio.run(serve())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import unittest
+
+from notaol.rpc import RPCServer
+
+
+class TestRPCServer(unittest.TestCase):
+    def run_session(self, lines, max_in_flight=16, max_queued=64,
+                    reply_count=None):
+        async def run():
+            replies = []
+            started = []
+
+            async def sleep_command(request):
+                started.append(request['id'])
+                await asyncio.sleep(request['seconds'])
+                return request['seconds']
+
+            async def handle(reader, writer):
+                server = RPCServer(reader, writer, max_in_flight, max_queued)
+                server.commands['sleep'] = sleep_command
+                await server.run()
+
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+            for line in lines:
+                writer.write(json.dumps(line).encode('utf-8') + b'\n')
+
+            for dummy in range(reply_count or len(lines)):
+                line = await asyncio.wait_for(reader.readline(), 2)
+                self.assertTrue(line)
+                replies.append(json.loads(line.decode('utf-8')))
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+            return replies, started
+
+        return asyncio.run(run())
+
+    def test_out_of_order(self):
+        replies, started = self.run_session([
+            {'id': 1, 'command': 'sleep', 'seconds': 0.2},
+            {'id': 2, 'command': 'sleep', 'seconds': 0.01},
+            {'id': 3, 'command': 'bogus'},
+            {'command': 'sleep'},
+        ])
+
+        self.assertEqual(
+            {'id': 3, 'status': 'error', 'reason': 'unknown command'},
+            replies[0])
+        self.assertEqual('error', replies[1]['status'])
+        self.assertNotIn('id', replies[1])
+        self.assertEqual({'id': 2, 'status': 'ok', 'result': 0.01},
+                         replies[2])
+        self.assertEqual({'id': 1, 'status': 'ok', 'result': 0.2},
+                         replies[3])
+
+    def test_in_flight_limit(self):
+        replies, started = self.run_session([
+            {'id': 1, 'command': 'sleep', 'seconds': 0.1},
+            {'id': 2, 'command': 'sleep', 'seconds': 0.01},
+            {'id': 3, 'command': 'sleep', 'seconds': 0.01},
+        ], max_in_flight=1)
+
+        self.assertEqual([1, 2, 3], [reply['id'] for reply in replies])
+        self.assertEqual([1, 2, 3], started)
+
+    def test_cancel(self):
+        replies, started = self.run_session([
+            {'id': 'a', 'command': 'sleep', 'seconds': 5},
+            {'id': 'b', 'command': 'cancel', 'target': 'a'},
+            {'id': 'c', 'command': 'cancel', 'target': 'x'},
+        ], reply_count=3)
+
+        replies = dict((reply['id'], reply) for reply in replies)
+
+        self.assertEqual(['a'], started)
+        self.assertEqual({'id': 'a', 'status': 'cancelled'}, replies['a'])
+        self.assertEqual({'id': 'b', 'status': 'ok'}, replies['b'])
+        self.assertEqual(
+            {'id': 'c', 'status': 'error', 'reason': 'unknown target'},
+            replies['c'])
+
+    def test_duplicate_id(self):
+        replies, started = self.run_session([
+            {'id': 1, 'command': 'sleep', 'seconds': 0.05},
+            {'id': 1, 'command': 'sleep', 'seconds': 0.01},
+        ])
+
+        self.assertEqual(
+            {'id': 1, 'status': 'error', 'reason': 'duplicate id'},
+            replies[0])
+        self.assertEqual({'id': 1, 'status': 'ok', 'result': 0.05},
+                         replies[1])
+
+    def test_cancel_when_busy(self):
+        replies, started = self.run_session([
+            {'id': 1, 'command': 'sleep', 'seconds': 5},
+            {'id': 2, 'command': 'sleep', 'seconds': 0.01},
+            {'id': 3, 'command': 'sleep', 'seconds': 0},
+            {'id': 4, 'command': 'cancel', 'target': 1},
+        ], max_in_flight=1, max_queued=1)
+
+        self.assertEqual({'id': 3, 'status': 'error', 'reason': 'busy'},
+                         replies[0])
+        self.assertEqual({'id': 4, 'status': 'ok'}, replies[1])
+        self.assertEqual({'id': 1, 'status': 'cancelled'}, replies[2])
+        self.assertEqual({'id': 2, 'status': 'ok', 'result': 0.01},
+                         replies[3])
+
+    def test_invalid_request(self):
+        replies, started = self.run_session([
+            {'id': [1], 'command': 'sleep', 'seconds': 0},
+            {'command': ['sleep']},
+            {'id': 1, 'command': 'cancel', 'target': {}},
+            {'id': 2, 'command': 'sleep', 'seconds': 0},
+        ])
+
+        self.assertEqual({'status': 'error', 'reason': 'invalid id'},
+                         replies[0])
+        self.assertEqual({'status': 'error', 'reason': 'syntax error'},
+                         replies[1])
+        self.assertEqual({'id': 1, 'status': 'error', 'reason': 'invalid id'},
+                         replies[2])
+        self.assertEqual({'id': 2, 'status': 'ok', 'result': 0}, replies[3])